@@ -0,0 +1,30 @@
+"""(updated_at, id) index on recipes and source_updated_at index for the MinHash watermark
+
+Revision ID: a2c6e8f4d1b7
+Revises: e4c7a1f9b3d6
+Create Date: 2026-10-18 23:12:40.516283
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a2c6e8f4d1b7'
+down_revision: Union[str, Sequence[str], None] = 'e4c7a1f9b3d6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('idx_recipes_updated_id', 'recipes', ['updated_at', 'id'])
+    op.create_index('idx_recipe_minhashes_source_updated_at', 'recipe_minhashes', ['source_updated_at'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_recipe_minhashes_source_updated_at', table_name='recipe_minhashes')
+    op.drop_index('idx_recipes_updated_id', table_name='recipes')
@@ -0,0 +1,34 @@
+"""add keyset pagination indexes
+
+Revision ID: a3c1f2d4e5b6
+Revises: 5689e43f5ed1
+Create Date: 2026-10-18 09:12:41.204518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c1f2d4e5b6'
+down_revision: Union[str, Sequence[str], None] = '5689e43f5ed1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('idx_recipes_created_id', 'recipes', ['created_at', 'id'])
+    op.create_index('idx_recipe_likes_user_created', 'recipe_likes', ['user_id', 'created_at', 'recipe_id'])
+    op.create_index('idx_saved_recipes_user_saved', 'user_saved_recipes', ['user_id', 'saved_at', 'recipe_id'])
+    op.create_index('idx_views_user_recipe_viewed', 'user_recipe_views', ['user_id', 'recipe_id', 'viewed_at'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_views_user_recipe_viewed', table_name='user_recipe_views')
+    op.drop_index('idx_saved_recipes_user_saved', table_name='user_saved_recipes')
+    op.drop_index('idx_recipe_likes_user_created', table_name='recipe_likes')
+    op.drop_index('idx_recipes_created_id', table_name='recipes')
@@ -0,0 +1,47 @@
+"""add recipe minhash signatures and lsh buckets
+
+Revision ID: a6e2c9f4b7d1
+Revises: f2b8d4a6c1e3
+Create Date: 2026-10-18 17:05:12.640358
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6e2c9f4b7d1'
+down_revision: Union[str, Sequence[str], None] = 'f2b8d4a6c1e3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('recipe_minhashes',
+        sa.Column('recipe_id', sa.BigInteger(), nullable=False),
+        sa.Column('signature', postgresql.ARRAY(sa.Integer()), nullable=False),
+        sa.Column('source_updated_at', sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column('created_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.Column('updated_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['recipe_id'], ['recipes.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('recipe_id')
+    )
+    op.create_table('recipe_lsh_buckets',
+        sa.Column('band', sa.SmallInteger(), nullable=False),
+        sa.Column('bucket', sa.BigInteger(), nullable=False),
+        sa.Column('recipe_id', sa.BigInteger(), nullable=False),
+        sa.ForeignKeyConstraint(['recipe_id'], ['recipes.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('band', 'bucket', 'recipe_id')
+    )
+    op.create_index('idx_recipe_lsh_buckets_recipe', 'recipe_lsh_buckets', ['recipe_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_recipe_lsh_buckets_recipe', table_name='recipe_lsh_buckets')
+    op.drop_table('recipe_lsh_buckets')
+    op.drop_table('recipe_minhashes')
@@ -0,0 +1,31 @@
+"""partial (updated_at, id) index on public recipes for the export
+
+Revision ID: b3d7f1e5a9c2
+Revises: a6e2c9f4b7d1
+Create Date: 2026-10-18 18:31:57.112804
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3d7f1e5a9c2'
+down_revision: Union[str, Sequence[str], None] = 'a6e2c9f4b7d1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'idx_recipes_public_updated_id', 'recipes', ['updated_at', 'id'],
+        postgresql_where=sa.text('is_public'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_recipes_public_updated_id', table_name='recipes')
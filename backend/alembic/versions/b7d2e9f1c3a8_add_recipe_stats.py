@@ -0,0 +1,54 @@
+"""add recipe_stats counters
+
+Revision ID: b7d2e9f1c3a8
+Revises: a3c1f2d4e5b6
+Create Date: 2026-10-18 10:05:17.638201
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d2e9f1c3a8'
+down_revision: Union[str, Sequence[str], None] = 'a3c1f2d4e5b6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('recipe_stats',
+        sa.Column('recipe_id', sa.BigInteger(), nullable=False),
+        sa.Column('likes_count', sa.BigInteger(), server_default='0', nullable=False),
+        sa.Column('views_count', sa.BigInteger(), server_default='0', nullable=False),
+        sa.Column('saves_count', sa.BigInteger(), server_default='0', nullable=False),
+        sa.Column('created_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.Column('updated_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['recipe_id'], ['recipes.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('recipe_id')
+    )
+    op.create_index('idx_recipe_stats_likes', 'recipe_stats', ['likes_count', 'recipe_id'])
+    op.create_index('idx_recipe_stats_views', 'recipe_stats', ['views_count', 'recipe_id'])
+
+    # Backfill from the event tables
+    op.execute("""
+        INSERT INTO recipe_stats (recipe_id, likes_count, views_count, saves_count)
+        SELECT r.id,
+               coalesce(l.c, 0),
+               coalesce(v.c, 0),
+               coalesce(s.c, 0)
+        FROM recipes r
+        LEFT JOIN (SELECT recipe_id, count(*) AS c FROM recipe_likes GROUP BY recipe_id) l ON l.recipe_id = r.id
+        LEFT JOIN (SELECT recipe_id, count(*) AS c FROM user_recipe_views GROUP BY recipe_id) v ON v.recipe_id = r.id
+        LEFT JOIN (SELECT recipe_id, count(*) AS c FROM user_saved_recipes GROUP BY recipe_id) s ON s.recipe_id = r.id
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_recipe_stats_views', table_name='recipe_stats')
+    op.drop_index('idx_recipe_stats_likes', table_name='recipe_stats')
+    op.drop_table('recipe_stats')
@@ -0,0 +1,46 @@
+"""add recipe_trending scores
+
+Revision ID: c4e8a1b2d3f5
+Revises: b7d2e9f1c3a8
+Create Date: 2026-10-18 11:42:03.215480
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e8a1b2d3f5'
+down_revision: Union[str, Sequence[str], None] = 'b7d2e9f1c3a8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('recipe_trending',
+        sa.Column('recipe_id', sa.BigInteger(), nullable=False),
+        sa.Column('score', sa.Float(), server_default='0', nullable=False),
+        sa.Column('scored_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('created_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.Column('updated_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['recipe_id'], ['recipes.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('recipe_id')
+    )
+    op.create_index('idx_recipe_trending_score', 'recipe_trending', ['score', 'recipe_id'])
+
+    # Event-time indexes for the incremental refresh window scans
+    op.create_index('idx_recipe_likes_created', 'recipe_likes', ['created_at'])
+    op.create_index('idx_views_viewed_at', 'user_recipe_views', ['viewed_at'])
+    op.create_index('idx_saved_recipes_saved_at', 'user_saved_recipes', ['saved_at'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_saved_recipes_saved_at', table_name='user_saved_recipes')
+    op.drop_index('idx_views_viewed_at', table_name='user_recipe_views')
+    op.drop_index('idx_recipe_likes_created', table_name='recipe_likes')
+    op.drop_index('idx_recipe_trending_score', table_name='recipe_trending')
+    op.drop_table('recipe_trending')
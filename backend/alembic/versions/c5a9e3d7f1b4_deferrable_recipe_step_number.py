@@ -0,0 +1,32 @@
+"""make uq_recipe_step deferrable for in-place step renumbering
+
+Revision ID: c5a9e3d7f1b4
+Revises: b3d7f1e5a9c2
+Create Date: 2026-10-18 20:12:40.518363
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5a9e3d7f1b4'
+down_revision: Union[str, Sequence[str], None] = 'b3d7f1e5a9c2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_constraint('uq_recipe_step', 'recipe_steps', type_='unique')
+    op.create_unique_constraint(
+        'uq_recipe_step', 'recipe_steps', ['recipe_id', 'step_number'], deferrable=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('uq_recipe_step', 'recipe_steps', type_='unique')
+    op.create_unique_constraint('uq_recipe_step', 'recipe_steps', ['recipe_id', 'step_number'])
@@ -0,0 +1,33 @@
+"""add recipe_trending.settled_score for the overlapping incremental refresh
+
+Revision ID: d8b2f6a4c9e7
+Revises: c5a9e3d7f1b4
+Create Date: 2026-10-18 21:05:17.603921
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8b2f6a4c9e7'
+down_revision: Union[str, Sequence[str], None] = 'c5a9e3d7f1b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'recipe_trending',
+        sa.Column('settled_score', sa.Float(), server_default='0', nullable=False),
+    )
+    # Existing scores were all treated as final; keep them until the next full rebuild
+    op.execute("UPDATE recipe_trending SET settled_score = score")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('recipe_trending', 'settled_score')
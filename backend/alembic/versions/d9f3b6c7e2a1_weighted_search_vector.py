@@ -0,0 +1,47 @@
+"""weighted search_vector, drop unused expression FTS index
+
+Revision ID: d9f3b6c7e2a1
+Revises: c4e8a1b2d3f5
+Create Date: 2026-10-18 13:20:44.907311
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9f3b6c7e2a1'
+down_revision: Union[str, Sequence[str], None] = 'c4e8a1b2d3f5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+WEIGHTED = (
+    "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(chefs_note, '')), 'C')"
+)
+UNWEIGHTED = "to_tsvector('english', coalesce(name, '') || ' ' || coalesce(description, '') || ' ' || coalesce(chefs_note, ''))"
+
+
+def _replace_search_vector(expression: str) -> None:
+    # Generated column expressions cannot be altered in place before PG 17
+    op.drop_index('idx_recipes_search_vector', table_name='recipes')
+    op.drop_column('recipes', 'search_vector')
+    op.add_column('recipes', sa.Column('search_vector', postgresql.TSVECTOR(), sa.Computed(expression, persisted=True), nullable=True))
+    op.create_index('idx_recipes_search_vector', 'recipes', ['search_vector'], postgresql_using='gin')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Search now goes through search_vector; the expression index was never matched
+    op.drop_index('idx_recipes_name_desc_fts', table_name='recipes')
+    _replace_search_vector(WEIGHTED)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _replace_search_vector(UNWEIGHTED)
+    op.create_index('idx_recipes_name_desc_fts', 'recipes', [sa.text(UNWEIGHTED)], postgresql_using='gin')
@@ -0,0 +1,34 @@
+"""composite (category_id, recipe_id) index on recipe_categories
+
+Revision ID: e1a7c5d9b4f2
+Revises: d9f3b6c7e2a1
+Create Date: 2026-10-18 15:02:37.481196
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1a7c5d9b4f2'
+down_revision: Union[str, Sequence[str], None] = 'd9f3b6c7e2a1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('idx_recipe_categories_category_recipe', 'recipe_categories', ['category_id', 'recipe_id'])
+    # Only databases built from the models have the single-column index; the
+    # composite one covers it either way
+    op.drop_index('idx_recipe_categories_category', table_name='recipe_categories', if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        'idx_recipe_categories_category', 'recipe_categories', ['category_id'], if_not_exists=True,
+    )
+    op.drop_index('idx_recipe_categories_category_recipe', table_name='recipe_categories')
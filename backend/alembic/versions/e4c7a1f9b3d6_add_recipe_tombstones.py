@@ -0,0 +1,34 @@
+"""add recipe_tombstones for incremental export deletes
+
+Revision ID: e4c7a1f9b3d6
+Revises: d8b2f6a4c9e7
+Create Date: 2026-10-18 21:34:52.281907
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4c7a1f9b3d6'
+down_revision: Union[str, Sequence[str], None] = 'd8b2f6a4c9e7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('recipe_tombstones',
+        sa.Column('recipe_id', sa.BigInteger(), nullable=False),
+        sa.Column('deleted_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('recipe_id')
+    )
+    op.create_index('idx_recipe_tombstones_deleted_at', 'recipe_tombstones', ['deleted_at'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_recipe_tombstones_deleted_at', table_name='recipe_tombstones')
+    op.drop_table('recipe_tombstones')
@@ -0,0 +1,40 @@
+"""add recipe_recommendations
+
+Revision ID: f2b8d4a6c1e3
+Revises: e1a7c5d9b4f2
+Create Date: 2026-10-18 16:20:44.903112
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2b8d4a6c1e3'
+down_revision: Union[str, Sequence[str], None] = 'e1a7c5d9b4f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('recipe_recommendations',
+        sa.Column('recipe_id', sa.BigInteger(), nullable=False),
+        sa.Column('rank', sa.SmallInteger(), nullable=False),
+        sa.Column('related_recipe_id', sa.BigInteger(), nullable=False),
+        sa.Column('score', sa.Float(), nullable=False),
+        sa.Column('created_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.Column('updated_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['recipe_id'], ['recipes.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['related_recipe_id'], ['recipes.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('recipe_id', 'rank')
+    )
+    op.create_index('idx_recipe_recommendations_related', 'recipe_recommendations', ['related_recipe_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_recipe_recommendations_related', table_name='recipe_recommendations')
+    op.drop_table('recipe_recommendations')
@@ -119,6 +119,11 @@ async def get_current_user(
     except (JWTError, ValueError):
         raise credentials_exception
 
+async def get_admin_user(user: User = Depends(get_current_user)) -> User:
+    if user.id not in settings.admin_user_ids:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin only")
+    return user
+
 async def get_optional_current_user(
     db: AsyncSession = Depends(get_db),
     token: Optional[str] = Depends(oauth2_scheme),
@@ -0,0 +1,25 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.api.deps import get_admin_user
+from app.core.db import get_db
+from app.models.user import User
+from app.schemas.recipe import RecipeImportReport
+from app.services.recipe_import import import_recipes, iter_lines
+
+router = APIRouter()
+
+
+@router.post("/recipes/import", response_model=RecipeImportReport)
+async def import_recipes_jsonl(
+    request: Request,
+    user_id: Optional[int] = Query(None, description="Owner for rows without their own user_id"),
+    db: AsyncSession = Depends(get_db),
+    admin: User = Depends(get_admin_user),
+):
+    """
+    Bulk-loads recipes from a JSONL body (one RecipeImportRow per line),
+    committed in chunks as the body streams in. Rows that fail are skipped
+    and listed by line number; the rest are imported.
+    """
+    return await import_recipes(db, iter_lines(request.stream()), user_id or admin.id)
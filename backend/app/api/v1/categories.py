@@ -0,0 +1,27 @@
+from typing import List
+from fastapi import APIRouter, Request, Response
+from app.core.config import settings
+from app.schemas.category import CategoryGroupRead
+from app.services.category_catalog import category_catalog
+from app.utils.http_cache import etag_matches, apply_cache_headers, not_modified
+
+router = APIRouter()
+
+
+@router.get("", response_model=List[CategoryGroupRead])
+async def list_categories(request: Request, response: Response):
+    """Category groups with their categories, served from the in-process catalog."""
+    # Warmed by the lifespan loop; only a cold worker pays for the first load
+    if not category_catalog.ready:
+        await category_catalog.refresh()
+
+    # Same body for every caller, so shared caches may keep it
+    cache_control = (
+        f"public, max-age={settings.categories_max_age}, "
+        f"stale-while-revalidate={settings.categories_stale_while_revalidate}"
+    )
+    etag = category_catalog.etag
+    if etag_matches(request, etag):
+        return not_modified(etag, cache_control, vary=None)
+    apply_cache_headers(response, etag, cache_control, vary=None)
+    return category_catalog.groups
@@ -1,8 +1,10 @@
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks
+from datetime import datetime
+from typing import List, Optional, Union
+from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, text, delete, desc
-from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy import select, func, delete, desc, or_, text
+from sqlalchemy.orm import joinedload, selectinload, load_only, raiseload
 from sqlalchemy.exc import IntegrityError
 from app.core.db import get_db
 from app.models.recipe import Recipe
@@ -14,13 +16,18 @@ from app.models.saved_recipe import UserSavedRecipe
 from app.models.recipe_category import RecipeCategory
 from app.models.category_group import CategoryGroup
 from app.models.recipe_view import UserRecipeView
+from app.models.recipe_stats import RecipeStats
+from app.models.recipe_trending import RecipeTrending
+from app.models.recipe_recommendation import RecipeRecommendation
+from app.models.recipe_tombstone import RecipeTombstone
 from app.schemas.recipe import RecipeCreate, RecipeRead, RecipeUpdate
-from app.schemas.ingredient import IngredientRead
-from app.api.deps import get_current_user, get_optional_current_user
+from app.api.deps import get_current_user, get_optional_current_user, get_admin_user
 from app.models.user import User
 from app.core.config import settings
 from app.services.ingredient_matcher import mock_match_ingredient
-from app.schemas.recipe import PaginatedRecipes
+from app.schemas.recipe import PaginatedRecipes, PaginatedRecipeCards, RecipeListItem
+from app.schemas.recipe import RecipeInteractionsRequest, RecipeInteraction, Suggestion, MAX_BATCH_IDS
+from app.schemas.recipe import PantrySearchRequest, PantrySearchResponse, PantryMatch
 from app.schemas.media import RecipeMediaRead
 
 from app.schemas.recipe import RecipeCreateWithMedia
@@ -31,6 +38,25 @@ from app.services.media_cleanup import cleanup_media_files
 from app.tasks.media import process_recipe_media_task, cleanup_media_files_task
 from botocore.exceptions import ClientError
 from app.services.storage_service import head_object
+from app.services.recipe_stats import bump_recipe_stats, get_stats_map
+from app.services.recipe_interactions import get_viewer_flags, get_interaction_map, NO_INTERACTIONS
+from app.services.view_buffer import view_buffer
+from app.services.recipe_counts import count_recipes, COUNT_STRATEGIES
+from app.services.recipe_facets import compute_facets
+from app.services.recipe_filters import category_filter, CATEGORY_MODES
+from app.services.recipe_search import apply_text_search, apply_fuzzy_search, has_min_text_hits
+from app.services.suggest_index import suggest_index
+from app.services.minhash import related_recipes
+from app.services.pantry_index import pantry_index, match_recipes_sql, resolve_ingredient_ids
+from app.services.recipe_cache import recipe_cache, recipe_payload
+from app.services.row_diff import diff_rows, apply_row_diff
+from app.services.recipe_json import recipe_json, card_json
+from app.services.recipe_export import ndjson_lines, requires_full_export
+from app.services.recipe_fields import DETAIL_OPTIONS, parse_fields, load_options, wants_interactions, project
+from app.services.recipe_versions import get_recipe_state, content_version
+from app.utils.http_cache import make_etag, etag_matches, cache_control_for, apply_cache_headers, not_modified
+from app.utils.pagination import fetch_page
+from app.utils.fast_json import FastJSONResponse
 
 router = APIRouter()
 
@@ -52,6 +78,7 @@ async def create_recipe(
     )
     db.add(recipe)
     await db.flush()  # Ensure recipe.id is available
+    db.add(RecipeStats(recipe_id=recipe.id))
 
     # Batch ingredients
     recipe_ingredients = []
@@ -77,151 +104,353 @@ async def create_recipe(
 
     await db.commit()
     # Return fully populated recipe
-    return await get_recipe(recipe.id, db, user=user)
+    return await build_recipe_read(db, recipe.id, user)
 
-@router.get("", response_model=PaginatedRecipes)
+def interaction_fields(state) -> dict:
+    """Flag/counter fields shared by RecipeRead and RecipeListItem."""
+    return {
+        "is_liked": state.is_liked,
+        "is_saved": state.is_saved,
+        "likes_count": state.likes_count,
+        "views_count": state.views_count,
+    }
+
+# Liked/saved/history rows load the author and media only; the child lists stay empty
+USER_LIST_FIELDS = frozenset({"author_name", "media"})
+
+def user_list_response(recipes, interactions, total, page, per_page, next_cursor) -> FastJSONResponse:
+    """PaginatedRecipes body for the per-user lists, encoded once like the main list."""
+    items = [
+        recipe_json(
+            {**recipe_payload(r, USER_LIST_FIELDS), "ingredients": [], "steps": [], "categories": []},
+            interaction_fields(interactions.get(r.id, NO_INTERACTIONS)),
+        )
+        for r in recipes
+    ]
+    return FastJSONResponse({
+        "total": total,
+        "total_is_exact": True,
+        "page": page,
+        "per_page": per_page,
+        "recipes": items,
+        "next_cursor": next_cursor,
+        "facets": None,
+    })
+
+# Cards only need a handful of columns; never touch the child tables
+CARD_OPTIONS = (
+    load_only(
+        Recipe.id, Recipe.name, Recipe.description, Recipe.cook_time_minutes,
+        Recipe.servings, Recipe.is_public, Recipe.user_id, Recipe.created_at,
+        Recipe.updated_at,
+    ),
+    joinedload(Recipe.author).load_only(User.display_name),
+    raiseload("*"),
+)
+
+def recipe_card(r: Recipe, primary_media: Optional[RecipeMedia], state) -> RecipeListItem:
+    return RecipeListItem(
+        id=r.id,
+        name=r.name,
+        description=r.description,
+        cook_time_minutes=r.cook_time_minutes,
+        servings=r.servings,
+        is_public=r.is_public,
+        author_name=r.author.display_name if r.author else "Anonymous",
+        primary_media=primary_media,
+        **interaction_fields(state),
+    )
+
+async def load_recipe_cards(db: AsyncSession, recipe_ids: list[int], user: Optional[User]) -> dict[int, RecipeListItem]:
+    """Cards for the given ids that the viewer may see; unknown and private ids are skipped."""
+    if not recipe_ids:
+        return {}
+    visible = Recipe.is_public == True
+    if user:
+        visible = or_(visible, Recipe.user_id == user.id)
+    result = await db.execute(
+        select(Recipe).options(*CARD_OPTIONS).where(Recipe.id.in_(recipe_ids), visible)
+    )
+    recipes = result.scalars().all()
+    ids = [r.id for r in recipes]
+    primary_media = await get_primary_media_map(db, ids)
+    interactions = await get_interaction_map(db, user.id if user else None, ids)
+    return {
+        r.id: recipe_card(r, primary_media.get(r.id), interactions.get(r.id, NO_INTERACTIONS))
+        for r in recipes
+    }
+
+async def get_primary_media_map(db: AsyncSession, recipe_ids: list[int]) -> dict[int, RecipeMedia]:
+    """One row per recipe: the primary media, else the first by display order."""
+    if not recipe_ids:
+        return {}
+    result = await db.execute(
+        select(RecipeMedia)
+        .where(RecipeMedia.recipe_id.in_(recipe_ids))
+        .distinct(RecipeMedia.recipe_id)
+        .order_by(RecipeMedia.recipe_id, desc(RecipeMedia.is_primary), RecipeMedia.display_order)
+    )
+    return {m.recipe_id: m for m in result.scalars().all()}
+
+@router.get("", response_model=Union[PaginatedRecipes, PaginatedRecipeCards])
 async def list_recipes(
+    request: Request,
     db: AsyncSession = Depends(get_db),
     user: Optional[User] = Depends(get_optional_current_user),
     page: int = Query(1, ge=1),
     per_page: int = Query(12, le=100),
     category_ids: Optional[List[int]] = Query(None),
+    category_mode: str = Query("any", enum=CATEGORY_MODES),
     max_cook_time: Optional[int] = Query(None, alias="maxTime"),
     search: Optional[str] = Query(None),
+    fuzzy: bool = Query(True),
     author_id: Optional[int] = Query(None),
-    sort_by: Optional[str] = Query("latest", enum=["latest", "most_viewed", "most_liked"]),
+    sort_by: Optional[str] = Query(None, enum=["relevance", "latest", "most_viewed", "most_liked", "trending"]),
+    cursor: Optional[str] = Query(None),
+    view: str = Query("full", enum=["full", "card"]),
+    count: str = Query("exact", enum=COUNT_STRATEGIES),
+    facets: bool = Query(False),
+    fields: Optional[str] = Query(None, description="Comma-separated RecipeRead fields (full view only)"),
 ):
     # Base statement
-    stmt = select(Recipe).options(
-        joinedload(Recipe.author),
-        selectinload(Recipe.ingredients).joinedload(RecipeIngredient.unit),
-        selectinload(Recipe.steps),
-        selectinload(Recipe.categories),
-        selectinload(Recipe.media),
-    )
+    if view == "card":
+        fields = None
+        stmt = select(Recipe).options(*CARD_OPTIONS)
+    else:
+        fields = parse_fields(fields)
+        stmt = select(Recipe).options(*load_options(fields))
 
     # Apply filters
     if author_id:
         stmt = stmt.where(Recipe.user_id == author_id)
     if category_ids:
-        stmt = stmt.join(Recipe.categories).where(Category.id.in_(category_ids))
+        stmt = stmt.where(category_filter(category_ids, category_mode))
     if max_cook_time is not None:
         stmt = stmt.where(Recipe.cook_time_minutes <= max_cook_time)
+    rank = None
+    search = search.strip() if search else None
     if search:
-        search = search.strip()
-        stmt = stmt.where(
-            text(
-                "to_tsvector('english', coalesce(recipes.name, '') || ' ' || "
-                "coalesce(recipes.description, '')) @@ plainto_tsquery(:q)" 
-            )
-        ).params(q=search)
-
-    # Sorting with Subqueries to avoid GROUP BY issues with eager loading
+        text_stmt, rank = apply_text_search(stmt, search)
+        # Too few full-text hits (typos, partial words): blend in trigram matches
+        if fuzzy and not await has_min_text_hits(db, text_stmt, settings.search_fuzzy_min_hits):
+            stmt, rank = await apply_fuzzy_search(db, stmt, search)
+        else:
+            stmt = text_stmt
+
+    # Searches default to relevance order, everything else to newest first
+    if sort_by is None:
+        sort_by = "relevance" if rank is not None else "latest"
+
+    # Popularity sorts read the denormalized counters (indexed on count, recipe_id)
     if sort_by == "most_liked":
-        likes_subq = select(
-            RecipeLike.recipe_id, 
-            func.count(RecipeLike.user_id).label("l_count")
-        ).group_by(RecipeLike.recipe_id).subquery()
-        
-        stmt = stmt.outerjoin(likes_subq, Recipe.id == likes_subq.c.recipe_id)\
-                   .order_by(desc(func.coalesce(likes_subq.c.l_count, 0)), desc(Recipe.created_at))
-                   
+        stmt = stmt.join(RecipeStats, RecipeStats.recipe_id == Recipe.id)
+        sort_keys = [RecipeStats.likes_count, RecipeStats.recipe_id]
     elif sort_by == "most_viewed":
-        views_subq = select(
-            UserRecipeView.recipe_id, 
-            func.count(UserRecipeView.id).label("v_count")
-        ).group_by(UserRecipeView.recipe_id).subquery()
-        
-        stmt = stmt.outerjoin(views_subq, Recipe.id == views_subq.c.recipe_id)\
-                   .order_by(desc(func.coalesce(views_subq.c.v_count, 0)), desc(Recipe.created_at))
+        stmt = stmt.join(RecipeStats, RecipeStats.recipe_id == Recipe.id)
+        sort_keys = [RecipeStats.views_count, RecipeStats.recipe_id]
+    elif sort_by == "relevance" and rank is not None:
+        sort_keys = [rank, Recipe.id]
+    elif sort_by == "trending":
+        # Precomputed by the refresh_trending task; only recently active recipes rank
+        stmt = stmt.join(RecipeTrending, RecipeTrending.recipe_id == Recipe.id)
+        sort_keys = [RecipeTrending.score, RecipeTrending.recipe_id]
     else:
-        stmt = stmt.order_by(desc(Recipe.created_at))
+        sort_keys = [Recipe.created_at, Recipe.id]
 
     # Total count
-    # Use subquery approach for total count to be safe with joins
-    total_result = await db.execute(select(func.count()).select_from(stmt.subquery()))
-    total = total_result.scalar() or 0
-
-    # Execute main query
-    stmt = stmt.offset((page - 1) * per_page).limit(per_page)
-    result = await db.execute(stmt)
-    recipes = result.scalars().unique().all()
+    filters = (
+        author_id, tuple(sorted(category_ids or [])), category_ids and category_mode,
+        max_cook_time, search, search and fuzzy,
+    )
+    total, total_is_exact = await count_recipes(
+        db, stmt, count,
+        signature=(sort_by, *filters),
+        # The trending join keeps only recently active recipes, so the
+        # table-wide estimate does not apply
+        unfiltered=not any(filters) and sort_by != "trending",
+    )
+    facet_counts = await compute_facets(db, stmt) if facets else None
 
-    # Post-process results
-    for r in recipes:
-        r.media.sort(key=lambda m: (not m.is_primary, m.display_order))
+    # Execute main query (keyset when a cursor is given, OFFSET otherwise)
+    recipes, next_cursor = await fetch_page(db, stmt, sort_keys, page, per_page, cursor)
 
     # Interaction stats for return
     recipe_ids = [r.id for r in recipes]
-    liked_ids = set()
-    saved_ids = set()
-    likes_counts = {}
-    views_counts = {}
-
-    if recipe_ids:
-        l_res = await db.execute(select(RecipeLike.recipe_id, func.count('*')).where(RecipeLike.recipe_id.in_(recipe_ids)).group_by(RecipeLike.recipe_id))
-        likes_counts = {row[0]: row[1] for row in l_res.all()}
-
-        v_res = await db.execute(select(UserRecipeView.recipe_id, func.count('*')).where(UserRecipeView.recipe_id.in_(recipe_ids)).group_by(UserRecipeView.recipe_id))
-        views_counts = {row[0]: row[1] for row in v_res.all()}
-
-        if user:
-            ul_res = await db.execute(select(RecipeLike.recipe_id).where(RecipeLike.user_id == user.id, RecipeLike.recipe_id.in_(recipe_ids)))
-            liked_ids = set(ul_res.scalars().all())
-
-            us_res = await db.execute(select(UserSavedRecipe.recipe_id).where(UserSavedRecipe.user_id == user.id, UserSavedRecipe.recipe_id.in_(recipe_ids)))
-            saved_ids = set(us_res.scalars().all())
-
-    return PaginatedRecipes(
-        total=total,
-        page=page,
-        per_page=per_page,
-        recipes=[
-            RecipeRead(
-                id=r.id,
-                name=r.name,
-                description=r.description,
-                chefs_note=r.chefs_note,
-                cook_time_minutes=r.cook_time_minutes,
-                servings=r.servings,
-                is_public=r.is_public,
-                author_name=r.author.display_name if r.author else "Anonymous",
-                ingredients=[
-                    IngredientRead(
-                        id=ing.id,
-                        ingredient_id=ing.ingredient_id,
-                        name_text=ing.name_text,
-                        quantity=float(ing.quantity) if ing.quantity else None,
-                        quantity_text=ing.quantity_text,
-                        unit_id=ing.unit_id,
-                        unit_name=ing.unit.name if ing.unit else None,
-                        preparation_notes=ing.preparation_notes,
-                        display_order=ing.display_order
-                    ) for ing in r.ingredients
-                ],
-                steps=r.steps,
-                categories=[c.name for c in r.categories],
-                media=r.media,
-                is_liked=(r.id in liked_ids),
-                is_saved=(r.id in saved_ids),
-                likes_count=likes_counts.get(r.id, 0),
-                views_count=views_counts.get(r.id, 0),
-            )
+    interactions = {}
+    if wants_interactions(fields):
+        interactions = await get_interaction_map(db, user.id if user else None, recipe_ids)
+
+    if view == "card":
+        primary_media = await get_primary_media_map(db, recipe_ids)
+        media_state = {rid: (m.id, m.processed, m.updated_at) for rid, m in primary_media.items()}
+    elif fields is None or "media" in fields:
+        media_state = {r.id: [(m.id, m.processed, m.updated_at) for m in r.media] for r in recipes}
+    else:
+        media_state = {}
+
+    # Validator over everything the page body depends on except views_count,
+    # which moves with every detail GET (see get_recipe); checked before serializing
+    etag = make_etag(
+        view, fields and sorted(fields), user.id if user else None, total, total_is_exact, next_cursor, facet_counts,
+        [
+            (r.id, r.updated_at, r.id in interactions and interactions[r.id]._replace(views_count=0), media_state.get(r.id))
+            for r in recipes
+        ],
+    )
+    cache_control = cache_control_for(user)
+    if etag_matches(request, etag):
+        return not_modified(etag, cache_control)
+
+    # Plain dicts encoded once; the response_model only documents the shape
+    if view == "card":
+        items = [
+            card_json(r, primary_media.get(r.id), interaction_fields(interactions.get(r.id, NO_INTERACTIONS)))
+            for r in recipes
+        ]
+    else:
+        items = [
+            project(recipe_json(recipe_payload(r, fields), interaction_fields(interactions.get(r.id, NO_INTERACTIONS))), fields)
             for r in recipes
         ]
+
+    fast_response = FastJSONResponse({
+        "total": total,
+        "total_is_exact": total_is_exact,
+        "page": page,
+        "per_page": per_page,
+        "recipes": items,
+        "next_cursor": next_cursor,
+        "facets": facet_counts,
+    })
+    apply_cache_headers(fast_response, etag, cache_control)
+    return fast_response
+
+@router.get("/suggest", response_model=List[Suggestion])
+async def suggest(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=25),
+):
+    """Typeahead served from the in-process prefix index; no query per keystroke."""
+    # Built on first use; the lifespan loop keeps it fresh afterwards
+    if not suggest_index.ready:
+        await suggest_index.refresh()
+    return suggest_index.suggest(q, limit)
+
+@router.post("/pantry", response_model=PantrySearchResponse)
+async def pantry_search(
+    body: PantrySearchRequest,
+    db: AsyncSession = Depends(get_db),
+    user: Optional[User] = Depends(get_optional_current_user),
+):
+    """Recipes ranked by the share of their ingredients the caller already has."""
+    ingredient_ids = set(body.ingredient_ids) | await resolve_ingredient_ids(db, body.ingredients)
+
+    if pantry_index.ready and len(ingredient_ids) <= settings.pantry_index_max_ids:
+        matches = pantry_index.match(ingredient_ids, body.limit, body.min_coverage)
+    else:
+        matches = await match_recipes_sql(db, ingredient_ids, body.limit, body.min_coverage)
+
+    cards = await load_recipe_cards(db, [recipe_id for recipe_id, _, _ in matches], user)
+    return PantrySearchResponse(
+        ingredient_ids=sorted(ingredient_ids),
+        matches=[
+            PantryMatch(
+                recipe=cards[recipe_id],
+                coverage=round(matched / required, 4),
+                matched=matched,
+                required=required,
+            )
+            for recipe_id, matched, required in matches
+            if recipe_id in cards
+        ],
     )
 
+@router.post("/interactions", response_model=List[RecipeInteraction])
+async def get_recipe_interactions(
+    body: RecipeInteractionsRequest,
+    db: AsyncSession = Depends(get_db),
+    user: Optional[User] = Depends(get_optional_current_user),
+):
+    """
+    Viewer flags and counters for a batch of recipes, in request order.
+    Unknown ids and other users' private recipes get zeroes, as the detail
+    endpoint would not show them either.
+    """
+    recipe_ids = list(dict.fromkeys(body.recipe_ids))
+    interactions = await get_interaction_map(db, user.id if user else None, recipe_ids, visible_only=True)
+
+    items = []
+    for rid in recipe_ids:
+        fields = interactions.get(rid, NO_INTERACTIONS)._asdict()
+        if rid in interactions:
+            # Same count as the detail and /batch endpoints
+            fields["views_count"] += view_buffer.pending_views(rid)
+        items.append(RecipeInteraction(recipe_id=rid, **fields))
+    return items
+
+@router.get("/batch", response_model=List[RecipeRead])
+async def get_recipes_batch(
+    ids: List[int] = Query(..., min_length=1, max_length=MAX_BATCH_IDS),
+    db: AsyncSession = Depends(get_db),
+    user: Optional[User] = Depends(get_optional_current_user),
+):
+    """
+    Full recipes for many ids at once, in request order, for offline caches
+    and notification lists. Costs the same handful of queries for 1 or 100 ids
+    and, unlike GET /recipes/{id}, records no views. Unknown ids and other
+    users' private recipes are skipped.
+    """
+    recipe_ids = list(dict.fromkeys(ids))
+    visible = Recipe.is_public == True
+    if user:
+        visible = or_(visible, Recipe.user_id == user.id)
+    result = await db.execute(
+        select(Recipe).options(*DETAIL_OPTIONS).where(Recipe.id.in_(recipe_ids), visible)
+    )
+    recipes = {r.id: r for r in result.scalars().all()}
+    interactions = await get_interaction_map(db, user.id if user else None, list(recipes))
+
+    items = []
+    for rid in recipe_ids:
+        if rid not in recipes:
+            continue
+        fields = interaction_fields(interactions.get(rid, NO_INTERACTIONS))
+        fields["views_count"] += view_buffer.pending_views(rid)
+        items.append(recipe_json(recipe_payload(recipes[rid]), fields))
+    return FastJSONResponse(items)
+
+@router.get("/export")
+async def export_recipes(
+    updated_since: Optional[datetime] = Query(None),
+    admin: User = Depends(get_admin_user),
+):
+    """
+    Every public recipe as NDJSON, one RecipeRead-shaped object per line plus
+    `updated_at`, streamed from a server-side cursor. Pass the latest
+    `updated_at` received as `updated_since` for an incremental export; it
+    re-sends a short overlap and ends with `{"id", "deleted": true}`
+    tombstones for recipes deleted or made private since. A watermark older
+    than the tombstone retention gets 410 and needs a full export.
+
+    Admin only: each stream holds a connection and a snapshot open until
+    the client has read it all.
+    """
+    if updated_since is not None and requires_full_export(updated_since):
+        raise HTTPException(410, "Full export required")
+    return StreamingResponse(ndjson_lines(updated_since), media_type="application/x-ndjson")
+
 @router.get("/liked", response_model=PaginatedRecipes)
 async def list_liked_recipes(
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
     page: int = Query(1, ge=1),
     per_page: int = Query(12, le=100),
+    cursor: Optional[str] = Query(None),
 ):
     stmt = select(Recipe).join(RecipeLike).where(RecipeLike.user_id == user.id).options(
         joinedload(Recipe.author),
         selectinload(Recipe.media),
-    ).order_by(RecipeLike.created_at.desc())
+    )
 
     # Total count
     subq = stmt.subquery()
@@ -229,36 +458,13 @@ async def list_liked_recipes(
     total = total_result.scalar() or 0
 
     # Paginate
-    stmt = stmt.offset((page - 1) * per_page).limit(per_page)
-    result = await db.execute(stmt)
-    recipes = result.scalars().unique().all()
-
-    return PaginatedRecipes(
-        total=total,
-        page=page,
-        per_page=per_page,
-        recipes=[
-            RecipeRead(
-                id=r.id,
-                name=r.name,
-                description=r.description,
-                chefs_note=r.chefs_note,
-                cook_time_minutes=r.cook_time_minutes,
-                servings=r.servings,
-                is_public=r.is_public,
-                author_name=r.author.display_name if r.author else "Anonymous",
-                ingredients=[], # Not needed for list
-                steps=[], # Not needed for list
-                categories=[], # Not needed for list
-                media=r.media,
-                is_liked=True,
-                is_saved=False, # We'd need extra queries to populate accurately
-                likes_count=0,
-                views_count=0,
-            )
-            for r in recipes
-        ]
+    recipes, next_cursor = await fetch_page(
+        db, stmt, [RecipeLike.created_at, RecipeLike.recipe_id], page, per_page, cursor
     )
+    # Counters and flags for the whole page in one query
+    interactions = await get_interaction_map(db, user.id, [r.id for r in recipes])
+
+    return user_list_response(recipes, interactions, total, page, per_page, next_cursor)
 
 @router.get("/saved", response_model=PaginatedRecipes)
 async def list_saved_recipes(
@@ -266,11 +472,12 @@ async def list_saved_recipes(
     user: User = Depends(get_current_user),
     page: int = Query(1, ge=1),
     per_page: int = Query(12, le=100),
+    cursor: Optional[str] = Query(None),
 ):
     stmt = select(Recipe).join(UserSavedRecipe).where(UserSavedRecipe.user_id == user.id).options(
         joinedload(Recipe.author),
         selectinload(Recipe.media),
-    ).order_by(UserSavedRecipe.saved_at.desc())
+    )
 
     # Total count
     subq = stmt.subquery()
@@ -278,36 +485,13 @@ async def list_saved_recipes(
     total = total_result.scalar() or 0
 
     # Paginate
-    stmt = stmt.offset((page - 1) * per_page).limit(per_page)
-    result = await db.execute(stmt)
-    recipes = result.scalars().unique().all()
-
-    return PaginatedRecipes(
-        total=total,
-        page=page,
-        per_page=per_page,
-        recipes=[
-            RecipeRead(
-                id=r.id,
-                name=r.name,
-                description=r.description,
-                chefs_note=r.chefs_note,
-                cook_time_minutes=r.cook_time_minutes,
-                servings=r.servings,
-                is_public=r.is_public,
-                author_name=r.author.display_name if r.author else "Anonymous",
-                ingredients=[], # Not needed for list
-                steps=[], # Not needed for list
-                categories=[], # Not needed for list
-                media=r.media,
-                is_liked=False, # We'd need extra queries to populate these accurately
-                is_saved=True,
-                likes_count=0,
-                views_count=0,
-            )
-            for r in recipes
-        ]
+    recipes, next_cursor = await fetch_page(
+        db, stmt, [UserSavedRecipe.saved_at, UserSavedRecipe.recipe_id], page, per_page, cursor
     )
+    # Counters and flags for the whole page in one query
+    interactions = await get_interaction_map(db, user.id, [r.id for r in recipes])
+
+    return user_list_response(recipes, interactions, total, page, per_page, next_cursor)
 
 @router.get("/history", response_model=PaginatedRecipes)
 async def list_view_history(
@@ -315,6 +499,7 @@ async def list_view_history(
     user: User = Depends(get_current_user),
     page: int = Query(1, ge=1),
     per_page: int = Query(12, le=100),
+    cursor: Optional[str] = Query(None),
 ):
     # Get unique recently viewed recipes
     # Using a subquery to get the latest view time per recipe
@@ -326,7 +511,7 @@ async def list_view_history(
     stmt = select(Recipe).join(latest_views, Recipe.id == latest_views.c.recipe_id).options(
         joinedload(Recipe.author),
         selectinload(Recipe.media),
-    ).order_by(desc(latest_views.c.latest_view))
+    )
 
     # Total count
     subq = stmt.subquery()
@@ -334,108 +519,140 @@ async def list_view_history(
     total = total_result.scalar() or 0
 
     # Paginate
-    stmt = stmt.offset((page - 1) * per_page).limit(per_page)
-    result = await db.execute(stmt)
-    recipes = result.scalars().unique().all()
-
-    return PaginatedRecipes(
-        total=total,
-        page=page,
-        per_page=per_page,
-        recipes=[
-            RecipeRead(
-                id=r.id,
-                name=r.name,
-                description=r.description,
-                chefs_note=r.chefs_note,
-                cook_time_minutes=r.cook_time_minutes,
-                servings=r.servings,
-                is_public=r.is_public,
-                author_name=r.author.display_name if r.author else "Anonymous",
-                ingredients=[],
-                steps=[],
-                categories=[],
-                media=r.media,
-                is_liked=False,
-                is_saved=False,
-                likes_count=0,
-                views_count=0,
-            )
-            for r in recipes
-        ]
+    recipes, next_cursor = await fetch_page(
+        db, stmt, [latest_views.c.latest_view, Recipe.id], page, per_page, cursor
+    )
+    # Counters and flags for the whole page in one query
+    interactions = await get_interaction_map(db, user.id, [r.id for r in recipes])
+
+    return user_list_response(recipes, interactions, total, page, per_page, next_cursor)
+
+async def build_recipe_read(
+    db: AsyncSession,
+    recipe_id: int,
+    user: Optional[User],
+    likes_count: Optional[int] = None,
+    views_count: Optional[int] = None,
+    version: Optional[str] = None,
+) -> RecipeRead:
+    # Viewer-independent part comes from the cache when the caller has read
+    # the content version; without one it is loaded and not cached
+    payload = await recipe_cache.get(recipe_id, version) if version else None
+    if payload is None:
+        result = await db.execute(
+            select(Recipe)
+            .options(*DETAIL_OPTIONS)
+            .where(Recipe.id == recipe_id)
+            .execution_options(populate_existing=True)
+        )
+        recipe = result.scalars().first()
+        if not recipe:
+            raise HTTPException(404, "Recipe not found")
+        payload = recipe_payload(recipe)
+        if version:
+            await recipe_cache.set(recipe_id, version, payload)
+
+    # Fetch stats unless the caller already has them
+    if likes_count is None or views_count is None:
+        stats = (await get_stats_map(db, [recipe_id])).get(recipe_id)
+        likes_count = stats.likes_count if stats else 0
+        views_count = (stats.views_count if stats else 0) + view_buffer.pending_views(recipe_id)
+
+    # Viewer-specific flags are merged in after the cache
+    liked_ids, saved_ids = await get_viewer_flags(db, user.id if user else None, [recipe_id])
+
+    return RecipeRead(
+        **payload,
+        is_liked=(recipe_id in liked_ids),
+        is_saved=(recipe_id in saved_ids),
+        likes_count=likes_count,
+        views_count=views_count,
     )
 
+async def build_recipe_fields(
+    db: AsyncSession,
+    recipe_id: int,
+    user: Optional[User],
+    fields: frozenset[str],
+    likes_count: int,
+    views_count: int,
+    version: str,
+) -> dict:
+    """Sparse RecipeRead: a cached payload is projected, otherwise only the requested relationships are loaded."""
+    payload = await recipe_cache.get(recipe_id, version)
+    if payload is None:
+        result = await db.execute(
+            select(Recipe)
+            .options(*load_options(fields))
+            .where(Recipe.id == recipe_id)
+            .execution_options(populate_existing=True)
+        )
+        recipe = result.scalars().first()
+        if not recipe:
+            raise HTTPException(404, "Recipe not found")
+        # Partial payloads are never cached
+        payload = recipe_payload(recipe, fields)
+
+    interactions = {}
+    if wants_interactions(fields):
+        liked_ids, saved_ids = await get_viewer_flags(db, user.id if user else None, [recipe_id])
+        interactions = {
+            "is_liked": recipe_id in liked_ids,
+            "is_saved": recipe_id in saved_ids,
+            "likes_count": likes_count,
+            "views_count": views_count,
+        }
+    return project(recipe_json(project(payload, fields), interactions), fields)
+
 @router.get("/{recipe_id}", response_model=RecipeRead)
 async def get_recipe(
     recipe_id: int, 
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
-    user: Optional[User] = Depends(get_optional_current_user)
+    user: Optional[User] = Depends(get_optional_current_user),
+    fields: Optional[str] = Query(None, description="Comma-separated RecipeRead fields"),
 ):
-    result = await db.execute(
-        select(Recipe)
-        .options(
-            selectinload(Recipe.ingredients).joinedload(RecipeIngredient.unit),
-            selectinload(Recipe.steps),
-            selectinload(Recipe.categories),
-            selectinload(Recipe.media),
-            joinedload(Recipe.author),
-        )
-        .where(Recipe.id == recipe_id)
-    )
-    recipe = result.scalars().first()
-    if not recipe:
+    fields = parse_fields(fields)
+    state = await get_recipe_state(db, recipe_id)
+    if state is None:
         raise HTTPException(404, "Recipe not found")
 
-    # Record View
-    view = UserRecipeView(recipe_id=recipe.id, user_id=user.id if user else None)
-    db.add(view)
-    await db.commit()
-
-    # Sort media
-    recipe.media.sort(key=lambda m: (not m.is_primary, m.display_order))
+    views_count = state["views_count"] + view_buffer.pending_views(recipe_id)
+    cache_control = cache_control_for(user)
 
-    # Fetch stats
-    like_count_stmt = select(func.count('*')).where(RecipeLike.recipe_id == recipe_id)
-    likes_count = (await db.execute(like_count_stmt)).scalar() or 0
-
-    view_count_stmt = select(func.count('*')).where(UserRecipeView.recipe_id == recipe_id)
-    views_count = (await db.execute(view_count_stmt)).scalar() or 0
-
-    is_liked = False
-    is_saved = False
-    if user:
-        is_liked = (await db.execute(select(RecipeLike).where(RecipeLike.user_id == user.id, RecipeLike.recipe_id == recipe_id))).scalars().first() is not None
-        is_saved = (await db.execute(select(UserSavedRecipe).where(UserSavedRecipe.user_id == user.id, UserSavedRecipe.recipe_id == recipe_id))).scalars().first() is not None
+    # views_count is left out: every full GET records a view, so it would
+    # change the tag between any two clients. A revalidated body may show
+    # a views_count that lags by the views since it was fetched.
+    etag = make_etag(
+        recipe_id, fields and sorted(fields), user.id if user else None, state["updated_at"], state["media"],
+        state["likes_count"], state["saves_count"],
+    )
 
-    return RecipeRead(
-        id=recipe.id,
-        name=recipe.name,
-        description=recipe.description,
-        chefs_note=recipe.chefs_note,
-        cook_time_minutes=recipe.cook_time_minutes,
-        servings=recipe.servings,
-        is_public=recipe.is_public,
-        author_name=recipe.author.display_name if recipe.author else "Anonymous",
-        ingredients=[
-            IngredientRead(
-                id=ing.id,
-                ingredient_id=ing.ingredient_id,
-                name_text=ing.name_text,
-                quantity=float(ing.quantity) if ing.quantity else None,
-                quantity_text=ing.quantity_text,
-                unit_id=ing.unit_id,
-                unit_name=ing.unit.name if ing.unit else None,
-                preparation_notes=ing.preparation_notes,
-                display_order=ing.display_order
-            ) for ing in recipe.ingredients
-        ],
-        steps=recipe.steps,
-        categories=[c.name for c in recipe.categories],
-        media=recipe.media,
-        is_liked=is_liked,
-        is_saved=is_saved,
-        likes_count=likes_count,
+    # Re-polls of an unchanged recipe are answered without touching the body
+    if etag_matches(request, etag):
+        return not_modified(etag, cache_control)
+
+    # Record View (buffered and written in bulk, no write on this request)
+    view_buffer.record(recipe_id, user.id if user else None)
+    views_count += 1
+
+    if fields is not None:
+        sparse = FastJSONResponse(await build_recipe_fields(
+            db, recipe_id, user, fields,
+            likes_count=state["likes_count"],
+            views_count=views_count,
+            version=content_version(state),
+        ))
+        apply_cache_headers(sparse, etag, cache_control)
+        return sparse
+
+    apply_cache_headers(response, etag, cache_control)
+    return await build_recipe_read(
+        db, recipe_id, user,
+        likes_count=state["likes_count"],
         views_count=views_count,
+        version=content_version(state),
     )
 
 @router.patch("/{recipe_id}", response_model=RecipeRead)
@@ -476,37 +693,30 @@ async def update_recipe(
             publish_requested = True
         setattr(recipe, field, value)
 
-    # Replace ingredients
-    if data.ingredients is not None:
-        await db.execute(
-            RecipeIngredient.__table__.delete().where(
-                RecipeIngredient.recipe_id == recipe.id
-            )
-        )
-        recipe_ingredients = []
-        for ing in data.ingredients:
-            ingredient_id = await mock_match_ingredient(ing.name_text)
-            recipe_ingredients.append(
-                RecipeIngredient(
-                    recipe_id=recipe.id,
-                    ingredient_id=ingredient_id,
-                    **ing.dict(),
-                )
-            )
-        db.add_all(recipe_ingredients)
+    # Child rows change without touching the recipe row; bump it so
+    # ETags and caches keyed on updated_at see the edit
+    recipe.updated_at = func.now()
 
-    # Replace steps
-    if data.steps is not None:
-        await db.execute(
-            RecipeStep.__table__.delete().where(
-                RecipeStep.recipe_id == recipe.id
-            )
-        )
-        recipe_steps = [
-            RecipeStep(recipe_id=recipe.id, **step.dict())
-            for step in data.steps
-        ]
-        db.add_all(recipe_steps)
+    # Diff ingredients and steps by id; unchanged rows are not written
+    try:
+        ingredient_diff = step_diff = None
+        if data.ingredients is not None:
+            ingredient_diff = diff_rows(RecipeIngredient, recipe.ingredients, [ing.dict() for ing in data.ingredients])
+        if data.steps is not None:
+            step_diff = diff_rows(RecipeStep, recipe.steps, [step.dict() for step in data.steps])
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+
+    if ingredient_diff is not None:
+        for values in ingredient_diff.inserts + ingredient_diff.updates:
+            values["ingredient_id"] = await mock_match_ingredient(values["name_text"])
+        await apply_row_diff(db, RecipeIngredient, recipe.id, ingredient_diff)
+
+    if step_diff is not None:
+        if step_diff.updates:
+            # Renumbered steps may pass through each other's numbers
+            await db.execute(text("SET CONSTRAINTS uq_recipe_step DEFERRED"))
+        await apply_row_diff(db, RecipeStep, recipe.id, step_diff)
 
     # Update categories
     if data.category_ids is not None:
@@ -581,7 +791,7 @@ async def update_recipe(
     if media_cleanup_keys:
         cleanup_media_files_task.delay(media_cleanup_keys)
     
-    return await get_recipe(recipe.id, db, user=user)
+    return await build_recipe_read(db, recipe.id, user)
 
 @router.delete("/{recipe_id}", status_code=204)
 async def delete_recipe(
@@ -610,10 +820,48 @@ async def delete_recipe(
         cleanup_media_files_task.delay(media_keys)
 
     await db.delete(recipe)
+    # Lets incremental exports tell mirrors to drop it
+    db.add(RecipeTombstone(recipe_id=recipe_id))
     await db.commit()
+    view_buffer.discard(recipe_id)
+    # Deletes are otherwise only picked up by the periodic rebuilds
+    suggest_index.remove("recipe", recipe_id)
+    pantry_index.remove(recipe_id)
 
 # --- INTERACTIONS ---
 
+@router.get("/{recipe_id}/recommendations", response_model=List[RecipeListItem])
+async def get_recipe_recommendations(
+    recipe_id: int,
+    db: AsyncSession = Depends(get_db),
+    user: Optional[User] = Depends(get_optional_current_user),
+    limit: int = Query(10, ge=1, le=settings.recommendations_top_k),
+):
+    """"People also viewed": precomputed co-view neighbours, best first."""
+    related_ids = (await db.execute(
+        select(RecipeRecommendation.related_recipe_id)
+        .where(RecipeRecommendation.recipe_id == recipe_id)
+        .order_by(RecipeRecommendation.rank)
+        .limit(limit)
+    )).scalars().all()
+
+    cards = await load_recipe_cards(db, related_ids, user)
+    return [cards[rid] for rid in related_ids if rid in cards]
+
+@router.get("/{recipe_id}/related", response_model=List[RecipeListItem])
+async def get_related_recipes(
+    recipe_id: int,
+    db: AsyncSession = Depends(get_db),
+    user: Optional[User] = Depends(get_optional_current_user),
+    limit: int = Query(10, ge=1, le=50),
+):
+    """Recipes with similar ingredients, found through the MinHash LSH buckets."""
+    related = await related_recipes(db, recipe_id, limit)
+    related_ids = [rid for rid, _ in related]
+
+    cards = await load_recipe_cards(db, related_ids, user)
+    return [cards[rid] for rid in related_ids if rid in cards]
+
 @router.post("/{recipe_id}/like", status_code=201)
 async def like_recipe(
     recipe_id: int,
@@ -627,6 +875,8 @@ async def like_recipe(
     try:
         like = RecipeLike(user_id=user.id, recipe_id=recipe_id)
         db.add(like)
+        await db.flush()
+        await bump_recipe_stats(db, recipe_id, likes=1)
         await db.commit()
     except IntegrityError:
         await db.rollback()
@@ -640,12 +890,14 @@ async def unlike_recipe(
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
-    await db.execute(
+    result = await db.execute(
         delete(RecipeLike).where(
             RecipeLike.user_id == user.id,
             RecipeLike.recipe_id == recipe_id
         )
     )
+    if result.rowcount:
+        await bump_recipe_stats(db, recipe_id, likes=-1)
     await db.commit()
 
 @router.post("/{recipe_id}/save", status_code=201)
@@ -661,6 +913,8 @@ async def save_recipe(
     try:
         save = UserSavedRecipe(user_id=user.id, recipe_id=recipe_id)
         db.add(save)
+        await db.flush()
+        await bump_recipe_stats(db, recipe_id, saves=1)
         await db.commit()
     except IntegrityError:
         await db.rollback()
@@ -674,12 +928,14 @@ async def unsave_recipe(
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
-    await db.execute(
+    result = await db.execute(
         delete(UserSavedRecipe).where(
             UserSavedRecipe.user_id == user.id,
             UserSavedRecipe.recipe_id == recipe_id
         )
     )
+    if result.rowcount:
+        await bump_recipe_stats(db, recipe_id, saves=-1)
     await db.commit()
 
 @router.post("/with-media", response_model=dict)
@@ -712,6 +968,7 @@ async def create_recipe_with_media(
     )
     db.add(recipe)
     await db.flush()
+    db.add(RecipeStats(recipe_id=recipe.id))
 
     # --- CATEGORY RESOLUTION ---
     if data.category_ids:
@@ -54,6 +54,90 @@ class Settings(BaseSettings):
 
     media_presigned_expiry_seconds: int = 900
 
+    # Recipe view ingestion (flushed in bulk, see services/view_buffer.py)
+    view_buffer_max_size: int = 500
+    view_buffer_flush_seconds: float = 2.0
+
+    # Recipe listing totals (see services/recipe_counts.py)
+    recipe_count_cap: int = 1000
+    recipe_count_cache_seconds: int = 60
+
+    # Recipe detail cache. In-memory LRU by default; set RECIPE_CACHE_URL
+    # (redis://...) to share entries between API workers.
+    RECIPE_CACHE_URL: str | None = None
+    recipe_cache_ttl_seconds: int = 300
+    recipe_cache_max_entries: int = 5000
+
+    # Cache-Control max-age for anonymous recipe responses
+    recipe_public_max_age: int = 30
+
+    # Trending ranking (see services/trending.py)
+    trending_half_life_hours: float = 24.0
+    trending_window_hours: int = 168
+    trending_like_weight: float = 3.0
+    trending_save_weight: float = 4.0
+    trending_view_weight: float = 1.0
+    trending_min_score: float = 0.01
+    # Events newer than this are re-scored on every refresh, so likes/saves
+    # committed late and views still in a view buffer are not skipped
+    trending_overlap_minutes: float = 10.0
+
+    # Recipe search: trigram fallback kicks in below this many full-text hits
+    search_fuzzy_min_hits: int = 3
+    search_fuzzy_threshold: float = 0.5
+
+    # In-process indexes re-read this much before their watermark on an
+    # incremental refresh, for rows that committed late (see utils/watermarks.py)
+    refresh_overlap_seconds: float = 300.0
+
+    # Typeahead index (see services/suggest_index.py)
+    suggest_refresh_seconds: float = 30.0
+    suggest_rebuild_seconds: float = 900.0
+
+    # Pantry search (see services/pantry_index.py); larger inputs go to SQL
+    pantry_refresh_seconds: float = 60.0
+    pantry_rebuild_seconds: float = 1800.0
+    pantry_staple_fraction: float = 0.05
+    pantry_index_max_ids: int = 64
+
+    # Category catalog (see services/category_catalog.py) and its HTTP caching
+    category_catalog_check_seconds: float = 60.0
+    category_catalog_counts_seconds: float = 3600.0
+    categories_max_age: int = 86400
+    categories_stale_while_revalidate: int = 604800
+
+    # Co-view recommendations (see services/coview.py), rebuilt nightly
+    recommendations_window_days: int = 180
+    recommendations_top_k: int = 20
+    recommendations_min_score: float = 0.05
+    recommendations_chunk_rows: int = 500000
+    recommendations_max_items_per_user: int = 1000
+
+    # Related recipes by ingredient overlap (see services/minhash.py). Changing
+    # num_perm, bands or seed requires recomputing every stored signature.
+    minhash_num_perm: int = 128
+    minhash_bands: int = 32
+    minhash_seed: int = 1
+    minhash_batch_size: int = 1000
+    related_max_candidates: int = 200
+    related_min_similarity: float = 0.2
+
+    # Recipes per server-side cursor fetch in the NDJSON export
+    export_chunk_size: int = 500
+    # Incremental exports start this far before `updated_since`: updated_at is
+    # the transaction start, so an edit can commit after a later watermark
+    export_overlap_seconds: int = 300
+    # Deletion tombstones are kept this long; older `updated_since` values
+    # get 410 and the mirror has to take a full export
+    export_tombstone_retention_days: int = 30
+
+    # Bulk JSONL import (see services/recipe_import.py): recipes per
+    # transaction, and how many per-line errors the report lists
+    import_chunk_size: int = 1000
+    import_max_errors: int = 1000
+    # Users allowed on /admin endpoints, e.g. ADMIN_USER_IDS=[1,2]
+    admin_user_ids: list[int] = []
+
     class Config:
         env_file = [".env", "../.env"]
         extra = "forbid"
@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.v1.users import router as users_router
@@ -5,8 +6,27 @@ from app.api.v1.auth import router as auth_router
 from app.api.v1.recipes import router as recipes_router
 from app.api.v1.media import router as media_router
 from app.api.v1.share import router as share_router
+from app.api.v1.categories import router as categories_router
+from app.api.v1.admin import router as admin_router
+from app.services.view_buffer import view_buffer
+from app.services.suggest_index import suggest_index
+from app.services.pantry_index import pantry_index
+from app.services.category_catalog import category_catalog
 
-app = FastAPI(title="Recipe App API")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    view_buffer.start()
+    suggest_index.start()
+    pantry_index.start()
+    category_catalog.start()
+    yield
+    await category_catalog.stop()
+    await pantry_index.stop()
+    await suggest_index.stop()
+    # Flush buffered view events before the worker exits
+    await view_buffer.stop()
+
+app = FastAPI(title="Recipe App API", lifespan=lifespan)
 
 origins = [
     "http://localhost:5173",
@@ -27,3 +47,5 @@ app.include_router(auth_router) # auth_router already has prefix /auth
 app.include_router(recipes_router, prefix="/recipes", tags=["Recipes"])
 app.include_router(media_router) # media_router already has prefix /media
 app.include_router(share_router)
+app.include_router(categories_router, prefix="/categories", tags=["Categories"])
+app.include_router(admin_router, prefix="/admin", tags=["Admin"])
@@ -13,3 +13,8 @@ from .saved_recipe import UserSavedRecipe
 from .recipe_like import RecipeLike
 from .recipe_view import UserRecipeView
 from .recipe_media import RecipeMedia
+from .recipe_stats import RecipeStats
+from .recipe_trending import RecipeTrending
+from .recipe_recommendation import RecipeRecommendation
+from .recipe_minhash import RecipeMinhash, RecipeLshBucket
+from .recipe_tombstone import RecipeTombstone
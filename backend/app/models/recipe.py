@@ -2,14 +2,20 @@ import uuid
 import enum
 from sqlalchemy import (
     Column, BigInteger, Text, Integer, Boolean,
-    ForeignKey, Index, text, Enum
+    ForeignKey, Index, Enum, Computed, text
 )
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
-from sqlalchemy.schema import FetchedValue
 from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
 from app.core.db import Base, TimestampMixin
 
+# Name outranks description, which outranks the chef's note (ts_rank_cd weights A > B > C)
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(chefs_note, '')), 'C')"
+)
+
+
 class RecipeStatus(str, enum.Enum):
     draft = "draft"
     published = "published"
@@ -28,15 +34,6 @@ class Recipe(Base, TimestampMixin):
 
         Index('idx_recipes_search_vector', 'search_vector', postgresql_using='gin'),
 
-        Index(
-            'idx_recipes_name_desc_fts',
-            func.to_tsvector(
-                text("'english'"),
-                text("coalesce(name, '') || ' ' || coalesce(description, '') || ' ' || coalesce(chefs_note, '')")
-            ),
-            postgresql_using='gin'
-        ),
-
         Index(
             'idx_recipes_name_trgm',
             'name',
@@ -55,6 +52,14 @@ class Recipe(Base, TimestampMixin):
         Index('idx_recipes_uuid', 'uuid', unique=True),
         Index('idx_recipes_status', 'status'),
         Index('idx_recipes_user_public', 'user_id', 'is_public'),
+
+        # Keyset pagination on the (created_at, id) sort tuple
+        Index('idx_recipes_created_id', 'created_at', 'id'),
+
+        # Incremental NDJSON export walks public recipes in (updated_at, id) order
+        Index('idx_recipes_public_updated_id', 'updated_at', 'id', postgresql_where=text('is_public')),
+        # MinHash refresh reads every recipe changed since its watermark
+        Index('idx_recipes_updated_id', 'updated_at', 'id'),
     )
 
     # EXISTING PRIMARY KEY (UNCHANGED)
@@ -87,7 +92,7 @@ class Recipe(Base, TimestampMixin):
 
     author = relationship("User", back_populates="recipes")
 
-    search_vector = Column(TSVECTOR, FetchedValue())
+    search_vector = Column(TSVECTOR, Computed(SEARCH_VECTOR_EXPRESSION, persisted=True))
 
     # EXISTING RELATIONSHIPS (UNCHANGED)
     ingredients = relationship(
@@ -5,7 +5,8 @@ class RecipeCategory(Base, TimestampMixin):
     __tablename__ = "recipe_categories"
 
     __table_args__ = (
-        Index('idx_recipe_categories_category', 'category_id'),
+        # Category-side lookups; covers the semi-join probes without touching the heap
+        Index('idx_recipe_categories_category_recipe', 'category_id', 'recipe_id'),
     )
 
     recipe_id = Column(
@@ -9,4 +9,6 @@ class RecipeLike(Base, TimestampMixin):
 
     __table_args__ = (
         Index('idx_recipe_likes_recipe', 'recipe_id'),
+        Index('idx_recipe_likes_user_created', 'user_id', 'created_at', 'recipe_id'),
+        Index('idx_recipe_likes_created', 'created_at'),
     )
@@ -0,0 +1,38 @@
+from sqlalchemy import Column, BigInteger, SmallInteger, Integer, ForeignKey, Index, TIMESTAMP
+from sqlalchemy.dialects.postgresql import ARRAY
+from app.core.db import Base, TimestampMixin
+
+class RecipeMinhash(Base, TimestampMixin):
+    """MinHash signature of a recipe's ingredient set (see services/minhash.py)."""
+    __tablename__ = "recipe_minhashes"
+
+    __table_args__ = (
+        # max(source_updated_at) is the refresh watermark
+        Index('idx_recipe_minhashes_source_updated_at', 'source_updated_at'),
+    )
+
+    recipe_id = Column(
+        BigInteger,
+        ForeignKey("recipes.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    signature = Column(ARRAY(Integer), nullable=False)
+    # Recipe.updated_at the signature was computed from; a mismatch marks it stale
+    source_updated_at = Column(TIMESTAMP(timezone=True), nullable=True)
+
+
+class RecipeLshBucket(Base):
+    """One row per (band, bucket) a public recipe's signature hashes into."""
+    __tablename__ = "recipe_lsh_buckets"
+
+    __table_args__ = (
+        Index('idx_recipe_lsh_buckets_recipe', 'recipe_id'),
+    )
+
+    band = Column(SmallInteger, primary_key=True)
+    bucket = Column(BigInteger, primary_key=True)
+    recipe_id = Column(
+        BigInteger,
+        ForeignKey("recipes.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
@@ -0,0 +1,26 @@
+from sqlalchemy import Column, BigInteger, SmallInteger, Float, ForeignKey, Index
+from app.core.db import Base, TimestampMixin
+
+class RecipeRecommendation(Base, TimestampMixin):
+    """Top-K co-viewed neighbours per recipe, rebuilt nightly by services/coview.py."""
+    __tablename__ = "recipe_recommendations"
+
+    __table_args__ = (
+        # Lets the ON DELETE CASCADE from a removed neighbour avoid a full scan
+        Index('idx_recipe_recommendations_related', 'related_recipe_id'),
+    )
+
+    # (recipe_id, rank) keeps a recipe's neighbours adjacent and in order, so
+    # serving them is a single primary key range scan
+    recipe_id = Column(
+        BigInteger,
+        ForeignKey("recipes.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    rank = Column(SmallInteger, primary_key=True)
+    related_recipe_id = Column(
+        BigInteger,
+        ForeignKey("recipes.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    score = Column(Float, nullable=False)
@@ -0,0 +1,20 @@
+from sqlalchemy import Column, BigInteger, ForeignKey, Index
+from app.core.db import Base, TimestampMixin
+
+class RecipeStats(Base, TimestampMixin):
+    """Denormalized per-recipe counters, kept in step with the event tables."""
+    __tablename__ = "recipe_stats"
+
+    __table_args__ = (
+        Index('idx_recipe_stats_likes', 'likes_count', 'recipe_id'),
+        Index('idx_recipe_stats_views', 'views_count', 'recipe_id'),
+    )
+
+    recipe_id = Column(
+        BigInteger,
+        ForeignKey("recipes.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    likes_count = Column(BigInteger, nullable=False, default=0, server_default="0")
+    views_count = Column(BigInteger, nullable=False, default=0, server_default="0")
+    saves_count = Column(BigInteger, nullable=False, default=0, server_default="0")
@@ -13,7 +13,9 @@ class RecipeStep(Base, TimestampMixin):
     __table_args__ = (
         Index('idx_recipe_steps_recipe', 'recipe_id'),
         Index('idx_recipe_steps_recipe_number', 'recipe_id', 'step_number'),
-        UniqueConstraint('recipe_id', 'step_number', name='uq_recipe_step'),
+        # Deferrable so an in-place renumbering (e.g. swapping two steps) can be
+        # checked at commit instead of row by row
+        UniqueConstraint('recipe_id', 'step_number', name='uq_recipe_step', deferrable=True),
     )
 
     id = Column(BigInteger, primary_key=True)
@@ -0,0 +1,14 @@
+from sqlalchemy import Column, BigInteger, Index, TIMESTAMP, text
+from app.core.db import Base
+
+class RecipeTombstone(Base):
+    """Id of a deleted recipe, so incremental exports can tell mirrors to drop it."""
+    __tablename__ = "recipe_tombstones"
+
+    __table_args__ = (
+        Index('idx_recipe_tombstones_deleted_at', 'deleted_at'),
+    )
+
+    # No foreign key: the recipe row is gone
+    recipe_id = Column(BigInteger, primary_key=True)
+    deleted_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=text("now()"))
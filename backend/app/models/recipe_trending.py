@@ -0,0 +1,22 @@
+from sqlalchemy import Column, BigInteger, Float, ForeignKey, Index, TIMESTAMP, text
+from app.core.db import Base, TimestampMixin
+
+class RecipeTrending(Base, TimestampMixin):
+    """Time-decayed activity score per recipe, refreshed by a background job."""
+    __tablename__ = "recipe_trending"
+
+    __table_args__ = (
+        Index('idx_recipe_trending_score', 'score', 'recipe_id'),
+    )
+
+    recipe_id = Column(
+        BigInteger,
+        ForeignKey("recipes.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    score = Column(Float, nullable=False, default=0, server_default="0")
+    # Part of `score` from events older than the overlap window; only this
+    # part is carried over (decayed) between refreshes
+    settled_score = Column(Float, nullable=False, default=0, server_default="0")
+    # Instant the score was last decayed to; the refresh watermark
+    scored_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=text("now()"))
@@ -11,4 +11,6 @@ class UserRecipeView(Base, TimestampMixin):
     __table_args__ = (
         Index('idx_views_recipe', 'recipe_id'),
         Index('idx_views_user', 'user_id'),
+        Index('idx_views_user_recipe_viewed', 'user_id', 'recipe_id', 'viewed_at'),
+        Index('idx_views_viewed_at', 'viewed_at'),
     )
@@ -9,4 +9,6 @@ class UserSavedRecipe(Base, TimestampMixin):
 
     __table_args__ = (
         Index('idx_saved_recipes_recipe', 'recipe_id'),
+        Index('idx_saved_recipes_user_saved', 'user_id', 'saved_at', 'recipe_id'),
+        Index('idx_saved_recipes_saved_at', 'saved_at'),
     )
@@ -0,0 +1,17 @@
+from typing import List, Optional
+from pydantic import BaseModel
+
+
+class CategoryRead(BaseModel):
+    id: int
+    name: str
+    description: Optional[str] = None
+    # Public recipes only; refreshed periodically, so approximate
+    recipe_count: int = 0
+
+
+class CategoryGroupRead(BaseModel):
+    id: int
+    name: str
+    description: Optional[str] = None
+    categories: List[CategoryRead] = []
@@ -9,6 +9,12 @@ class IngredientCreate(BaseModel):
     preparation_notes: Optional[str] = None
     display_order: int = 0
 
+class IngredientUpdate(IngredientCreate):
+    id: Optional[int] = None # Existing row to keep; omitted for new rows
+
+class IngredientImport(IngredientCreate):
+    unit: Optional[str] = None # Unit name or symbol, resolved on import
+
 class IngredientRead(IngredientCreate):
     id: int
     ingredient_id: Optional[int] = None
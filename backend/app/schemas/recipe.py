@@ -1,7 +1,7 @@
 from typing import List, Optional
 from pydantic import BaseModel, Field
-from .ingredient import IngredientCreate, IngredientRead
-from .step import StepCreate, StepRead
+from .ingredient import IngredientCreate, IngredientImport, IngredientRead, IngredientUpdate
+from .step import StepCreate, StepRead, StepUpdate
 from .media import RecipeMediaRead
 
 class RecipeCreate(BaseModel):
@@ -26,6 +26,20 @@ class RecipeUpdate(BaseModel):
     ingredients: Optional[List[IngredientCreate]] = None
     steps: Optional[List[StepCreate]] = None
 
+class RecipeImportRow(RecipeCreate):
+    """One line of a bulk JSONL import."""
+    user_id: Optional[int] = None # Falls back to the importer's default owner
+    ingredients: List[IngredientImport]
+
+class RecipeImportError(BaseModel):
+    line: int
+    error: str
+
+class RecipeImportReport(BaseModel):
+    imported: int = 0
+    failed: int = 0
+    errors: List[RecipeImportError] = [] # Capped at settings.import_max_errors
+
 class RecipeRead(BaseModel):
     id: int
     name: str
@@ -49,12 +63,19 @@ class RecipeRead(BaseModel):
         from_attributes = True
 
 class RecipeListItem(BaseModel):
+    """Card projection used by the discovery feed (`GET /recipes?view=card`)."""
     id: int
     name: str
     description: Optional[str]
     cook_time_minutes: Optional[int]
     servings: Optional[int]
     is_public: bool
+    author_name: Optional[str] = None
+    primary_media: Optional[RecipeMediaRead] = None
+    is_liked: bool = False
+    is_saved: bool = False
+    likes_count: int = 0
+    views_count: int = 0
 
     class Config:
         from_attributes = True
@@ -66,11 +87,70 @@ class PaginatedRecipeList(BaseModel):
     total: int
     items: List[RecipeListItem]
 
+class CategoryFacet(BaseModel):
+    id: int
+    count: int
+
+class CookTimeFacet(BaseModel):
+    bucket: str
+    count: int
+
+class RecipeFacets(BaseModel):
+    categories: List[CategoryFacet]
+    cook_time: List[CookTimeFacet]
+
 class PaginatedRecipes(BaseModel):
-    total: int
+    total: Optional[int] = None
+    total_is_exact: bool = True
     page: int
     per_page: int
     recipes: List[RecipeRead]
+    next_cursor: Optional[str] = None
+    facets: Optional[RecipeFacets] = None
+
+class PaginatedRecipeCards(BaseModel):
+    total: Optional[int] = None
+    total_is_exact: bool = True
+    page: int
+    per_page: int
+    recipes: List[RecipeListItem]
+    next_cursor: Optional[str] = None
+    facets: Optional[RecipeFacets] = None
+
+class PantrySearchRequest(BaseModel):
+    ingredient_ids: List[int] = []
+    ingredients: List[str] = [] # Free-text names, resolved through names and aliases
+    limit: int = Field(20, ge=1, le=100)
+    min_coverage: float = Field(0.0, ge=0, le=1)
+
+class PantryMatch(BaseModel):
+    recipe: RecipeListItem
+    coverage: float
+    matched: int
+    required: int
+
+class PantrySearchResponse(BaseModel):
+    ingredient_ids: List[int]
+    matches: List[PantryMatch]
+
+class Suggestion(BaseModel):
+    text: str
+    kind: str # recipe | ingredient | category
+    id: int
+
+MAX_INTERACTION_IDS = 300
+MAX_BATCH_IDS = 100
+
+class RecipeInteractionsRequest(BaseModel):
+    recipe_ids: List[int] = Field(..., min_length=1, max_length=MAX_INTERACTION_IDS)
+
+class RecipeInteraction(BaseModel):
+    recipe_id: int
+    is_liked: bool = False
+    is_saved: bool = False
+    likes_count: int = 0
+    views_count: int = 0
+    saves_count: int = 0
 
 class RecipeMediaCreate(BaseModel):
     id: Optional[int] = None # For updates
@@ -100,6 +180,8 @@ class RecipeUpdate(BaseModel):
     servings: Optional[int] = None
     is_public: Optional[bool] = None
     category_ids: Optional[List[int]] = Field(None, alias="categories")
-    ingredients: Optional[List[IngredientCreate]] = None
-    steps: Optional[List[StepCreate]] = None
+    # Diffed by id against the stored rows: rows without an id are added,
+    # stored rows left out are deleted, only changed rows are rewritten
+    ingredients: Optional[List[IngredientUpdate]] = None
+    steps: Optional[List[StepUpdate]] = None
     media: Optional[List[RecipeMediaCreate]] = None
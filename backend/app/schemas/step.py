@@ -6,6 +6,9 @@ class StepCreate(BaseModel):
     instruction: str
     estimated_minutes: Optional[int] = None
 
+class StepUpdate(StepCreate):
+    id: Optional[int] = None # Existing row to keep; omitted for new rows
+
 class StepRead(StepCreate):
     id: int
 
@@ -0,0 +1,53 @@
+"""
+Streams every public recipe as NDJSON (same format as GET /recipes/export).
+
+Usage (from backend/):
+    python -m app.scripts.export_recipes --output recipes.ndjson
+    python -m app.scripts.export_recipes --updated-since 2026-10-01T00:00:00+00:00 > delta.ndjson
+
+The latest updated_at written is printed to stderr; pass it as --updated-since
+on the next run to export only what changed. Incremental runs re-send a short
+overlap and end with {"id", "deleted": true} lines for removed recipes. A
+--updated-since older than EXPORT_TOMBSTONE_RETENTION_DAYS is refused, since
+deletions before then are no longer on record.
+"""
+import argparse
+import asyncio
+import sys
+from datetime import datetime
+import orjson
+
+from app.core.db import engine
+from app.services.recipe_export import iter_public_recipes, requires_full_export
+
+
+async def export(output, updated_since):
+    count, last_updated = 0, None
+    try:
+        async for item in iter_public_recipes(updated_since):
+            output.write(orjson.dumps(item) + b"\n")
+            count += 1
+            # Tombstones come after the recipes, so take the max
+            if last_updated is None or item["updated_at"] > last_updated:
+                last_updated = item["updated_at"]
+    finally:
+        await engine.dispose()
+
+    print(f"Exported {count} recipes.", file=sys.stderr)
+    if last_updated is not None:
+        print(f"Next --updated-since: {last_updated.isoformat()}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--updated-since", type=datetime.fromisoformat, default=None)
+    parser.add_argument("--output", default="-", help="File to write, '-' for stdout")
+    args = parser.parse_args()
+    if args.updated_since is not None and requires_full_export(args.updated_since):
+        parser.error("--updated-since is older than the tombstone retention; run a full export")
+
+    if args.output == "-":
+        asyncio.run(export(sys.stdout.buffer, args.updated_since))
+    else:
+        with open(args.output, "wb") as f:
+            asyncio.run(export(f, args.updated_since))
@@ -0,0 +1,60 @@
+"""
+Bulk-loads recipes from JSONL (same format as POST /admin/recipes/import).
+
+Usage (from backend/):
+    python -m app.scripts.import_recipes recipes.jsonl --user-id 1
+    python -m app.scripts.import_recipes - --chunk-size 2000 < recipes.jsonl
+
+Each line is a recipe with `categories` (ids), `ingredients` (with an
+optional `unit` name or symbol) and `steps`; `user_id` on a line overrides
+--user-id. Failed lines are listed on stderr; everything else is imported.
+"""
+import argparse
+import asyncio
+import sys
+import time
+
+from app.core.db import async_session, engine
+from app.services.recipe_import import import_recipes
+
+
+async def read_lines(f):
+    for line in f:
+        yield line
+
+
+async def run(f, user_id, chunk_size):
+    # Echoing every statement costs more than the inserts themselves here
+    engine.sync_engine.echo = False
+    started = time.perf_counter()
+    try:
+        async with async_session() as db:
+            report = await import_recipes(db, read_lines(f), user_id, chunk_size)
+    finally:
+        await engine.dispose()
+    elapsed = time.perf_counter() - started
+
+    for err in report.errors:
+        print(f"line {err.line}: {err.error}", file=sys.stderr)
+    if report.failed > len(report.errors):
+        print(f"... and {report.failed - len(report.errors)} more errors", file=sys.stderr)
+    rate = report.imported / elapsed if elapsed else 0
+    print(
+        f"Imported {report.imported} recipes, {report.failed} failed "
+        f"in {elapsed:.1f}s ({rate:.0f} recipes/s).",
+        file=sys.stderr,
+    )
+    return 1 if report.failed else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("input", help="JSONL file, '-' for stdin")
+    parser.add_argument("--user-id", type=int, default=None, help="Owner for lines without user_id")
+    parser.add_argument("--chunk-size", type=int, default=None, help="Recipes per transaction")
+    args = parser.parse_args()
+
+    if args.input == "-":
+        sys.exit(asyncio.run(run(sys.stdin.buffer, args.user_id, args.chunk_size)))
+    with open(args.input, "rb") as f:
+        sys.exit(asyncio.run(run(f, args.user_id, args.chunk_size)))
@@ -12,6 +12,7 @@ from app.models.user import User
 from app.models.ingredient import Ingredient  # Ensure this model exists
 from app.models.recipe_ingredient import RecipeIngredient
 from app.models.recipe_step import RecipeStep
+from app.models.recipe_stats import RecipeStats
 
 fake = Faker()
 
@@ -79,6 +80,7 @@ async def seed():
             recipes.append(recipe)
         session.add_all(recipes)
         await session.flush()
+        session.add_all([RecipeStats(recipe_id=recipe.id) for recipe in recipes])
 
         # 6. Assign categories to recipes
         for recipe in recipes:
@@ -0,0 +1,121 @@
+import asyncio
+import logging
+import time
+from typing import Optional
+from sqlalchemy import select, func, union_all
+from sqlalchemy.exc import SQLAlchemyError
+from app.core.db import async_session
+from app.core.config import settings
+from app.models.category import Category
+from app.models.category_group import CategoryGroup
+from app.models.recipe import Recipe
+from app.models.recipe_category import RecipeCategory
+from app.utils.http_cache import make_etag
+
+logger = logging.getLogger(__name__)
+
+
+class CategoryCatalog:
+    """
+    In-process copy of the category groups, their categories and public
+    recipe counts, served by GET /categories without touching the database.
+
+    A background loop compares a cheap signature of both tables (row count
+    and latest updated_at) every `check_seconds` and reloads when it moves,
+    so renames, additions and deletions made by other processes (seed
+    scripts, admin edits) show up within one interval. Recipe counts are
+    only approximate and are recomputed every `counts_refresh_seconds`.
+    """
+
+    def __init__(self, check_seconds: float, counts_refresh_seconds: float):
+        self.check_seconds = check_seconds
+        self.counts_refresh_seconds = counts_refresh_seconds
+        self.groups: list[dict] = []
+        self.etag: Optional[str] = None
+        self._signature: Optional[tuple] = None
+        self._loaded_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+        self._loop_task: Optional[asyncio.Task] = None
+
+    @property
+    def ready(self) -> bool:
+        return self._loaded_at is not None
+
+    async def _current_signature(self, db) -> tuple:
+        stamps = union_all(
+            select(func.count().label("n"), func.max(CategoryGroup.updated_at).label("at")),
+            select(func.count(), func.max(Category.updated_at)),
+        )
+        return tuple((await db.execute(stamps)).all())
+
+    async def _load(self, db) -> list[dict]:
+        counts = dict((await db.execute(
+            select(RecipeCategory.category_id, func.count())
+            .join(Recipe, Recipe.id == RecipeCategory.recipe_id)
+            .where(Recipe.is_public == True)
+            .group_by(RecipeCategory.category_id)
+        )).all())
+
+        categories: dict[int, list[dict]] = {}
+        result = await db.execute(select(Category).order_by(Category.group_id, Category.name))
+        for c in result.scalars().all():
+            categories.setdefault(c.group_id, []).append({
+                "id": c.id,
+                "name": c.name,
+                "description": c.description,
+                "recipe_count": counts.get(c.id, 0),
+            })
+
+        result = await db.execute(select(CategoryGroup).order_by(CategoryGroup.id))
+        return [
+            {
+                "id": g.id,
+                "name": g.name,
+                "description": g.description,
+                "categories": categories.get(g.id, []),
+            }
+            for g in result.scalars().all()
+        ]
+
+    async def refresh(self, force: bool = False) -> bool:
+        """Reloads when the tables changed or the counts are stale. Returns True if it reloaded."""
+        async with self._lock:
+            async with async_session() as db:
+                signature = await self._current_signature(db)
+                stale = not self.ready or time.monotonic() - self._loaded_at >= self.counts_refresh_seconds
+                if not (force or stale or signature != self._signature):
+                    return False
+
+                self.groups = await self._load(db)
+            self.etag = make_etag(self.groups)
+            self._signature = signature
+            self._loaded_at = time.monotonic()
+            return True
+
+    async def _run(self):
+        # Warm right away so the first app launch after a deploy is served from memory
+        while True:
+            try:
+                await self.refresh()
+            except SQLAlchemyError:
+                logger.exception("Category catalog refresh failed")
+            await asyncio.sleep(self.check_seconds)
+
+    def start(self):
+        if self._loop_task is None:
+            self._loop_task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._loop_task is not None:
+            self._loop_task.cancel()
+            try:
+                await self._loop_task
+            except asyncio.CancelledError:
+                pass
+            self._loop_task = None
+
+
+category_catalog = CategoryCatalog(
+    check_seconds=settings.category_catalog_check_seconds,
+    counts_refresh_seconds=settings.category_catalog_counts_seconds,
+)
@@ -0,0 +1,157 @@
+import logging
+from datetime import timedelta
+from typing import Iterator, Optional
+import numpy as np
+from scipy import sparse
+from sqlalchemy import select, delete, insert, func, literal, union_all, Float
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.models.recipe import Recipe
+from app.models.recipe_like import RecipeLike
+from app.models.recipe_recommendation import RecipeRecommendation
+from app.models.recipe_view import UserRecipeView
+from app.models.saved_recipe import UserSavedRecipe
+
+logger = logging.getLogger(__name__)
+
+INSERT_CHUNK = 10000
+
+
+def _user_item_weights(since):
+    """(user_id, recipe_id, weight) per pair, ordered by user so a user's rows arrive together."""
+    def events(model, at_col, weight):
+        return select(
+            model.user_id.label("user_id"),
+            model.recipe_id.label("recipe_id"),
+            literal(weight, Float).label("weight"),
+        ).where(at_col > since, model.user_id.is_not(None), model.recipe_id.is_not(None))
+
+    # Same event weights as the trending score
+    e = union_all(
+        events(RecipeLike, RecipeLike.created_at, settings.trending_like_weight),
+        events(UserRecipeView, UserRecipeView.viewed_at, settings.trending_view_weight),
+        events(UserSavedRecipe, UserSavedRecipe.saved_at, settings.trending_save_weight),
+    ).subquery()
+    return (
+        select(e.c.user_id, e.c.recipe_id, func.sum(e.c.weight))
+        .group_by(e.c.user_id, e.c.recipe_id)
+        .order_by(e.c.user_id)
+    )
+
+
+def cooccurrence(
+    users: np.ndarray,
+    recipes: np.ndarray,
+    weights: np.ndarray,
+    recipe_ids: np.ndarray,
+    max_items_per_user: int,
+) -> sparse.csr_matrix:
+    """
+    X^T X for one block of whole users, X being the users x recipes matrix of
+    log-damped interaction weights. Columns follow the sorted `recipe_ids`;
+    pairs on recipes outside it are dropped, and so are users with more than
+    `max_items_per_user` recipes (crawlers), whose cost grows quadratically.
+    """
+    n_items = len(recipe_ids)
+    cols = np.searchsorted(recipe_ids, recipes)
+    known = cols < n_items
+    known[known] = recipe_ids[cols[known]] == recipes[known]
+    users, cols, weights = users[known], cols[known], weights[known]
+
+    _, rows = np.unique(users, return_inverse=True)
+    keep = (np.bincount(rows) <= max_items_per_user)[rows]
+    rows, cols, weights = rows[keep], cols[keep], weights[keep]
+    if not len(rows):
+        return sparse.csr_matrix((n_items, n_items), dtype=np.float32)
+
+    x = sparse.csr_matrix(
+        (np.log1p(weights).astype(np.float32), (rows, cols)),
+        shape=(int(rows.max()) + 1, n_items),
+    )
+    return (x.T @ x).tocsr()
+
+
+def top_neighbours(gram: sparse.csr_matrix, k: int, min_score: float) -> Iterator[tuple[int, np.ndarray, np.ndarray]]:
+    """Yields (row, neighbour columns, cosine scores) per item, best first, from the accumulated X^T X."""
+    norms = np.sqrt(gram.diagonal())
+    inverse = np.divide(1.0, norms, out=np.zeros_like(norms), where=norms > 0)
+    scaled = sparse.diags(inverse) @ gram @ sparse.diags(inverse)
+    scaled = (scaled - sparse.diags(scaled.diagonal())).tocsr()
+    scaled.data[scaled.data < min_score] = 0
+    scaled.eliminate_zeros()
+
+    indptr, indices, data = scaled.indptr, scaled.indices, scaled.data
+    for row in np.flatnonzero(np.diff(indptr)):
+        start, end = indptr[row], indptr[row + 1]
+        scores = data[start:end]
+        best = np.argpartition(-scores, k)[:k] if len(scores) > k else np.arange(len(scores))
+        best = best[np.argsort(-scores[best], kind="stable")]
+        yield int(row), indices[start:end][best], scores[best]
+
+
+async def rebuild_recommendations(db: AsyncSession, chunk_rows: Optional[int] = None) -> int:
+    """
+    Recomputes recipe_recommendations from views, likes and saves in the
+    recommendation window: top-K item-item cosine neighbours over the
+    user x recipe matrix.
+
+    Aggregated (user, recipe) pairs are streamed from a server-side cursor
+    in blocks of about `chunk_rows`; each block is cut at a user boundary and
+    folded into the recipes x recipes Gram matrix, so memory is bounded by
+    one block plus the co-occurrence matrix, never by the event log.
+    The table is swapped inside the caller's transaction, so readers keep the
+    previous neighbours until commit. Returns the number of recipes with
+    neighbours.
+    """
+    chunk_rows = chunk_rows or settings.recommendations_chunk_rows
+    recipe_ids = np.array(
+        (await db.execute(select(Recipe.id).where(Recipe.is_public == True).order_by(Recipe.id))).scalars().all(),
+        dtype=np.int64,
+    )
+    n_items = len(recipe_ids)
+
+    now = (await db.execute(select(func.now()))).scalar_one()
+    since = now - timedelta(days=settings.recommendations_window_days)
+
+    gram = sparse.csr_matrix((n_items, n_items), dtype=np.float32)
+    pending = np.empty((0, 3))
+    pairs = 0
+
+    def fold(block: np.ndarray):
+        nonlocal gram
+        gram = gram + cooccurrence(
+            block[:, 0].astype(np.int64), block[:, 1].astype(np.int64), block[:, 2],
+            recipe_ids, settings.recommendations_max_items_per_user,
+        )
+
+    result = await db.stream(_user_item_weights(since).execution_options(yield_per=chunk_rows))
+    async for rows in result.partitions(chunk_rows):
+        block = np.concatenate([pending, np.array(rows, dtype=np.float64)])
+        pairs += len(rows)
+        # The last user may continue in the next partition; carry them over
+        cut = np.searchsorted(block[:, 0], block[-1, 0])
+        if cut == 0:
+            pending = block
+            continue
+        fold(block[:cut])
+        pending = block[cut:]
+    if len(pending):
+        fold(pending)
+
+    logger.info("Co-view matrix: %d pairs, %d recipes, %d co-occurrences", pairs, n_items, gram.nnz)
+
+    await db.execute(delete(RecipeRecommendation))
+    batch, recommended = [], 0
+    for row, neighbours, scores in top_neighbours(gram, settings.recommendations_top_k, settings.recommendations_min_score):
+        recommended += 1
+        recipe_id = int(recipe_ids[row])
+        batch.extend(
+            {"recipe_id": recipe_id, "rank": rank, "related_recipe_id": int(recipe_ids[col]), "score": float(score)}
+            for rank, (col, score) in enumerate(zip(neighbours, scores), start=1)
+        )
+        if len(batch) >= INSERT_CHUNK:
+            await db.execute(insert(RecipeRecommendation), batch)
+            batch = []
+    if batch:
+        await db.execute(insert(RecipeRecommendation), batch)
+    return recommended
@@ -1,3 +1,9 @@
+from typing import Iterable
+from sqlalchemy import select, func, literal
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.ingredient import Ingredient, IngredientAlias
+
+
 async def mock_match_ingredient(name: str) -> int | None:
     canonical = {
         "salt": 1,
@@ -5,3 +11,25 @@ async def mock_match_ingredient(name: str) -> int | None:
         "butter": 3,
     }
     return canonical.get(name.lower())
+
+
+async def match_ingredient_names(db: AsyncSession, names: Iterable[str]) -> dict[str, int]:
+    """
+    Canonical ingredient id per lower-cased name, through ingredient names and
+    aliases (lower() indexes), in one query. A name wins over an alias.
+    """
+    names = {n.strip().lower() for n in names if n and n.strip()}
+    if not names:
+        return {}
+    result = await db.execute(
+        select(func.lower(Ingredient.name), Ingredient.id, literal(0).label("priority"))
+        .where(func.lower(Ingredient.name).in_(names))
+        .union_all(
+            select(func.lower(IngredientAlias.alias_text), IngredientAlias.canonical_ingredient_id, literal(1))
+            .where(func.lower(IngredientAlias.alias_text).in_(names))
+        )
+    )
+    matches: dict[str, int] = {}
+    for name, ingredient_id, _ in sorted(result.all(), key=lambda row: -row[2]):
+        matches[name] = ingredient_id
+    return matches
@@ -1,8 +1,10 @@
 import io
 import requests
 from PIL import Image
+from sqlalchemy import update, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.db import async_session
+from app.models.recipe import Recipe
 from app.models.recipe_media import RecipeMedia
 from app.services.image_processing import generate_thumbnail
 from app.services.video_thumbnails import generate_video_thumbnails
@@ -60,4 +62,8 @@ async def process_recipe_media(
 
         except (OSError, ValueError, RuntimeError, requests.RequestException) as e:
             media.processing_error = str(e)
+        if media.recipe_id:
+            # Media lives in its own table; bump the recipe so the export and
+            # anything else keyed on updated_at picks up the new URLs
+            await db.execute(update(Recipe).where(Recipe.id == media.recipe_id).values(updated_at=func.now()))
         await db.commit()
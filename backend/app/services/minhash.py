@@ -0,0 +1,170 @@
+import hashlib
+from functools import lru_cache
+from typing import Iterable, Optional
+import numpy as np
+from sqlalchemy import select, delete, insert, func, or_, and_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.models.recipe import Recipe
+from app.models.recipe_ingredient import RecipeIngredient
+from app.models.recipe_minhash import RecipeMinhash, RecipeLshBucket
+from app.utils.text import normalize
+from app.utils.watermarks import resume_from
+
+# Universal hashing (a * x + b) mod p over 31-bit element hashes; the
+# products stay below 2**62, so numpy uint64 arithmetic cannot overflow
+MERSENNE_PRIME = (1 << 31) - 1
+
+
+@lru_cache(maxsize=4)
+def _permutations(num_perm: int, seed: int) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+    b = rng.integers(0, MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+    return a, b
+
+
+def ingredient_token(ingredient_id: Optional[int], name_text: Optional[str]) -> Optional[str]:
+    """Matched ingredients compare by id, free-text ones by normalised name."""
+    if ingredient_id is not None:
+        return f"i:{ingredient_id}"
+    name = normalize(name_text or "")
+    return f"t:{name}" if name else None
+
+
+def _element_hash(token: str) -> int:
+    return int.from_bytes(hashlib.blake2b(token.encode(), digest_size=4).digest(), "little") % MERSENNE_PRIME
+
+
+def minhash_signature(tokens: Iterable[str], num_perm: Optional[int] = None, seed: Optional[int] = None) -> Optional[np.ndarray]:
+    """Per-permutation minimum over the token hashes; None for an empty set."""
+    elements = np.fromiter({_element_hash(t) for t in tokens}, dtype=np.uint64)
+    if not len(elements):
+        return None
+    a, b = _permutations(num_perm or settings.minhash_num_perm, settings.minhash_seed if seed is None else seed)
+    return ((np.outer(a, elements) + b[:, None]) % MERSENNE_PRIME).min(axis=1)
+
+
+def band_buckets(signature: np.ndarray, bands: Optional[int] = None) -> list[int]:
+    """One signed 64-bit bucket id per band; recipes sharing any bucket are candidates."""
+    bands = bands or settings.minhash_bands
+    rows = len(signature) // bands
+    return [
+        int.from_bytes(
+            hashlib.blake2b(signature[i * rows:(i + 1) * rows].astype("<u4").tobytes(), digest_size=8).digest(),
+            "little", signed=True,
+        )
+        for i in range(bands)
+    ]
+
+
+def estimated_jaccard(a, b) -> float:
+    return float(np.mean(np.asarray(a) == np.asarray(b)))
+
+
+async def refresh_minhashes(db: AsyncSession, limit: Optional[int] = None) -> int:
+    """
+    Recomputes signatures and LSH buckets for up to `limit` recipes that have
+    none yet or whose updated_at moved since (the recipe PATCH bumps it for
+    ingredient edits). Only public recipes get buckets, so private ones never
+    show up as someone else's related recipe. Returns the number processed.
+
+    Candidates are read oldest change first from the newest signature's
+    source_updated_at (less the refresh overlap) on the updated_at index,
+    so a run with nothing to do reads only the overlap window.
+    """
+    limit = limit or settings.minhash_batch_size
+    watermark = (await db.execute(select(func.max(RecipeMinhash.source_updated_at)))).scalar()
+    stmt = (
+        select(Recipe.id, Recipe.is_public, Recipe.updated_at)
+        .outerjoin(RecipeMinhash, RecipeMinhash.recipe_id == Recipe.id)
+        .where(or_(
+            RecipeMinhash.recipe_id.is_(None),
+            RecipeMinhash.source_updated_at.is_distinct_from(Recipe.updated_at),
+        ))
+        .order_by(Recipe.updated_at, Recipe.id)
+        .limit(limit)
+    )
+    if watermark is not None:
+        stmt = stmt.where(Recipe.updated_at >= resume_from(watermark))
+    stale = (await db.execute(stmt)).all()
+    if not stale:
+        return 0
+
+    ids = [recipe_id for recipe_id, _, _ in stale]
+    tokens: dict[int, set[str]] = {}
+    result = await db.execute(
+        select(RecipeIngredient.recipe_id, RecipeIngredient.ingredient_id, RecipeIngredient.name_text)
+        .where(RecipeIngredient.recipe_id.in_(ids))
+    )
+    for recipe_id, ingredient_id, name_text in result:
+        token = ingredient_token(ingredient_id, name_text)
+        if token:
+            tokens.setdefault(recipe_id, set()).add(token)
+
+    await db.execute(delete(RecipeLshBucket).where(RecipeLshBucket.recipe_id.in_(ids)))
+    signatures, buckets = [], []
+    for recipe_id, is_public, updated_at in stale:
+        signature = minhash_signature(tokens.get(recipe_id, ()))
+        signatures.append({
+            "recipe_id": recipe_id,
+            # Recipes without ingredients still get a row so they are not re-read every run
+            "signature": signature.tolist() if signature is not None else [],
+            "source_updated_at": updated_at,
+        })
+        if is_public and signature is not None:
+            buckets.extend(
+                {"band": band, "bucket": bucket, "recipe_id": recipe_id}
+                for band, bucket in enumerate(band_buckets(signature))
+            )
+
+    stmt = pg_insert(RecipeMinhash).values(signatures)
+    await db.execute(stmt.on_conflict_do_update(
+        index_elements=[RecipeMinhash.recipe_id],
+        set_={
+            "signature": stmt.excluded.signature,
+            "source_updated_at": stmt.excluded.source_updated_at,
+            "updated_at": func.now(),
+        },
+    ))
+    if buckets:
+        await db.execute(insert(RecipeLshBucket), buckets)
+    return len(stale)
+
+
+async def related_recipes(db: AsyncSession, recipe_id: int, limit: int) -> list[tuple[int, float]]:
+    """
+    Near neighbours by ingredient overlap as (recipe_id, estimated Jaccard),
+    best first. Candidates are the recipes sharing at least one LSH bucket
+    (an index range scan per band); only they are scored on their signatures.
+    """
+    mine = (await db.execute(
+        select(RecipeMinhash.signature).where(RecipeMinhash.recipe_id == recipe_id)
+    )).scalar()
+    if not mine:
+        return []
+
+    own = select(RecipeLshBucket.band, RecipeLshBucket.bucket).where(RecipeLshBucket.recipe_id == recipe_id).subquery()
+    candidates = (
+        select(RecipeLshBucket.recipe_id)
+        .join(own, and_(RecipeLshBucket.band == own.c.band, RecipeLshBucket.bucket == own.c.bucket))
+        .where(RecipeLshBucket.recipe_id != recipe_id)
+        .group_by(RecipeLshBucket.recipe_id)
+        # Sharing more bands means a higher expected similarity
+        .order_by(func.count().desc(), RecipeLshBucket.recipe_id)
+        .limit(settings.related_max_candidates)
+    )
+    result = await db.execute(
+        select(RecipeMinhash.recipe_id, RecipeMinhash.signature).where(RecipeMinhash.recipe_id.in_(candidates))
+    )
+
+    mine = np.asarray(mine)
+    scored = [
+        (other_id, estimated_jaccard(mine, signature))
+        for other_id, signature in result
+        if len(signature) == len(mine)
+    ]
+    scored = [(other_id, score) for other_id, score in scored if score >= settings.related_min_similarity]
+    scored.sort(key=lambda item: (-item[1], item[0]))
+    return scored[:limit]
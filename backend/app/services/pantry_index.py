@@ -0,0 +1,274 @@
+import asyncio
+import bisect
+import heapq
+import logging
+import time
+from array import array
+from collections import Counter
+from itertools import chain
+from operator import truediv
+from datetime import datetime
+from typing import Iterable, Optional
+from sqlalchemy import select, func, or_, cast, Float
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.db import async_session
+from app.core.config import settings
+from app.models.recipe import Recipe
+from app.models.recipe_ingredient import RecipeIngredient
+from app.services.ingredient_matcher import match_ingredient_names
+from app.utils.watermarks import resume_from
+
+logger = logging.getLogger(__name__)
+
+
+async def resolve_ingredient_ids(db: AsyncSession, names: Iterable[str]) -> set[int]:
+    """Canonical ingredient ids for free-text names, through names and aliases (lower() indexes)."""
+    return set((await match_ingredient_names(db, names)).values())
+
+
+def _required_count():
+    """Distinct canonical ingredients plus every unmatched line (it can never be covered)."""
+    return (
+        func.count(RecipeIngredient.ingredient_id.distinct())
+        + func.count().filter(RecipeIngredient.ingredient_id.is_(None))
+    )
+
+
+async def match_recipes_sql(
+    db: AsyncSession,
+    ingredient_ids: set[int],
+    limit: int,
+    min_coverage: float = 0.0,
+) -> list[tuple[int, int, int]]:
+    """
+    Same ranking as PantryIndex.match, computed in Postgres. Used for inputs
+    too large for the in-memory index and before the index is built.
+    """
+    if not ingredient_ids:
+        return []
+    ids = list(ingredient_ids)
+    candidates = select(RecipeIngredient.recipe_id).where(RecipeIngredient.ingredient_id.in_(ids))
+    matched = func.count(RecipeIngredient.ingredient_id.distinct()).filter(RecipeIngredient.ingredient_id.in_(ids))
+    required = _required_count()
+    coverage = cast(matched, Float) / required
+
+    stmt = (
+        select(RecipeIngredient.recipe_id, matched, required)
+        .join(Recipe, Recipe.id == RecipeIngredient.recipe_id)
+        .where(Recipe.is_public == True, RecipeIngredient.recipe_id.in_(candidates))
+        .group_by(RecipeIngredient.recipe_id)
+        .having(coverage >= min_coverage)
+        .order_by(coverage.desc(), matched.desc(), RecipeIngredient.recipe_id.desc())
+        .limit(limit)
+    )
+    return [tuple(row) for row in (await db.execute(stmt)).all()]
+
+
+class PantryIndex:
+    """
+    In-memory inverted index from canonical ingredient id to the sorted ids
+    of public recipes that use it (array('q') posting lists), plus the number
+    of ingredients each recipe requires.
+
+    Ingredients used by more than `staple_fraction` of recipes (salt, oil...)
+    are staples. Candidates come from the distinctive ingredients' posting
+    lists first, with staples only confirming them (checked against a cached
+    hash-set copy of their posting list). Staple postings are scanned for
+    further candidates only when a recipe reached through staples alone could
+    still make the top k, so the common query stays proportional to the
+    distinctive postings while the ranking matches match_recipes_sql.
+
+    The background loop reloads recipes whose updated_at moved past the
+    watermark (update_recipe bumps it on ingredient edits), re-reading a
+    short overlap for recipes that committed late; a periodic full
+    rebuild, done in a worker thread and swapped in, drops deleted recipes.
+    """
+
+    def __init__(self, refresh_seconds: float, rebuild_seconds: float, staple_fraction: float):
+        self.refresh_seconds = refresh_seconds
+        self.rebuild_seconds = rebuild_seconds
+        self.staple_fraction = staple_fraction
+        self._postings: dict[int, array] = {}
+        self._recipe_ingredients: dict[int, array] = {}
+        self._required: dict[int, int] = {}
+        self._staple_sets: dict[int, frozenset] = {}
+        self._watermark: Optional[datetime] = None
+        self._built_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+        self._loop_task: Optional[asyncio.Task] = None
+
+    @property
+    def ready(self) -> bool:
+        return self._built_at is not None
+
+    def match(
+        self,
+        ingredient_ids: Iterable[int],
+        limit: int,
+        min_coverage: float = 0.0,
+    ) -> list[tuple[int, int, int]]:
+        """Top recipes as (recipe_id, matched, required), best coverage first."""
+        ids = {i for i in ingredient_ids if i in self._postings}
+        if not ids:
+            return []
+
+        cutoff = len(self._required) * self.staple_fraction
+        staples = {i for i in ids if len(self._postings[i]) > cutoff}
+        drivers = (ids - staples) or staples
+        confirming = staples if drivers is not staples else set()
+
+        # Everything below iterates in C (Counter, set ops, map/zip); no
+        # per-candidate Python code until the final top-k
+        hits = Counter()
+        for i in drivers:
+            hits.update(self._postings[i])
+        for i in confirming:
+            hits.update(filter(self._staple_set(i).__contains__, list(hits)))
+
+        required = self._required
+        coverage = map(truediv, hits.values(), map(required.__getitem__, hits.keys()))
+        top = heapq.nlargest(limit, zip(coverage, hits.values(), hits.keys()))
+
+        # A recipe with no distinctive pantry ingredient scores at best
+        # (1.0, len(confirming)); scan the staples only if that could place
+        if confirming and (len(top) < limit or top[-1][:2] <= (1.0, len(confirming))):
+            extra = Counter()
+            for i in confirming:
+                extra.update(self._postings[i])
+            for rid in extra.keys() & hits.keys():
+                del extra[rid]
+            coverage = map(truediv, extra.values(), map(required.__getitem__, extra.keys()))
+            top = heapq.nlargest(limit, chain(top, zip(coverage, extra.values(), extra.keys())))
+
+        # Ordered by coverage first, so the threshold can be applied after the cut
+        return [(rid, matched, required[rid]) for cov, matched, rid in top if cov >= min_coverage]
+
+    def _staple_set(self, ingredient_id: int) -> frozenset:
+        """Hash-set copy of a large posting list, built on first use and dropped when it changes."""
+        members = self._staple_sets.get(ingredient_id)
+        if members is None:
+            members = self._staple_sets[ingredient_id] = frozenset(self._postings[ingredient_id])
+        return members
+
+    def remove(self, recipe_id: int):
+        for ingredient_id in self._recipe_ingredients.pop(recipe_id, ()):
+            self._staple_sets.pop(ingredient_id, None)
+            posting = self._postings.get(ingredient_id)
+            if posting is None:
+                continue
+            j = bisect.bisect_left(posting, recipe_id)
+            if j < len(posting) and posting[j] == recipe_id:
+                del posting[j]
+            if not posting:
+                del self._postings[ingredient_id]
+        self._required.pop(recipe_id, None)
+
+    def _add(self, recipe_id: int, ingredient_ids: list[int], required: int):
+        ingredient_ids = sorted(set(ingredient_ids))
+        self._recipe_ingredients[recipe_id] = array("q", ingredient_ids)
+        self._required[recipe_id] = max(required, 1)
+        for ingredient_id in ingredient_ids:
+            self._staple_sets.pop(ingredient_id, None)
+            posting = self._postings.setdefault(ingredient_id, array("q"))
+            # Rebuilds stream ids in ascending order, so this is usually an append
+            if not posting or posting[-1] < recipe_id:
+                posting.append(recipe_id)
+            else:
+                posting.insert(bisect.bisect_left(posting, recipe_id), recipe_id)
+
+    @staticmethod
+    def _build(ingredients: dict[int, list[int]], required: dict[int, int]) -> tuple[dict, dict, dict]:
+        """Fresh postings for a full rebuild; ids go in ascending order, so every insert is an append."""
+        postings: dict[int, array] = {}
+        recipe_ingredients: dict[int, array] = {}
+        counts: dict[int, int] = {}
+        for recipe_id in sorted(required):
+            ids = sorted(set(ingredients.get(recipe_id, [])))
+            recipe_ingredients[recipe_id] = array("q", ids)
+            counts[recipe_id] = max(required[recipe_id], 1)
+            for ingredient_id in ids:
+                postings.setdefault(ingredient_id, array("q")).append(recipe_id)
+        return postings, recipe_ingredients, counts
+
+    async def _load(self, since: Optional[datetime]) -> tuple[dict, dict, set[int], Optional[datetime]]:
+        recipe_filter = [Recipe.updated_at >= resume_from(since)] if since else []
+        async with async_session() as db:
+            changed = await db.execute(
+                select(Recipe.id, Recipe.is_public, Recipe.updated_at).where(*recipe_filter)
+            )
+            visible, hidden, watermark = set(), set(), since
+            for recipe_id, is_public, updated_at in changed:
+                (visible if is_public else hidden).add(recipe_id)
+                if updated_at and (watermark is None or updated_at > watermark):
+                    watermark = updated_at
+
+            ingredients: dict[int, list[int]] = {}
+            required: dict[int, int] = {}
+            if visible:
+                rows = await db.stream(
+                    select(RecipeIngredient.recipe_id, RecipeIngredient.ingredient_id)
+                    .join(Recipe, Recipe.id == RecipeIngredient.recipe_id)
+                    .where(Recipe.is_public == True, *recipe_filter)
+                    .order_by(RecipeIngredient.recipe_id)
+                )
+                async for recipe_id, ingredient_id in rows:
+                    required[recipe_id] = required.get(recipe_id, 0) + (ingredient_id is None)
+                    if ingredient_id is not None:
+                        ingredients.setdefault(recipe_id, []).append(ingredient_id)
+            for recipe_id, ids in ingredients.items():
+                required[recipe_id] += len(set(ids))
+        return ingredients, required, hidden | (visible - required.keys()), watermark
+
+    async def refresh(self, full: bool = False) -> int:
+        """Applies recipes changed since the last refresh (or rebuilds). Returns recipes indexed."""
+        async with self._lock:
+            full = full or not self.ready or time.monotonic() - self._built_at >= self.rebuild_seconds
+            ingredients, required, removed, watermark = await self._load(None if full else self._watermark)
+
+            if full:
+                # Lookups keep using the old postings until the swap
+                built = await asyncio.to_thread(self._build, ingredients, required)
+                self._postings, self._recipe_ingredients, self._required = built
+                self._staple_sets = {}
+                self._built_at = time.monotonic()
+                self._watermark = watermark
+                return len(required)
+
+            for recipe_id in removed:
+                self.remove(recipe_id)
+            for recipe_id in sorted(required):
+                self.remove(recipe_id)
+                self._add(recipe_id, ingredients.get(recipe_id, []), required[recipe_id])
+
+            self._watermark = watermark
+            return len(required)
+
+    async def _run(self):
+        # Build right away; requests use the SQL path until this finishes
+        while True:
+            try:
+                await self.refresh()
+            except SQLAlchemyError:
+                logger.exception("Pantry index refresh failed")
+            await asyncio.sleep(self.refresh_seconds)
+
+    def start(self):
+        if self._loop_task is None:
+            self._loop_task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._loop_task is not None:
+            self._loop_task.cancel()
+            try:
+                await self._loop_task
+            except asyncio.CancelledError:
+                pass
+            self._loop_task = None
+
+
+pantry_index = PantryIndex(
+    refresh_seconds=settings.pantry_refresh_seconds,
+    rebuild_seconds=settings.pantry_rebuild_seconds,
+    staple_fraction=settings.pantry_staple_fraction,
+)
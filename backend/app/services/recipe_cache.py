@@ -0,0 +1,162 @@
+import json
+import logging
+from typing import AbstractSet, Any, Optional, Protocol
+from app.core.config import settings
+from app.models.recipe import Recipe
+from app.models.recipe_media import RecipeMedia
+from app.utils.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend(Protocol):
+    async def get(self, key: str) -> Optional[Any]: ...
+    async def set(self, key: str, value: Any, ttl_seconds: int): ...
+
+
+class InMemoryCacheBackend:
+    """Per-process LRU."""
+
+    def __init__(self, max_entries: int):
+        self._entries = TTLCache(ttl_seconds=0, max_entries=max_entries)
+
+    async def get(self, key: str) -> Optional[Any]:
+        return self._entries.get(key)
+
+    async def set(self, key: str, value: Any, ttl_seconds: int):
+        self._entries.set(key, value, ttl_seconds=ttl_seconds)
+
+
+class RedisCacheBackend:
+    """Shared cache, so every API worker reuses the same entries."""
+
+    def __init__(self, url: str):
+        # Optional dependency; only needed when RECIPE_CACHE_URL is configured
+        from redis import asyncio as redis_asyncio
+        self._client = redis_asyncio.from_url(url)
+
+    async def get(self, key: str) -> Optional[Any]:
+        raw = await self._client.get(key)
+        return json.loads(raw) if raw is not None else None
+
+    async def set(self, key: str, value: Any, ttl_seconds: int):
+        await self._client.set(key, json.dumps(value), ex=ttl_seconds)
+
+
+class RecipeCache:
+    """
+    Read-through cache for the viewer-independent part of RecipeRead.
+
+    Entries are keyed by recipe id plus the content version from
+    `recipe_versions.content_version`, which is read from the database on
+    every request. Any write that bumps `updated_at` or changes media state,
+    in this process or another, moves readers to a new key, so nothing has
+    to be invalidated and the old entry just ages out. The version is read
+    before the payload is loaded, so a payload is never stored under a
+    version newer than itself.
+    """
+
+    def __init__(self, backend: CacheBackend, ttl_seconds: int):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def _key(recipe_id: int, version: str) -> str:
+        return f"recipe:{recipe_id}:{version}"
+
+    async def get(self, recipe_id: int, version: str) -> Optional[dict]:
+        try:
+            return await self.backend.get(self._key(recipe_id, version))
+        except Exception:
+            # A cache outage must never take the detail endpoint down
+            logger.exception("Recipe cache read failed for %s", recipe_id)
+            return None
+
+    async def set(self, recipe_id: int, version: str, payload: dict):
+        try:
+            await self.backend.set(self._key(recipe_id, version), payload, self.ttl_seconds)
+        except Exception:
+            logger.exception("Recipe cache write failed for %s", recipe_id)
+
+
+def recipe_payload(recipe: Recipe, fields: Optional[AbstractSet[str]] = None) -> dict:
+    """
+    Plain, JSON-safe snapshot of a fully loaded recipe. Media keeps its storage
+    keys so RecipeMediaRead can rebuild the public URLs on the way out.
+
+    With `fields`, relationships outside it are neither read nor included, so
+    a recipe loaded with only those relationships can be rendered (see
+    services/recipe_fields.py). Only full payloads belong in the cache.
+    """
+    def wanted(name: str) -> bool:
+        return fields is None or name in fields
+
+    payload = {
+        "id": recipe.id,
+        "name": recipe.name,
+        "description": recipe.description,
+        "chefs_note": recipe.chefs_note,
+        "cook_time_minutes": recipe.cook_time_minutes,
+        "servings": recipe.servings,
+        "is_public": recipe.is_public,
+    }
+    if wanted("author_name"):
+        payload["author_name"] = recipe.author.display_name if recipe.author else "Anonymous"
+    if wanted("ingredients"):
+        payload["ingredients"] = [
+            {
+                "id": ing.id,
+                "ingredient_id": ing.ingredient_id,
+                "name_text": ing.name_text,
+                "quantity": float(ing.quantity) if ing.quantity else None,
+                "quantity_text": ing.quantity_text,
+                "unit_id": ing.unit_id,
+                "unit_name": ing.unit.name if ing.unit else None,
+                "preparation_notes": ing.preparation_notes,
+                "display_order": ing.display_order,
+            }
+            for ing in recipe.ingredients
+        ]
+    if wanted("steps"):
+        payload["steps"] = [
+            {
+                "id": step.id,
+                "step_number": step.step_number,
+                "instruction": step.instruction,
+                "estimated_minutes": step.estimated_minutes,
+            }
+            for step in recipe.steps
+        ]
+    if wanted("categories"):
+        payload["categories"] = [c.name for c in recipe.categories]
+    if wanted("media"):
+        media = sorted(recipe.media, key=lambda m: (not m.is_primary, m.display_order))
+        payload["media"] = [media_payload(m) for m in media]
+    return payload
+
+
+def media_payload(m: RecipeMedia) -> dict:
+    return {
+        "id": m.id,
+        "type": m.type,
+        "is_primary": m.is_primary,
+        "display_order": m.display_order,
+        "processed": bool(m.processed),
+        "key": m.key,
+        "thumbnail_small_key": m.thumbnail_small_key,
+        "thumbnail_medium_key": m.thumbnail_medium_key,
+        "thumbnail_large_key": m.thumbnail_large_key,
+        "width": m.width,
+        "height": m.height,
+        "duration_seconds": m.duration_seconds,
+        "processing_error": m.processing_error,
+    }
+
+
+def _build_backend() -> CacheBackend:
+    if settings.RECIPE_CACHE_URL:
+        return RedisCacheBackend(settings.RECIPE_CACHE_URL)
+    return InMemoryCacheBackend(max_entries=settings.recipe_cache_max_entries)
+
+
+recipe_cache = RecipeCache(_build_backend(), ttl_seconds=settings.recipe_cache_ttl_seconds)
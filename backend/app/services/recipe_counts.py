@@ -0,0 +1,68 @@
+from typing import Hashable, Optional
+from sqlalchemy import select, func, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+from app.core.config import settings
+from app.models.recipe import Recipe
+from app.utils.cache import TTLCache
+
+COUNT_STRATEGIES = ["exact", "capped", "estimated", "none"]
+
+_count_cache = TTLCache(ttl_seconds=settings.recipe_count_cache_seconds)
+
+
+async def _exact_count(db: AsyncSession, stmt: Select) -> int:
+    # Count ids only; the eager-load options and wide column list add nothing here
+    subq = stmt.with_only_columns(Recipe.id).order_by(None).subquery()
+    return (await db.execute(select(func.count()).select_from(subq))).scalar() or 0
+
+
+async def _capped_count(db: AsyncSession, stmt: Select, cap: int) -> tuple[int, bool]:
+    subq = stmt.with_only_columns(Recipe.id).order_by(None).limit(cap + 1).subquery()
+    total = (await db.execute(select(func.count()).select_from(subq))).scalar() or 0
+    return total, total <= cap
+
+
+async def _table_estimate(db: AsyncSession) -> Optional[int]:
+    """Planner row estimate for the whole recipes table (NULL/-1 until analyzed)."""
+    result = await db.execute(
+        text("SELECT reltuples::bigint FROM pg_class WHERE oid = 'recipes'::regclass")
+    )
+    estimate = result.scalar()
+    return estimate if estimate is not None and estimate >= 0 else None
+
+
+async def count_recipes(
+    db: AsyncSession,
+    stmt: Select,
+    strategy: str,
+    signature: Hashable,
+    unfiltered: bool = False,
+) -> tuple[Optional[int], bool]:
+    """
+    Returns (total, is_exact) for the filtered listing statement.
+
+    - exact:     count(*) over the filtered ids
+    - capped:    stops counting after `recipe_count_cap` + 1 rows
+    - estimated: planner estimate for the unfiltered feed, otherwise an exact
+                 count cached per filter signature for `recipe_count_cache_seconds`
+    - none:      skip counting entirely (infinite scroll clients)
+    """
+    if strategy == "none":
+        return None, False
+
+    if strategy == "capped":
+        return await _capped_count(db, stmt, settings.recipe_count_cap)
+
+    if strategy == "estimated":
+        cached = _count_cache.get(signature)
+        if cached is not None:
+            return cached, False
+
+        total = await _table_estimate(db) if unfiltered else None
+        if total is None:
+            total = await _exact_count(db, stmt)
+        _count_cache.set(signature, total)
+        return total, False
+
+    return await _exact_count(db, stmt), True
@@ -0,0 +1,95 @@
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Optional
+import orjson
+from sqlalchemy import select, delete, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.db import async_session
+from app.core.config import settings
+from app.models.recipe import Recipe
+from app.models.recipe_tombstone import RecipeTombstone
+from app.services.recipe_cache import recipe_payload
+from app.services.recipe_fields import DETAIL_OPTIONS
+from app.services.recipe_json import recipe_json
+
+
+async def iter_public_recipes(
+    updated_since: Optional[datetime] = None,
+    chunk_size: Optional[int] = None,
+) -> AsyncIterator[dict]:
+    """
+    Every public recipe as a RecipeRead-shaped dict (without viewer fields)
+    plus `updated_at`, oldest change first, so the latest `updated_at` seen
+    is the `updated_since` of the next incremental run.
+
+    Incremental runs start `export_overlap_seconds` before `updated_since`:
+    updated_at is the editing transaction's start time, so an edit can commit
+    after an export already handed out a later watermark. Re-sending a recipe
+    is harmless, skipping one is not. They end with tombstones,
+    `{"id", "deleted": true, "updated_at"}`, for recipes deleted or made
+    private in that window.
+
+    Rows come from a server-side cursor `chunk_size` at a time; each chunk's
+    children are loaded with one selectin query per relationship and the
+    session is emptied before the next one, so memory stays flat however
+    many recipes there are. Uses its own session because the caller (a
+    streaming response) outlives the request's dependencies.
+    """
+    chunk_size = chunk_size or settings.export_chunk_size
+    stmt = (
+        select(Recipe)
+        .options(*DETAIL_OPTIONS)
+        .where(Recipe.is_public == True)
+        .order_by(Recipe.updated_at, Recipe.id)
+        .execution_options(yield_per=chunk_size)
+    )
+    if updated_since is not None:
+        updated_since = updated_since - timedelta(seconds=settings.export_overlap_seconds)
+        stmt = stmt.where(Recipe.updated_at >= updated_since)
+
+    async with async_session() as db:
+        result = await db.stream_scalars(stmt)
+        async for recipes in result.partitions():
+            for recipe in recipes:
+                item = recipe_json(recipe_payload(recipe), {})
+                item["updated_at"] = recipe.updated_at
+                yield item
+            db.expunge_all()
+
+        if updated_since is not None:
+            async for tombstone in _tombstones(db, updated_since):
+                yield tombstone
+
+
+async def _tombstones(db, updated_since: datetime) -> AsyncIterator[dict]:
+    """Recipes deleted, or currently private, that changed at or after `updated_since`."""
+    removed = union_all(
+        select(RecipeTombstone.recipe_id.label("id"), RecipeTombstone.deleted_at.label("at"))
+        .where(RecipeTombstone.deleted_at >= updated_since),
+        select(Recipe.id, Recipe.updated_at)
+        .where(Recipe.is_public == False, Recipe.updated_at >= updated_since),
+    ).subquery()
+    result = await db.stream(select(removed.c.id, removed.c.at).order_by(removed.c.at, removed.c.id))
+    async for recipe_id, at in result:
+        yield {"id": recipe_id, "deleted": True, "updated_at": at}
+
+
+def tombstone_cutoff() -> datetime:
+    """Oldest deletion still on record; see `prune_tombstones`."""
+    return datetime.now(timezone.utc) - timedelta(days=settings.export_tombstone_retention_days)
+
+
+def requires_full_export(updated_since: datetime) -> bool:
+    """True when tombstones for part of the requested window were already pruned."""
+    if updated_since.tzinfo is None:
+        updated_since = updated_since.replace(tzinfo=timezone.utc)
+    return updated_since < tombstone_cutoff()
+
+
+async def prune_tombstones(db: AsyncSession) -> int:
+    result = await db.execute(delete(RecipeTombstone).where(RecipeTombstone.deleted_at < tombstone_cutoff()))
+    return result.rowcount
+
+
+async def ndjson_lines(updated_since: Optional[datetime] = None) -> AsyncIterator[bytes]:
+    async for item in iter_public_recipes(updated_since):
+        yield orjson.dumps(item) + b"\n"
@@ -0,0 +1,58 @@
+from sqlalchemy import select, func, case, literal, union_all, String, BigInteger, null
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+from app.models.recipe import Recipe
+from app.models.recipe_category import RecipeCategory
+
+# (label, inclusive upper bound in minutes); recipes without a cook time are not bucketed
+COOK_TIME_BUCKETS = [("0-15", 15), ("16-30", 30), ("31-60", 60), ("60+", None)]
+
+
+def cook_time_bucket(column):
+    whens = [(column <= upper, label) for label, upper in COOK_TIME_BUCKETS if upper is not None]
+    return case(*whens, else_=COOK_TIME_BUCKETS[-1][0])
+
+
+async def compute_facets(db: AsyncSession, stmt: Select) -> dict:
+    """
+    Per-category and per-cook-time-bucket recipe counts for the filtered
+    listing statement, as one grouped UNION ALL query over the filtered ids.
+    """
+    filtered = (
+        stmt.with_only_columns(Recipe.id, Recipe.cook_time_minutes)
+        .order_by(None)
+        .distinct()
+        .cte("filtered")
+    )
+
+    by_category = (
+        select(
+            literal("category", String).label("facet"),
+            RecipeCategory.category_id.label("category_id"),
+            null().label("bucket"),
+            func.count().label("n"),
+        )
+        .join(filtered, filtered.c.id == RecipeCategory.recipe_id)
+        .group_by(RecipeCategory.category_id)
+    )
+    bucket = cook_time_bucket(filtered.c.cook_time_minutes)
+    by_cook_time = (
+        select(
+            literal("cook_time", String),
+            null().cast(BigInteger),
+            bucket,
+            func.count(),
+        )
+        .where(filtered.c.cook_time_minutes.is_not(None))
+        .group_by(bucket)
+    )
+
+    rows = (await db.execute(union_all(by_category, by_cook_time))).all()
+
+    categories = sorted(
+        ({"id": category_id, "count": n} for facet, category_id, _, n in rows if facet == "category"),
+        key=lambda f: (-f["count"], f["id"]),
+    )
+    counts = {b: n for facet, _, b, n in rows if facet == "cook_time"}
+    cook_time = [{"bucket": label, "count": counts.get(label, 0)} for label, _ in COOK_TIME_BUCKETS]
+    return {"categories": categories, "cook_time": cook_time}
@@ -0,0 +1,51 @@
+from typing import Optional
+from fastapi import HTTPException
+from sqlalchemy.orm import joinedload, selectinload, raiseload
+from app.models.recipe import Recipe
+from app.models.recipe_ingredient import RecipeIngredient
+from app.schemas.recipe import RecipeRead
+
+# Sparse fieldsets (?fields=name,media) for the RecipeRead endpoints. The
+# requested fields decide which relationships are loaded, so a share preview
+# asking for name and media never issues the ingredient or step queries.
+
+RECIPE_FIELDS = frozenset(RecipeRead.model_fields)
+INTERACTION_FIELDS = frozenset({"is_liked", "is_saved", "likes_count", "views_count"})
+
+# Relationship each non-column field needs
+RELATION_OPTIONS = {
+    "ingredients": selectinload(Recipe.ingredients).joinedload(RecipeIngredient.unit),
+    "steps": selectinload(Recipe.steps),
+    "categories": selectinload(Recipe.categories),
+    "media": selectinload(Recipe.media),
+    "author_name": joinedload(Recipe.author),
+}
+
+# Everything RecipeRead renders, loaded in a fixed number of queries per statement
+DETAIL_OPTIONS = tuple(RELATION_OPTIONS.values())
+
+
+def parse_fields(fields: Optional[str]) -> Optional[frozenset[str]]:
+    """Comma-separated field list; None means the full representation. `id` is always included."""
+    if not fields:
+        return None
+    requested = {f.strip() for f in fields.split(",") if f.strip()}
+    unknown = requested - RECIPE_FIELDS
+    if unknown:
+        raise HTTPException(400, f"Unknown fields: {', '.join(sorted(unknown))}")
+    return frozenset(requested | {"id"})
+
+
+def load_options(fields: Optional[frozenset[str]]) -> tuple:
+    if fields is None:
+        return DETAIL_OPTIONS
+    # Anything not requested must not sneak in through a lazy load
+    return (*(opt for name, opt in RELATION_OPTIONS.items() if name in fields), raiseload("*"))
+
+
+def wants_interactions(fields: Optional[frozenset[str]]) -> bool:
+    return fields is None or not fields.isdisjoint(INTERACTION_FIELDS)
+
+
+def project(data: dict, fields: Optional[frozenset[str]]) -> dict:
+    return data if fields is None else {k: v for k, v in data.items() if k in fields}
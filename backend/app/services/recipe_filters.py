@@ -0,0 +1,24 @@
+from sqlalchemy import exists, and_
+from app.models.recipe import Recipe
+from app.models.recipe_category import RecipeCategory
+
+CATEGORY_MODES = ["any", "all"]
+
+
+def category_filter(category_ids: list[int], mode: str = "any"):
+    """
+    Semi-join predicate on recipe_categories: one row per recipe whatever
+    the number of matching categories, so no DISTINCT or .unique() needed.
+
+    - any: a single EXISTS with category_id IN (...)
+    - all: one EXISTS per category; each probe is a primary key lookup on
+           (recipe_id, category_id), or a hash semi-join fed by the
+           (category_id, recipe_id) index when the category is selective
+    """
+    ids = sorted(set(category_ids))
+    if mode == "all":
+        return and_(*[
+            exists().where(RecipeCategory.recipe_id == Recipe.id, RecipeCategory.category_id == category_id)
+            for category_id in ids
+        ])
+    return exists().where(RecipeCategory.recipe_id == Recipe.id, RecipeCategory.category_id.in_(ids))
@@ -0,0 +1,224 @@
+import logging
+from typing import AsyncIterable, AsyncIterator, Optional, Union
+from pydantic import ValidationError
+from sqlalchemy import select, insert, func, or_
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.models.category import Category
+from app.models.recipe import Recipe
+from app.models.recipe_category import RecipeCategory
+from app.models.recipe_ingredient import RecipeIngredient
+from app.models.recipe_stats import RecipeStats
+from app.models.recipe_step import RecipeStep
+from app.models.unit import Unit
+from app.models.user import User
+from app.schemas.recipe import RecipeImportError, RecipeImportReport, RecipeImportRow
+from app.services.ingredient_matcher import match_ingredient_names
+
+logger = logging.getLogger(__name__)
+
+RECIPE_COLUMNS = ("name", "description", "chefs_note", "cook_time_minutes", "servings", "is_public")
+INGREDIENT_COLUMNS = ("name_text", "quantity", "quantity_text", "unit_id", "preparation_notes", "display_order")
+
+
+async def iter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    """Re-splits an arbitrary byte stream (e.g. a request body) on newlines."""
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            yield line
+    if buffer:
+        yield buffer
+
+
+def _validation_message(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in err['loc']) or 'line'}: {err['msg']}"
+        for err in exc.errors()
+    )
+
+
+class RecipeImporter:
+    """
+    Loads recipes from JSONL (one RecipeImportRow per line) in chunks.
+
+    Per chunk, every lookup is one query for the whole chunk: owners,
+    category ids, unit names and ingredient names (through names and
+    aliases), each remembered for later chunks. Recipes then go in as one
+    multi-row INSERT ... RETURNING id, and their stats, ingredients, steps
+    and categories as one executemany per table, all in a single
+    transaction. A row the database rejects sends its chunk back through
+    row by row under savepoints, so only that row is reported as failed.
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        default_user_id: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+    ):
+        self.db = db
+        self.default_user_id = default_user_id
+        self.chunk_size = chunk_size or settings.import_chunk_size
+        self.report = RecipeImportReport()
+        self._users: set[int] = set()
+        self._categories: set[int] = set()
+        self._units: dict[str, Optional[int]] = {}
+        self._ingredients: dict[str, Optional[int]] = {}
+
+    async def run(self, lines: AsyncIterable[Union[bytes, str]]) -> RecipeImportReport:
+        chunk: list[tuple[int, RecipeImportRow]] = []
+        line_no = 0
+        async for line in lines:
+            line_no += 1
+            if not line.strip():
+                continue
+            row = self._parse(line_no, line)
+            if row is not None:
+                chunk.append((line_no, row))
+            if len(chunk) >= self.chunk_size:
+                await self._import_chunk(chunk)
+                chunk = []
+        if chunk:
+            await self._import_chunk(chunk)
+        return self.report
+
+    def _fail(self, line_no: int, error: str) -> None:
+        self.report.failed += 1
+        if len(self.report.errors) < settings.import_max_errors:
+            self.report.errors.append(RecipeImportError(line=line_no, error=error))
+
+    def _parse(self, line_no: int, line: Union[bytes, str]) -> Optional[RecipeImportRow]:
+        try:
+            row = RecipeImportRow.model_validate_json(line)
+        except ValidationError as exc:
+            self._fail(line_no, _validation_message(exc))
+            return None
+
+        step_numbers = [step.step_number for step in row.steps]
+        if len(step_numbers) != len(set(step_numbers)):
+            self._fail(line_no, "steps: duplicate step_number")
+            return None
+        if row.user_id is None:
+            row.user_id = self.default_user_id
+            if row.user_id is None:
+                self._fail(line_no, "user_id: required when no default owner is given")
+                return None
+        return row
+
+    async def _resolve(self, chunk: list[tuple[int, RecipeImportRow]]) -> list[tuple[int, RecipeImportRow]]:
+        """Fills in unit/ingredient ids and drops rows pointing at unknown owners, categories or units."""
+        rows = [row for _, row in chunk]
+
+        user_ids = {row.user_id for row in rows} - self._users
+        if user_ids:
+            result = await self.db.execute(select(User.id).where(User.id.in_(user_ids)))
+            self._users.update(result.scalars().all())
+
+        category_ids = {cid for row in rows for cid in row.category_ids} - self._categories
+        if category_ids:
+            result = await self.db.execute(select(Category.id).where(Category.id.in_(category_ids)))
+            self._categories.update(result.scalars().all())
+
+        unit_names = {
+            ing.unit.strip().lower() for row in rows for ing in row.ingredients if ing.unit
+        } - self._units.keys()
+        if unit_names:
+            result = await self.db.execute(
+                select(func.lower(Unit.name), func.lower(Unit.symbol), Unit.id).where(
+                    or_(func.lower(Unit.name).in_(unit_names), func.lower(Unit.symbol).in_(unit_names))
+                )
+            )
+            found = {}
+            for name, symbol, unit_id in result.all():
+                found.setdefault(symbol, unit_id)
+                found[name] = unit_id  # A name wins over another unit's symbol
+            for unit in unit_names:
+                self._units[unit] = found.get(unit)
+
+        ingredient_names = {
+            ing.name_text.strip().lower() for row in rows for ing in row.ingredients
+        } - self._ingredients.keys()
+        if ingredient_names:
+            found = await match_ingredient_names(self.db, ingredient_names)
+            for name in ingredient_names:
+                self._ingredients[name] = found.get(name)
+
+        valid = []
+        for line_no, row in chunk:
+            if row.user_id not in self._users:
+                self._fail(line_no, f"user_id: unknown user {row.user_id}")
+                continue
+            unknown = [cid for cid in row.category_ids if cid not in self._categories]
+            if unknown:
+                self._fail(line_no, f"categories: unknown ids {unknown}")
+                continue
+            unknown = [ing.unit for ing in row.ingredients if ing.unit and self._units[ing.unit.strip().lower()] is None]
+            if unknown:
+                self._fail(line_no, f"ingredients: unknown units {unknown}")
+                continue
+            valid.append((line_no, row))
+        return valid
+
+    async def _insert(self, rows: list[RecipeImportRow]) -> None:
+        result = await self.db.execute(
+            insert(Recipe).returning(Recipe.id, sort_by_parameter_order=True),
+            [{"user_id": row.user_id, **row.model_dump(include=set(RECIPE_COLUMNS))} for row in rows],
+        )
+        recipe_ids = result.scalars().all()
+
+        ingredients, steps, categories = [], [], []
+        for recipe_id, row in zip(recipe_ids, rows):
+            for ing in row.ingredients:
+                values = ing.model_dump(include=set(INGREDIENT_COLUMNS))
+                if ing.unit:
+                    values["unit_id"] = self._units[ing.unit.strip().lower()]
+                ingredients.append({
+                    "recipe_id": recipe_id,
+                    "ingredient_id": self._ingredients[ing.name_text.strip().lower()],
+                    **values,
+                })
+            steps.extend({"recipe_id": recipe_id, **step.model_dump()} for step in row.steps)
+            categories.extend(
+                {"recipe_id": recipe_id, "category_id": cid} for cid in dict.fromkeys(row.category_ids)
+            )
+
+        await self.db.execute(insert(RecipeStats), [{"recipe_id": recipe_id} for recipe_id in recipe_ids])
+        for model, values in ((RecipeIngredient, ingredients), (RecipeStep, steps), (RecipeCategory, categories)):
+            if values:
+                await self.db.execute(insert(model), values)
+
+    async def _import_chunk(self, chunk: list[tuple[int, RecipeImportRow]]) -> None:
+        chunk = await self._resolve(chunk)
+        if not chunk:
+            return
+        try:
+            await self._insert([row for _, row in chunk])
+            await self.db.commit()
+            self.report.imported += len(chunk)
+            return
+        except SQLAlchemyError:
+            await self.db.rollback()
+            logger.warning("Import chunk rejected, retrying %d rows one by one", len(chunk))
+
+        for line_no, row in chunk:
+            try:
+                async with self.db.begin_nested():
+                    await self._insert([row])
+            except SQLAlchemyError as exc:
+                self._fail(line_no, str(getattr(exc, "orig", None) or exc).splitlines()[0])
+            else:
+                self.report.imported += 1
+        await self.db.commit()
+
+
+async def import_recipes(
+    db: AsyncSession,
+    lines: AsyncIterable[Union[bytes, str]],
+    default_user_id: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+) -> RecipeImportReport:
+    return await RecipeImporter(db, default_user_id, chunk_size).run(lines)
@@ -0,0 +1,84 @@
+from typing import NamedTuple, Optional
+from sqlalchemy import select, exists, false, func, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.recipe import Recipe
+from app.models.recipe_like import RecipeLike
+from app.models.recipe_stats import RecipeStats
+from app.models.saved_recipe import UserSavedRecipe
+
+
+class RecipeInteractionState(NamedTuple):
+    is_liked: bool = False
+    is_saved: bool = False
+    likes_count: int = 0
+    views_count: int = 0
+    saves_count: int = 0
+
+
+NO_INTERACTIONS = RecipeInteractionState()
+
+
+async def get_viewer_flags(
+    db: AsyncSession,
+    user_id: Optional[int],
+    recipe_ids: list[int],
+) -> tuple[set[int], set[int]]:
+    """
+    Returns the subsets of `recipe_ids` the viewer has liked and saved.
+    Both lookups are `IN` probes on the (user_id, recipe_id) primary keys.
+    """
+    if not user_id or not recipe_ids:
+        return set(), set()
+
+    liked = await db.execute(
+        select(RecipeLike.recipe_id)
+        .where(RecipeLike.user_id == user_id, RecipeLike.recipe_id.in_(recipe_ids))
+    )
+    saved = await db.execute(
+        select(UserSavedRecipe.recipe_id)
+        .where(UserSavedRecipe.user_id == user_id, UserSavedRecipe.recipe_id.in_(recipe_ids))
+    )
+    return set(liked.scalars().all()), set(saved.scalars().all())
+
+
+async def get_interaction_map(
+    db: AsyncSession,
+    user_id: Optional[int],
+    recipe_ids: list[int],
+    visible_only: bool = False,
+) -> dict[int, RecipeInteractionState]:
+    """
+    Counters and viewer flags for a page of recipes in a single round trip:
+    recipe_stats is outer-joined and the flags are EXISTS probes on the
+    (user_id, recipe_id) primary keys. Ids that do not exist are left out;
+    callers fall back to NO_INTERACTIONS. With `visible_only`, for ids that
+    come straight from a client, so are other users' private recipes.
+    """
+    if not recipe_ids:
+        return {}
+
+    if user_id:
+        is_liked = exists().where(RecipeLike.user_id == user_id, RecipeLike.recipe_id == Recipe.id)
+        is_saved = exists().where(UserSavedRecipe.user_id == user_id, UserSavedRecipe.recipe_id == Recipe.id)
+    else:
+        is_liked = is_saved = false()
+
+    stmt = (
+        select(
+            Recipe.id,
+            is_liked,
+            is_saved,
+            func.coalesce(RecipeStats.likes_count, 0),
+            func.coalesce(RecipeStats.views_count, 0),
+            func.coalesce(RecipeStats.saves_count, 0),
+        )
+        .outerjoin(RecipeStats, RecipeStats.recipe_id == Recipe.id)
+        .where(Recipe.id.in_(recipe_ids))
+    )
+    if visible_only:
+        visible = Recipe.is_public == True
+        if user_id:
+            visible = or_(visible, Recipe.user_id == user_id)
+        stmt = stmt.where(visible)
+    rows = (await db.execute(stmt)).all()
+    return {row[0]: RecipeInteractionState(*row[1:]) for row in rows}
@@ -0,0 +1,46 @@
+from typing import Optional
+from app.models.recipe import Recipe
+from app.models.recipe_media import RecipeMedia
+from app.services.media_urls import public_media_url
+from app.services.recipe_cache import media_payload
+
+# Plain-dict twins of RecipeRead / RecipeListItem / RecipeMediaRead for the
+# list endpoints. They produce the same JSON as the models but are built once
+# and encoded by FastJSONResponse, with no model construction or re-validation
+# on the way out. Keep them in sync with app/schemas when fields change.
+
+_MEDIA_KEYS = ("key", "thumbnail_small_key", "thumbnail_medium_key", "thumbnail_large_key")
+
+
+def media_json(m: dict) -> dict:
+    """RecipeMediaRead output from a media_payload() dict: storage keys swapped for public URLs."""
+    data = {k: v for k, v in m.items() if k not in _MEDIA_KEYS}
+    data["url"] = public_media_url(m["key"])
+    data["thumbnail_small_url"] = public_media_url(m["thumbnail_small_key"])
+    data["thumbnail_medium_url"] = public_media_url(m["thumbnail_medium_key"])
+    data["thumbnail_large_url"] = public_media_url(m["thumbnail_large_key"])
+    return data
+
+
+def recipe_json(payload: dict, interactions: dict) -> dict:
+    """RecipeRead output from a recipe_payload() dict plus the viewer/counter fields."""
+    data = dict(payload)
+    if "media" in payload:
+        data["media"] = [media_json(m) for m in payload["media"]]
+    data.update(interactions)
+    return data
+
+
+def card_json(r: Recipe, primary_media: Optional[RecipeMedia], interactions: dict) -> dict:
+    """RecipeListItem output."""
+    return {
+        "id": r.id,
+        "name": r.name,
+        "description": r.description,
+        "cook_time_minutes": r.cook_time_minutes,
+        "servings": r.servings,
+        "is_public": r.is_public,
+        "author_name": r.author.display_name if r.author else "Anonymous",
+        "primary_media": media_json(media_payload(primary_media)) if primary_media else None,
+        **interactions,
+    }
@@ -0,0 +1,69 @@
+from sqlalchemy import select, func, literal, literal_column, case, or_, String, Float
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+from app.core.config import settings
+from app.models.recipe import Recipe
+
+# Regconfig literal; a bound varchar would not resolve the tsquery overloads
+SEARCH_CONFIG = literal_column("'english'::regconfig")
+
+
+def search_query(q: str):
+    """websearch_to_tsquery accepts quotes, OR and -exclusions and never raises on bad input."""
+    return func.websearch_to_tsquery(SEARCH_CONFIG, q)
+
+
+def apply_text_search(stmt: Select, q: str) -> tuple[Select, object]:
+    """
+    Filters `stmt` to recipes matching `q` through the GIN-indexed
+    `search_vector` column and returns the relevance expression to sort by.
+
+    `search_vector` weights name (A) over description (B) over chefs_note (C),
+    and ts_rank_cd scores matches with those weights.
+    """
+    query = search_query(q)
+    # Typed so cursor values for this sort key can be checked (utils/pagination.py)
+    rank = func.ts_rank_cd(Recipe.search_vector, query, type_=Float)
+    return stmt.where(Recipe.search_vector.op("@@")(query)), rank
+
+
+async def has_min_text_hits(db: AsyncSession, stmt: Select, min_hits: int) -> bool:
+    """True if the full-text filtered `stmt` yields at least `min_hits` rows (stops counting there)."""
+    probe = stmt.with_only_columns(Recipe.id).order_by(None).limit(min_hits).subquery()
+    hits = (await db.execute(select(func.count()).select_from(probe))).scalar_one()
+    return hits >= min_hits
+
+
+async def apply_fuzzy_search(db: AsyncSession, stmt: Select, q: str) -> tuple[Select, object]:
+    """
+    Full-text matches plus typo-tolerant trigram matches in one query.
+
+    `q <% name` / `q <% description` are word-similarity tests that the
+    gin_trgm_ops indexes can answer, so the planner ORs three bitmap index
+    scans. Their cutoff is pg_trgm.word_similarity_threshold, set for the
+    current transaction from `search_fuzzy_threshold`.
+
+    Full-text hits score 1 + normalized ts_rank_cd and therefore always
+    outrank trigram-only hits, which score by word similarity (< 1).
+    """
+    await db.execute(
+        select(func.set_config("pg_trgm.word_similarity_threshold", str(settings.search_fuzzy_threshold), True))
+    )
+
+    query = search_query(q)
+    text_match = Recipe.search_vector.op("@@")(query)
+    term = literal(q, String)
+
+    score = case(
+        (text_match, 1 + func.ts_rank_cd(Recipe.search_vector, query, 32, type_=Float)),
+        else_=func.greatest(
+            func.word_similarity(term, Recipe.name),
+            func.word_similarity(term, func.coalesce(Recipe.description, "")) * 0.5,
+        ),
+    )
+    stmt = stmt.where(or_(
+        text_match,
+        term.op("<%")(Recipe.name),
+        term.op("<%")(Recipe.description),
+    ))
+    return stmt, score
@@ -0,0 +1,108 @@
+from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.recipe import Recipe
+from app.models.recipe_like import RecipeLike
+from app.models.recipe_stats import RecipeStats
+from app.models.recipe_view import UserRecipeView
+from app.models.saved_recipe import UserSavedRecipe
+
+
+async def bump_recipe_stats(
+    db: AsyncSession,
+    recipe_id: int,
+    likes: int = 0,
+    views: int = 0,
+    saves: int = 0,
+):
+    """
+    Applies counter deltas in the caller's transaction.
+    Upserts so recipes created before the stats table existed heal themselves.
+    """
+    stmt = insert(RecipeStats).values(
+        recipe_id=recipe_id,
+        likes_count=max(likes, 0),
+        views_count=max(views, 0),
+        saves_count=max(saves, 0),
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[RecipeStats.recipe_id],
+        set_={
+            "likes_count": func.greatest(RecipeStats.likes_count + likes, 0),
+            "views_count": func.greatest(RecipeStats.views_count + views, 0),
+            "saves_count": func.greatest(RecipeStats.saves_count + saves, 0),
+            "updated_at": func.now(),
+        },
+    )
+    await db.execute(stmt)
+
+
+async def bump_views_bulk(db: AsyncSession, view_counts: dict[int, int]):
+    """Adds many view deltas with a single multi-row upsert."""
+    if not view_counts:
+        return
+    stmt = insert(RecipeStats).values([
+        {"recipe_id": recipe_id, "views_count": count}
+        for recipe_id, count in view_counts.items()
+    ])
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[RecipeStats.recipe_id],
+        set_={
+            "views_count": RecipeStats.views_count + stmt.excluded.views_count,
+            "updated_at": func.now(),
+        },
+    )
+    await db.execute(stmt)
+
+
+async def get_stats_map(db: AsyncSession, recipe_ids: list[int]) -> dict[int, RecipeStats]:
+    if not recipe_ids:
+        return {}
+    result = await db.execute(
+        select(RecipeStats)
+        .where(RecipeStats.recipe_id.in_(recipe_ids))
+        .execution_options(populate_existing=True)
+    )
+    return {s.recipe_id: s for s in result.scalars().all()}
+
+
+async def reconcile_recipe_stats(db: AsyncSession) -> int:
+    """
+    Recomputes every counter from the event tables and rewrites rows that drifted
+    (or are missing). Returns the number of rows written.
+    """
+    likes = select(RecipeLike.recipe_id, func.count().label("c")).group_by(RecipeLike.recipe_id).subquery()
+    views = select(UserRecipeView.recipe_id, func.count().label("c")).group_by(UserRecipeView.recipe_id).subquery()
+    saves = select(UserSavedRecipe.recipe_id, func.count().label("c")).group_by(UserSavedRecipe.recipe_id).subquery()
+
+    source = (
+        select(
+            Recipe.id,
+            func.coalesce(likes.c.c, 0),
+            func.coalesce(views.c.c, 0),
+            func.coalesce(saves.c.c, 0),
+        )
+        .outerjoin(likes, likes.c.recipe_id == Recipe.id)
+        .outerjoin(views, views.c.recipe_id == Recipe.id)
+        .outerjoin(saves, saves.c.recipe_id == Recipe.id)
+    )
+
+    stmt = insert(RecipeStats).from_select(
+        ["recipe_id", "likes_count", "views_count", "saves_count"], source
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[RecipeStats.recipe_id],
+        set_={
+            "likes_count": stmt.excluded.likes_count,
+            "views_count": stmt.excluded.views_count,
+            "saves_count": stmt.excluded.saves_count,
+            "updated_at": func.now(),
+        },
+        where=(
+            (RecipeStats.likes_count != stmt.excluded.likes_count)
+            | (RecipeStats.views_count != stmt.excluded.views_count)
+            | (RecipeStats.saves_count != stmt.excluded.saves_count)
+        ),
+    )
+    result = await db.execute(stmt)
+    return result.rowcount or 0
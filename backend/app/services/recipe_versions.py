@@ -0,0 +1,49 @@
+import hashlib
+from typing import Optional
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.recipe import Recipe
+from app.models.recipe_media import RecipeMedia
+from app.models.recipe_stats import RecipeStats
+
+
+async def get_recipe_state(db: AsyncSession, recipe_id: int) -> Optional[dict]:
+    """
+    Cheap version vector for a recipe: row timestamp, counters and media
+    processing state, read in one indexed query. None if the recipe is gone.
+    """
+    media = RecipeMedia.recipe_id == Recipe.id
+    stmt = (
+        select(
+            Recipe.updated_at,
+            func.coalesce(RecipeStats.likes_count, 0),
+            func.coalesce(RecipeStats.views_count, 0),
+            func.coalesce(RecipeStats.saves_count, 0),
+            select(func.count(RecipeMedia.id)).where(media).scalar_subquery(),
+            select(func.count(RecipeMedia.id)).where(media, RecipeMedia.processed == True).scalar_subquery(),
+            select(func.max(RecipeMedia.updated_at)).where(media).scalar_subquery(),
+        )
+        .outerjoin(RecipeStats, RecipeStats.recipe_id == Recipe.id)
+        .where(Recipe.id == recipe_id)
+    )
+    row = (await db.execute(stmt)).first()
+    if row is None:
+        return None
+
+    updated_at, likes, views, saves, media_count, media_processed, media_updated_at = row
+    return {
+        "updated_at": updated_at,
+        "likes_count": likes,
+        "views_count": views,
+        "saves_count": saves,
+        "media": (media_count, media_processed, media_updated_at),
+    }
+
+
+def content_version(state: dict) -> str:
+    """
+    Version of the viewer-independent payload (see services/recipe_cache.py).
+    Every writer bumps updated_at, and media processing shows up in the
+    media part; counters are left out since they are not cached.
+    """
+    return hashlib.sha1(repr((state["updated_at"], state["media"])).encode()).hexdigest()
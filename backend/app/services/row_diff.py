@@ -0,0 +1,66 @@
+from decimal import Decimal
+from typing import Iterable, NamedTuple, Sequence
+from sqlalchemy import Numeric, delete, insert, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class RowDiff(NamedTuple):
+    inserts: list[dict]
+    updates: list[dict]  # Full rows keyed by "id", one shape so they go out as one executemany
+    deletes: list[int]
+    unchanged: int
+
+    @property
+    def rows_written(self) -> int:
+        return len(self.inserts) + len(self.updates) + len(self.deletes)
+
+
+def _same(column, current, value) -> bool:
+    # Numeric columns come back as Decimals rounded to the column's scale
+    if isinstance(column.type, Numeric) and column.type.scale is not None and None not in (current, value):
+        return Decimal(current) == round(Decimal(str(value)), column.type.scale)
+    return current == value
+
+
+def diff_rows(model, existing: Iterable, incoming: Sequence[dict]) -> RowDiff:
+    """
+    Matches `incoming` child rows to the `existing` ones by id. Rows without
+    an id are new, existing rows missing from `incoming` are removed, and a
+    matched row is only rewritten if one of the submitted columns differs.
+    Raises ValueError for an id that is not one of `existing` or repeats.
+    """
+    table = model.__table__
+    current = {row.id: row for row in existing}
+    inserts, updates, seen, unchanged = [], [], set(), 0
+
+    for values in incoming:
+        values = dict(values)
+        row_id = values.pop("id", None)
+        if row_id is None:
+            inserts.append(values)
+            continue
+        if row_id not in current or row_id in seen:
+            raise ValueError(f"Unknown or repeated {table.name} id {row_id}")
+        seen.add(row_id)
+
+        row = current[row_id]
+        if all(_same(table.c[col], getattr(row, col), value) for col, value in values.items()):
+            unchanged += 1
+        else:
+            updates.append({"id": row_id, **values})
+
+    deletes = [row_id for row_id in current if row_id not in seen]
+    return RowDiff(inserts, updates, deletes, unchanged)
+
+
+async def apply_row_diff(db: AsyncSession, model, recipe_id: int, diff: RowDiff) -> None:
+    """One DELETE ... IN, one executemany UPDATE by primary key and one executemany INSERT, skipping empty ones."""
+    if diff.deletes:
+        await db.execute(
+            delete(model).where(model.id.in_(diff.deletes)),
+            execution_options={"synchronize_session": False},
+        )
+    if diff.updates:
+        await db.execute(update(model), diff.updates)
+    if diff.inserts:
+        await db.execute(insert(model), [{"recipe_id": recipe_id, **values} for values in diff.inserts])
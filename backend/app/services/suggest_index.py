@@ -0,0 +1,221 @@
+import asyncio
+import bisect
+import logging
+import time
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import select, func
+from sqlalchemy.exc import SQLAlchemyError
+from app.core.db import async_session
+from app.core.config import settings
+from app.models.category import Category
+from app.models.ingredient import Ingredient, IngredientAlias
+from app.models.recipe import Recipe
+from app.models.recipe_stats import RecipeStats
+from app.utils.text import normalize
+from app.utils.watermarks import resume_from
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on prefix matches inspected per lookup, keeps short prefixes cheap
+MAX_CANDIDATES = 500
+
+# Incremental refreshes insort into the live list (O(N) per key); a batch
+# larger than this is cheaper as a rebuild with a single sort
+MAX_INCREMENTAL_ROWS = 1000
+
+# Aliases are suggested as ingredients but tracked separately so that
+# refreshing an ingredient row does not drop its aliases
+KIND_BY_SOURCE = {"recipe": "recipe", "ingredient": "ingredient", "alias": "ingredient", "category": "category"}
+
+
+def word_starts(label: str) -> list[str]:
+    """Every suffix of the label that starts at a word, so "las" finds "Classic Lasagna"."""
+    key = normalize(label)
+    keys = [key]
+    for i, ch in enumerate(key):
+        if ch in " -" and i + 1 < len(key):
+            keys.append(key[i + 1:])
+    return keys
+
+
+def _advance(watermarks: dict[str, datetime], source: str, stamp: Optional[datetime]):
+    if stamp and (source not in watermarks or stamp > watermarks[source]):
+        watermarks[source] = stamp
+
+
+def build_index(rows: list[tuple]) -> tuple[list, dict, dict, dict]:
+    """
+    Keys, labels, weights and watermarks for a full rebuild from `_changes`
+    rows: keys are appended and sorted once, O(N log N) overall.
+    """
+    keys, labels, weights, watermarks = [], {}, {}, {}
+    for source, ref_id, label, weight, visible, stamp in rows:
+        if visible and label:
+            seen = labels.setdefault((source, ref_id), set())
+            if weight:
+                weights[(source, ref_id)] = weight
+            if label not in seen:
+                seen.add(label)
+                keys.extend((key, source, ref_id, label) for key in word_starts(label))
+        _advance(watermarks, source, stamp)
+    keys.sort()
+    return keys, labels, weights, watermarks
+
+
+class SuggestIndex:
+    """
+    In-process typeahead over recipe names, ingredient names/aliases and
+    category names. Lookups are a bisect into a sorted list of
+    (key, source, ref_id, label) tuples and never touch the database.
+
+    A background loop applies rows changed since the last refresh every
+    `refresh_seconds` (recipes/ingredients/categories by updated_at, aliases
+    by created_at, re-reading a short overlap for late commits) and rebuilds from scratch every `rebuild_seconds`, which
+    also drops deleted rows and refreshes recipe popularity weights.
+    """
+
+    def __init__(self, refresh_seconds: float, rebuild_seconds: float):
+        self.refresh_seconds = refresh_seconds
+        self.rebuild_seconds = rebuild_seconds
+        self._keys: list[tuple[str, str, int, str]] = []
+        self._labels: dict[tuple[str, int], set[str]] = {}
+        self._weights: dict[tuple[str, int], int] = {}
+        self._watermarks: dict[str, datetime] = {}
+        self._built_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+        self._loop_task: Optional[asyncio.Task] = None
+
+    @property
+    def ready(self) -> bool:
+        return self._built_at is not None
+
+    def suggest(self, prefix: str, limit: int = 10) -> list[dict]:
+        prefix = normalize(prefix)
+        if not prefix:
+            return []
+
+        best: dict[tuple[str, int, str], tuple] = {}
+        start = bisect.bisect_left(self._keys, (prefix,))
+        for key, source, ref_id, label in self._keys[start:start + MAX_CANDIDATES]:
+            if not key.startswith(prefix):
+                break
+            # Whole-label prefix beats a later word, then popularity, then shorter labels
+            rank = (
+                0 if normalize(label).startswith(prefix) else 1,
+                -self._weights.get((source, ref_id), 0),
+                len(label),
+                label,
+            )
+            entry = (KIND_BY_SOURCE[source], ref_id, label)
+            if entry not in best or rank < best[entry]:
+                best[entry] = rank
+
+        ordered = sorted(best, key=best.get)[:limit]
+        return [{"text": label, "kind": kind, "id": ref_id} for kind, ref_id, label in ordered]
+
+    def remove(self, source: str, ref_id: int):
+        labels = self._labels.pop((source, ref_id), set())
+        self._weights.pop((source, ref_id), None)
+        for label in labels:
+            for key in word_starts(label):
+                entry = (key, source, ref_id, label)
+                i = bisect.bisect_left(self._keys, entry)
+                if i < len(self._keys) and self._keys[i] == entry:
+                    del self._keys[i]
+
+    def _add(self, source: str, ref_id: int, label: str, weight: int = 0):
+        labels = self._labels.setdefault((source, ref_id), set())
+        if weight:
+            self._weights[(source, ref_id)] = weight
+        if label in labels:
+            return
+        labels.add(label)
+        for key in word_starts(label):
+            bisect.insort(self._keys, (key, source, ref_id, label))
+
+    async def _changes(self, since: dict[str, datetime]) -> list[tuple]:
+        """Rows changed since the per-source watermarks, less the overlap, as (source, id, label, weight, visible, stamp)."""
+        def newer(source, column):
+            return column >= resume_from(since[source]) if source in since else True
+
+        rows = []
+        async with async_session() as db:
+            recipes = await db.execute(
+                select(Recipe.id, Recipe.name, Recipe.is_public, func.coalesce(RecipeStats.likes_count, 0), Recipe.updated_at)
+                .outerjoin(RecipeStats, RecipeStats.recipe_id == Recipe.id)
+                .where(newer("recipe", Recipe.updated_at))
+            )
+            rows += [("recipe", i, name, likes, public, at) for i, name, public, likes, at in recipes]
+
+            ingredients = await db.execute(
+                select(Ingredient.id, Ingredient.name, Ingredient.updated_at)
+                .where(newer("ingredient", Ingredient.updated_at))
+            )
+            rows += [("ingredient", i, name, 0, True, at) for i, name, at in ingredients]
+
+            aliases = await db.execute(
+                select(IngredientAlias.canonical_ingredient_id, IngredientAlias.alias_text, IngredientAlias.created_at)
+                .where(newer("alias", IngredientAlias.created_at))
+            )
+            rows += [("alias", i, alias, 0, True, at) for i, alias, at in aliases]
+
+            categories = await db.execute(
+                select(Category.id, Category.name, Category.updated_at)
+                .where(newer("category", Category.updated_at))
+            )
+            rows += [("category", i, name, 0, True, at) for i, name, at in categories]
+        return rows
+
+    async def refresh(self, full: bool = False) -> int:
+        """Applies changes since the last refresh (or rebuilds). Returns the number of rows read."""
+        async with self._lock:
+            full = full or not self.ready or time.monotonic() - self._built_at >= self.rebuild_seconds
+            rows = await self._changes({} if full else self._watermarks)
+            if not full and len(rows) > MAX_INCREMENTAL_ROWS:
+                full = True
+                rows = await self._changes({})
+
+            if full:
+                # Built off the event loop into fresh structures; lookups keep
+                # using the old ones until the swap
+                built = await asyncio.to_thread(build_index, rows)
+                self._keys, self._labels, self._weights, self._watermarks = built
+                self._built_at = time.monotonic()
+                return len(rows)
+
+            for source, ref_id, label, weight, visible, stamp in rows:
+                # Renamed or unpublished rows lose their old labels; aliases only ever add
+                if source != "alias":
+                    self.remove(source, ref_id)
+                if visible and label:
+                    self._add(source, ref_id, label, weight)
+                _advance(self._watermarks, source, stamp)
+            return len(rows)
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.refresh_seconds)
+            try:
+                await self.refresh()
+            except SQLAlchemyError:
+                logger.exception("Suggest index refresh failed")
+
+    def start(self):
+        if self._loop_task is None:
+            self._loop_task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._loop_task is not None:
+            self._loop_task.cancel()
+            try:
+                await self._loop_task
+            except asyncio.CancelledError:
+                pass
+            self._loop_task = None
+
+
+suggest_index = SuggestIndex(
+    refresh_seconds=settings.suggest_refresh_seconds,
+    rebuild_seconds=settings.suggest_rebuild_seconds,
+)
@@ -0,0 +1,105 @@
+from datetime import timedelta
+from sqlalchemy import select, update, delete, func, literal, union_all, bindparam, TIMESTAMP, Float
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.models.recipe_like import RecipeLike
+from app.models.recipe_trending import RecipeTrending
+from app.models.recipe_view import UserRecipeView
+from app.models.saved_recipe import UserSavedRecipe
+
+# pg_advisory_xact_lock key serializing refreshes across Celery workers
+TRENDING_LOCK_KEY = 0x7472656e64  # "trend"
+
+
+def _events_between(since, until):
+    """Likes, views and saves in (since, until] as (recipe_id, at, weight) rows."""
+    def events(model, at_col, weight):
+        return select(
+            model.recipe_id.label("recipe_id"),
+            at_col.label("at"),
+            literal(weight, Float).label("weight"),
+        ).where(at_col > since, at_col <= until)
+
+    return union_all(
+        events(RecipeLike, RecipeLike.created_at, settings.trending_like_weight),
+        events(UserRecipeView, UserRecipeView.viewed_at, settings.trending_view_weight),
+        events(UserSavedRecipe, UserSavedRecipe.saved_at, settings.trending_save_weight),
+    ).subquery()
+
+
+async def refresh_trending_scores(db: AsyncSession, full: bool = False) -> int:
+    """
+    Brings recipe_trending up to date. Every event contributes
+    weight * 0.5 ** (age / half_life), so an existing score only needs to be
+    multiplied by the decay since the last refresh and the events that arrived
+    since then added on top. Without a previous refresh (or with `full`) the
+    table is rebuilt from the trending window instead.
+
+    Event timestamps are taken before commit (and views sit in the view
+    buffer first), so an event can land behind the watermark. Events within
+    `trending_overlap_minutes` of a refresh are therefore not settled: each
+    refresh restarts from `settled_score` and re-scores everything after the
+    previous settle cutoff, which makes the overlap idempotent.
+
+    Scores that decayed below `trending_min_score` are dropped so the table
+    (and the per-refresh decay UPDATE) stays proportional to recent activity.
+    Returns the number of recipes with fresh activity.
+
+    Full and incremental refreshes may be scheduled on different workers at
+    once; a transaction-scoped advisory lock runs them one after the other,
+    so neither decays rows the other is rewriting. The caller's commit
+    releases it.
+    """
+    await db.execute(select(func.pg_advisory_xact_lock(TRENDING_LOCK_KEY)))
+    # now() is the transaction start, which can predate the previous holder's
+    # commit; the wall clock after the lock never does
+    now = (await db.execute(select(func.clock_timestamp()))).scalar_one()
+    half_life = settings.trending_half_life_hours * 3600
+    overlap = timedelta(minutes=settings.trending_overlap_minutes)
+
+    watermark = None
+    if not full:
+        watermark = (await db.execute(select(func.max(RecipeTrending.scored_at)))).scalar()
+
+    if watermark is None:
+        await db.execute(delete(RecipeTrending))
+        since = now - timedelta(hours=settings.trending_window_hours)
+    else:
+        # Drop the unsettled part; it is re-scored below
+        factor = 0.5 ** ((now - watermark).total_seconds() / half_life)
+        settled = RecipeTrending.settled_score * factor
+        await db.execute(
+            update(RecipeTrending).values(score=settled, settled_score=settled, scored_at=now)
+        )
+        since = watermark - overlap
+
+    now_param = bindparam("now", now, type_=TIMESTAMP(timezone=True))
+    events = _events_between(since, now_param)
+    age = func.extract("epoch", now_param - events.c.at)
+    contribution = events.c.weight * func.power(0.5, age / half_life)
+    source = (
+        select(
+            events.c.recipe_id,
+            func.sum(contribution),
+            func.coalesce(func.sum(contribution).filter(events.c.at <= now - overlap), 0),
+            now_param,
+        )
+        .where(events.c.recipe_id.is_not(None))
+        .group_by(events.c.recipe_id)
+    )
+
+    stmt = insert(RecipeTrending).from_select(["recipe_id", "score", "settled_score", "scored_at"], source)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[RecipeTrending.recipe_id],
+        set_={
+            "score": RecipeTrending.score + stmt.excluded.score,
+            "settled_score": RecipeTrending.settled_score + stmt.excluded.settled_score,
+            "scored_at": stmt.excluded.scored_at,
+            "updated_at": func.now(),
+        },
+    )
+    result = await db.execute(stmt)
+
+    await db.execute(delete(RecipeTrending).where(RecipeTrending.score < settings.trending_min_score))
+    return result.rowcount or 0
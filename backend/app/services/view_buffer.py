@@ -0,0 +1,142 @@
+import asyncio
+import logging
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Optional
+from sqlalchemy import insert, select, exists, or_, values, column, cast, BigInteger, DateTime
+from sqlalchemy.exc import IntegrityError
+from app.core.db import async_session
+from app.core.config import settings
+from app.models.recipe import Recipe
+from app.models.recipe_view import UserRecipeView
+from app.models.user import User
+from app.services.recipe_stats import bump_views_bulk
+
+logger = logging.getLogger(__name__)
+
+
+class ViewBuffer:
+    """
+    Collects recipe view events in memory and writes them in bulk, so the
+    detail GET never opens a write transaction.
+
+    A flush happens when `max_size` events are pending, every `flush_seconds`
+    while the background loop runs, and once more on shutdown.
+    """
+
+    def __init__(self, max_size: int, flush_seconds: float):
+        self.max_size = max_size
+        self.flush_seconds = flush_seconds
+        self._pending: list[dict] = []
+        self._pending_counts: Counter = Counter()
+        self._lock = asyncio.Lock()
+        self._loop_task: Optional[asyncio.Task] = None
+        self._flush_tasks: set[asyncio.Task] = set()
+
+    def record(self, recipe_id: int, user_id: Optional[int]):
+        self._pending.append({
+            "recipe_id": recipe_id,
+            "user_id": user_id,
+            "viewed_at": datetime.now(timezone.utc),
+        })
+        self._pending_counts[recipe_id] += 1
+
+        if len(self._pending) >= self.max_size:
+            task = asyncio.get_running_loop().create_task(self.flush())
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+
+    def pending_views(self, recipe_id: int) -> int:
+        """Views recorded by this process that are not in recipe_stats yet."""
+        return self._pending_counts.get(recipe_id, 0)
+
+    def discard(self, recipe_id: int):
+        """Drops pending views of a recipe that is being deleted."""
+        if self._pending_counts.pop(recipe_id, None):
+            self._pending = [v for v in self._pending if v["recipe_id"] != recipe_id]
+
+    @staticmethod
+    def _insert_statement(batch: list[dict]):
+        """
+        INSERT ... SELECT over the batch joined to recipes (and users), so
+        views of rows deleted since they were recorded are skipped instead
+        of failing the foreign keys for the whole batch. Returns the recipe
+        id of every view written, for the counter bump.
+        """
+        rows = values(
+            column("recipe_id", BigInteger),
+            column("user_id", BigInteger),
+            column("viewed_at", DateTime(timezone=True)),
+            name="pending_views",
+        ).data([(v["recipe_id"], v["user_id"], v["viewed_at"]) for v in batch])
+        # None renders as a bare NULL, which Postgres types as text when
+        # every row in the batch is anonymous
+        user_id = cast(rows.c.user_id, BigInteger)
+        source = (
+            select(rows.c.recipe_id, user_id, rows.c.viewed_at)
+            .join(Recipe, Recipe.id == rows.c.recipe_id)
+            .where(or_(user_id.is_(None), exists().where(User.id == user_id)))
+        )
+        return (
+            insert(UserRecipeView)
+            .from_select(["recipe_id", "user_id", "viewed_at"], source)
+            .returning(UserRecipeView.recipe_id)
+        )
+
+    async def flush(self) -> int:
+        async with self._lock:
+            if not self._pending:
+                return 0
+            batch, self._pending = self._pending, []
+            counts, self._pending_counts = self._pending_counts, Counter()
+
+            try:
+                async with async_session() as db:
+                    result = await db.execute(self._insert_statement(batch))
+                    written = Counter(result.scalars().all())
+                    await bump_views_bulk(db, dict(written))
+                    await db.commit()
+            except IntegrityError:
+                # A row deleted mid-flush; retrying would fail the same way
+                logger.exception("Dropping %d recipe views that no longer fit the schema", len(batch))
+                return 0
+            except Exception:
+                # Includes connection errors and timeouts raised by the driver
+                logger.exception("Failed to flush %d recipe views", len(batch))
+                # Keep the events for the next attempt, but never grow without bound
+                if len(self._pending) + len(batch) <= self.max_size * 10:
+                    self._pending = batch + self._pending
+                    self._pending_counts.update(counts)
+                return 0
+
+            return sum(written.values())
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.flush_seconds)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Recipe view flush failed")
+
+    def start(self):
+        if self._loop_task is None:
+            self._loop_task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._loop_task is not None:
+            self._loop_task.cancel()
+            try:
+                await self._loop_task
+            except asyncio.CancelledError:
+                pass
+            self._loop_task = None
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+        await self.flush()
+
+
+view_buffer = ViewBuffer(
+    max_size=settings.view_buffer_max_size,
+    flush_seconds=settings.view_buffer_flush_seconds,
+)
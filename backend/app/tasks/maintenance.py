@@ -4,9 +4,15 @@ from datetime import datetime, timedelta, timezone
 from sqlalchemy import select, update, or_
 from app.celery_app import celery_app
 from app.core.db import async_session, engine
+from app.core.config import settings
 from app.models.recipe import Recipe
 from app.models.recipe_media import RecipeMedia
 from app.services.media_cleanup import cleanup_media
+from app.services.recipe_stats import reconcile_recipe_stats
+from app.services.trending import refresh_trending_scores
+from app.services.coview import rebuild_recommendations
+from app.services.minhash import refresh_minhashes
+from app.services.recipe_export import prune_tombstones
 from app.services.storage_service import head_object
 from botocore.exceptions import ClientError
 
@@ -95,6 +101,47 @@ async def verify_and_regenerate_thumbnails_logic():
                 regenerated += 1
         return f"Verified items, triggered regeneration for {regenerated} items."
 
+async def reconcile_recipe_stats_logic():
+    """7. 📊 Rebuild drifted like/view/save counters from the event tables."""
+    async with async_session() as db:
+        fixed = await reconcile_recipe_stats(db)
+        await db.commit()
+        return f"Reconciled stats for {fixed} recipes."
+
+async def refresh_trending_logic(full: bool = False):
+    """8. 🔥 Decay trending scores and fold in activity since the last refresh."""
+    async with async_session() as db:
+        active = await refresh_trending_scores(db, full=full)
+        await db.commit()
+        return f"Refreshed trending scores ({active} recipes with new activity)."
+
+async def rebuild_recommendations_logic():
+    """9. 👥 Recompute "people also viewed" neighbours from the interaction log."""
+    async with async_session() as db:
+        recommended = await rebuild_recommendations(db)
+        await db.commit()
+        return f"Rebuilt co-view recommendations for {recommended} recipes."
+
+async def refresh_minhash_logic():
+    """10. 🧬 Recompute ingredient MinHash signatures for new and edited recipes."""
+    total = 0
+    async with async_session() as db:
+        while True:
+            # One transaction per batch keeps lock time short on a large backlog
+            done = await refresh_minhashes(db)
+            await db.commit()
+            total += done
+            if done < settings.minhash_batch_size:
+                break
+    return f"Refreshed MinHash signatures for {total} recipes."
+
+async def prune_recipe_tombstones_logic():
+    """11. 🪦 Forget deleted recipes older than the export tombstone retention."""
+    async with async_session() as db:
+        pruned = await prune_tombstones(db)
+        await db.commit()
+        return f"Pruned {pruned} recipe tombstones."
+
 # --- CELERY TASK WRAPPERS ---
 
 @celery_app.task(name="app.tasks.maintenance.run_all_maintenance")
@@ -107,6 +154,11 @@ def run_all_maintenance():
         results.append(await retry_stuck_media_logic())
         results.append(await clean_expired_drafts_logic())
         results.append(await verify_and_regenerate_thumbnails_logic())
+        results.append(await reconcile_recipe_stats_logic())
+        # Daily full rebuild also drops contributions from removed likes/saves
+        results.append(await refresh_trending_logic(full=True))
+        results.append(await refresh_minhash_logic())
+        results.append(await prune_recipe_tombstones_logic())
         return results
 
     try:
@@ -124,3 +176,57 @@ def run_all_maintenance():
         return loop.run_until_complete(run())
     finally:
         loop.run_until_complete(engine.dispose())
+
+
+@celery_app.task(name="app.tasks.maintenance.refresh_trending")
+def refresh_trending():
+    """Incremental trending refresh; scheduled far more often than run_all_maintenance."""
+    try:
+        loop = asyncio.get_event_loop()
+    except RuntimeError:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+    if loop.is_running():
+        return "Task cannot be run synchronously in a running loop."
+
+    try:
+        return loop.run_until_complete(refresh_trending_logic())
+    finally:
+        loop.run_until_complete(engine.dispose())
+
+
+@celery_app.task(name="app.tasks.maintenance.rebuild_recommendations")
+def rebuild_recommendations_task():
+    """Nightly co-view rebuild; kept out of run_all_maintenance because it scans the whole event window."""
+    try:
+        loop = asyncio.get_event_loop()
+    except RuntimeError:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+    if loop.is_running():
+        return "Task cannot be run synchronously in a running loop."
+
+    try:
+        return loop.run_until_complete(rebuild_recommendations_logic())
+    finally:
+        loop.run_until_complete(engine.dispose())
+
+
+@celery_app.task(name="app.tasks.maintenance.refresh_minhash")
+def refresh_minhash():
+    """Picks up ingredient edits for related recipes; scheduled every few minutes."""
+    try:
+        loop = asyncio.get_event_loop()
+    except RuntimeError:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+    if loop.is_running():
+        return "Task cannot be run synchronously in a running loop."
+
+    try:
+        return loop.run_until_complete(refresh_minhash_logic())
+    finally:
+        loop.run_until_complete(engine.dispose())
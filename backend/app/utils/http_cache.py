@@ -0,0 +1,40 @@
+import hashlib
+from typing import Any, Optional
+from fastapi import Request, Response
+from app.core.config import settings
+from app.models.user import User
+
+
+def make_etag(*parts: Any) -> str:
+    """Strong validator over everything the response body depends on."""
+    digest = hashlib.sha1(repr(parts).encode()).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    # If-None-Match uses the weak comparison function (RFC 9110 13.1.2)
+    candidates = [tag.strip().removeprefix("W/") for tag in header.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def cache_control_for(user: Optional[User]) -> str:
+    if user:
+        # Body carries is_liked / is_saved for this viewer
+        return "private, no-cache"
+    return f"public, max-age={settings.recipe_public_max_age}"
+
+
+def apply_cache_headers(response: Response, etag: str, cache_control: str, vary: Optional[str] = "Authorization"):
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control
+    if vary:
+        response.headers["Vary"] = vary
+
+
+def not_modified(etag: str, cache_control: str, vary: Optional[str] = "Authorization") -> Response:
+    response = Response(status_code=304)
+    apply_cache_headers(response, etag, cache_control, vary)
+    return response
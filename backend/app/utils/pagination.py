@@ -0,0 +1,86 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, Optional, Sequence
+from fastapi import HTTPException
+from sqlalchemy import desc, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Pack the sort-key tuple of the last row on a page into an opaque token."""
+    payload = [{"dt": v.isoformat()} if isinstance(v, datetime) else v for v in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _matches_key(value: Any, key: Any) -> bool:
+    """Whether a decoded cursor value can be bound against `key` (NULLs are left to SQL)."""
+    if value is None:
+        return True
+    try:
+        expected = key.type.python_type
+    except (AttributeError, NotImplementedError):
+        return True
+    if isinstance(value, bool) and expected is not bool:
+        return False
+    if expected is float:
+        return isinstance(value, (int, float))
+    return isinstance(value, expected)
+
+
+def decode_cursor(cursor: str, sort_keys: Sequence[Any]) -> list:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        values = [
+            datetime.fromisoformat(v["dt"]) if isinstance(v, dict) else v
+            for v in payload
+        ]
+    except (ValueError, TypeError, KeyError):
+        raise HTTPException(400, "Invalid cursor")
+
+    if len(values) != len(sort_keys):
+        raise HTTPException(400, "Invalid cursor")
+    # A well-formed token with a wrong-typed value would otherwise reach the
+    # keyset comparison and fail in Postgres
+    if not all(_matches_key(v, k) for v, k in zip(values, sort_keys)):
+        raise HTTPException(400, "Invalid cursor")
+    return values
+
+
+async def fetch_page(
+    db: AsyncSession,
+    stmt: Select,
+    sort_keys: Sequence[Any],
+    page: int,
+    per_page: int,
+    cursor: Optional[str] = None,
+) -> tuple[list, Optional[str]]:
+    """
+    Runs `stmt` ordered by `sort_keys` (all descending) and returns one page of
+    entities plus the cursor for the next page.
+
+    With a cursor the page starts right after the encoded sort-key tuple
+    (keyset pagination), so the cost does not depend on how deep the client
+    is. Without one we fall back to OFFSET for page/per_page clients.
+    """
+    stmt = stmt.order_by(*[desc(k) for k in sort_keys])
+
+    if cursor:
+        values = decode_cursor(cursor, sort_keys)
+        stmt = stmt.where(tuple_(*sort_keys) < tuple_(*values))
+    else:
+        stmt = stmt.offset((page - 1) * per_page)
+
+    # One extra row tells us whether a next page exists
+    stmt = stmt.add_columns(*sort_keys).limit(per_page + 1)
+    rows = (await db.execute(stmt)).unique().all()
+
+    next_cursor = None
+    if len(rows) > per_page:
+        rows = rows[:per_page]
+        next_cursor = encode_cursor(list(rows[-1][1:]))
+
+    return [row[0] for row in rows], next_cursor
@@ -0,0 +1,3 @@
+def normalize(value: str) -> str:
+    """Case-folded with runs of whitespace collapsed, for matching labels and names."""
+    return " ".join(value.casefold().split())
@@ -0,0 +1,16 @@
+from datetime import datetime, timedelta
+from typing import Optional
+from app.core.config import settings
+
+
+def resume_from(watermark: Optional[datetime]) -> Optional[datetime]:
+    """
+    Where an incremental refresh should resume reading. updated_at and
+    created_at are stamped at transaction start, so a row can commit after
+    a later-stamped one already moved the watermark past it; re-reading the
+    last `refresh_overlap_seconds` picks it up. Rows must be applied
+    idempotently.
+    """
+    if watermark is None:
+        return None
+    return watermark - timedelta(seconds=settings.refresh_overlap_seconds)
@@ -0,0 +1,130 @@
+"""
+Compares the old JOIN-based category filter with the EXISTS semi-joins
+used by GET /recipes for a multi-category filter.
+
+Usage (from backend/):
+    python -m scripts.bench_category_filters --recipes 200000 --categories 5
+
+Seeds synthetic public recipes with 1-4 random categories each when the
+tables are too small, then times the first page and the total count for
+any-of and all-of filters on the N most used categories.
+"""
+import argparse
+import asyncio
+import random
+import time
+from sqlalchemy import select, func, insert, desc, distinct
+from app.core.db import async_session, engine
+from app.models.category import Category
+from app.models.recipe import Recipe
+from app.models.recipe_category import RecipeCategory
+from app.models.user import User
+from app.services.recipe_filters import category_filter
+from app.utils.pagination import fetch_page
+
+SEED_CHUNK = 5000
+
+
+async def ensure_rows(db, needed: int):
+    have = (await db.execute(select(func.count()).select_from(Recipe))).scalar() or 0
+    if have >= needed:
+        return
+    user_id = (await db.execute(select(User.id).limit(1))).scalar()
+    if user_id is None:
+        raise SystemExit("Need at least one user to attach synthetic recipes to.")
+
+    print(f"Seeding {needed - have} synthetic recipes...")
+    for start in range(have, needed, SEED_CHUNK):
+        rows = [
+            {"user_id": user_id, "name": f"Bench recipe {i}", "is_public": True}
+            for i in range(start, min(start + SEED_CHUNK, needed))
+        ]
+        await db.execute(insert(Recipe), rows)
+        await db.commit()
+
+
+async def ensure_categories(db):
+    category_ids = (await db.execute(select(Category.id))).scalars().all()
+    if not category_ids:
+        raise SystemExit("Need seeded categories (app/scripts/seed_data.py).")
+
+    uncategorised = (await db.execute(
+        select(Recipe.id).where(~select(RecipeCategory.recipe_id).where(RecipeCategory.recipe_id == Recipe.id).exists())
+    )).scalars().all()
+    if not uncategorised:
+        return
+
+    print(f"Assigning categories to {len(uncategorised)} recipes...")
+    rng = random.Random(16)
+    for start in range(0, len(uncategorised), SEED_CHUNK):
+        rows = [
+            {"recipe_id": recipe_id, "category_id": category_id}
+            for recipe_id in uncategorised[start:start + SEED_CHUNK]
+            for category_id in rng.sample(category_ids, min(len(category_ids), rng.randint(1, 4)))
+        ]
+        await db.execute(insert(RecipeCategory), rows)
+        await db.commit()
+
+
+async def timed(label: str, coro, repeat: int):
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        await coro()
+        samples.append((time.perf_counter() - t0) * 1000)
+    samples.sort()
+    print(f"{label:<28} median {samples[len(samples) // 2]:8.2f} ms   p95 {samples[int(len(samples) * 0.95) - 1]:8.2f} ms")
+
+
+async def main(recipes: int, categories: int, per_page: int, repeat: int):
+    sort_keys = [Recipe.created_at, Recipe.id]
+    base = select(Recipe).where(Recipe.is_public == True)
+    engine.sync_engine.echo = False
+
+    async with async_session() as db:
+        await ensure_rows(db, recipes)
+        await ensure_categories(db)
+
+        ids = (await db.execute(
+            select(RecipeCategory.category_id)
+            .group_by(RecipeCategory.category_id)
+            .order_by(desc(func.count()))
+            .limit(categories)
+        )).scalars().all()
+        print(f"Filtering on categories {ids}")
+
+        # What the endpoint did before: join, then de-duplicate in Python / with DISTINCT
+        join_any = base.join(Recipe.categories).where(Category.id.in_(ids))
+        join_all = base.where(Recipe.id.in_(
+            select(RecipeCategory.recipe_id)
+            .where(RecipeCategory.category_id.in_(ids))
+            .group_by(RecipeCategory.recipe_id)
+            .having(func.count() == len(ids))
+        ))
+        exists_any = base.where(category_filter(ids, "any"))
+        exists_all = base.where(category_filter(ids, "all"))
+
+        def count(stmt, column=Recipe.id):
+            return db.execute(stmt.with_only_columns(func.count(column)).order_by(None))
+
+        for label, stmt in [
+            ("join     any", join_any),
+            ("exists   any", exists_any),
+            ("group-by all", join_all),
+            ("exists   all", exists_all),
+        ]:
+            await timed(f"{label} page 1", lambda: fetch_page(db, stmt, sort_keys, 1, per_page), repeat)
+            column = distinct(Recipe.id) if stmt is join_any else Recipe.id
+            await timed(f"{label} count", lambda: count(stmt, column), repeat)
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--recipes", type=int, default=200000)
+    parser.add_argument("--categories", type=int, default=5)
+    parser.add_argument("--per-page", type=int, default=12)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.recipes, args.categories, args.per_page, args.repeat))
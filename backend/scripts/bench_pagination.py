@@ -0,0 +1,83 @@
+"""
+Compares OFFSET vs keyset (cursor) pagination latency on the recipe feed.
+
+Usage (from backend/):
+    python -m scripts.bench_pagination --pages 10000 --per-page 12
+
+Seeds synthetic public recipes when the table holds fewer rows than the
+deepest page needs, then times page 1 and page N with both strategies.
+"""
+import argparse
+import asyncio
+import time
+from sqlalchemy import select, func, insert, desc
+from app.core.db import async_session, engine
+from app.models.recipe import Recipe
+from app.models.user import User
+from app.utils.pagination import fetch_page, encode_cursor
+
+SEED_CHUNK = 5000
+
+
+async def ensure_rows(db, needed: int):
+    have = (await db.execute(select(func.count()).select_from(Recipe))).scalar() or 0
+    if have >= needed:
+        return
+    user_id = (await db.execute(select(User.id).limit(1))).scalar()
+    if user_id is None:
+        raise SystemExit("Need at least one user to attach synthetic recipes to.")
+
+    print(f"Seeding {needed - have} synthetic recipes...")
+    for start in range(have, needed, SEED_CHUNK):
+        rows = [
+            {"user_id": user_id, "name": f"Bench recipe {i}", "is_public": True}
+            for i in range(start, min(start + SEED_CHUNK, needed))
+        ]
+        await db.execute(insert(Recipe), rows)
+        await db.commit()
+
+
+async def timed(label: str, coro, repeat: int):
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        await coro()
+        samples.append((time.perf_counter() - t0) * 1000)
+    samples.sort()
+    print(f"{label:<28} median {samples[len(samples) // 2]:8.2f} ms   p95 {samples[int(len(samples) * 0.95) - 1]:8.2f} ms")
+
+
+async def main(pages: int, per_page: int, repeat: int):
+    sort_keys = [Recipe.created_at, Recipe.id]
+    # Same statement GET /recipes builds for the unfiltered latest feed
+    base = select(Recipe)
+    engine.sync_engine.echo = False
+
+    async with async_session() as db:
+        await ensure_rows(db, pages * per_page)
+
+        # Cursor a client would hold after walking to page N-1; derived from
+        # `base` so it walks exactly the rows both strategies page over
+        boundary = (await db.execute(
+            base.with_only_columns(*sort_keys)
+            .order_by(*[desc(k) for k in sort_keys])
+            .offset((pages - 1) * per_page - 1)
+            .limit(1)
+        )).one()
+        deep_cursor = encode_cursor(list(boundary))
+
+        await timed("offset   page 1", lambda: fetch_page(db, base, sort_keys, 1, per_page), repeat)
+        await timed(f"offset   page {pages}", lambda: fetch_page(db, base, sort_keys, pages, per_page), repeat)
+        await timed("keyset   page 1", lambda: fetch_page(db, base, sort_keys, 1, per_page, None), repeat)
+        await timed(f"keyset   page {pages}", lambda: fetch_page(db, base, sort_keys, 1, per_page, deep_cursor), repeat)
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=10000)
+    parser.add_argument("--per-page", type=int, default=12)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.pages, args.per_page, args.repeat))
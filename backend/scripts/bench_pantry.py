@@ -0,0 +1,68 @@
+"""
+Latency of PantryIndex.match on a synthetic catalog (no database needed).
+
+Ingredient popularity is Zipf-like, so a handful of staples appear in a
+large share of recipes, as in real data.
+
+Usage (from backend/):
+    python -m scripts.bench_pantry --recipes 1000000
+"""
+import argparse
+import bisect
+import itertools
+import bisect
+import random
+import statistics
+import time
+from app.services.pantry_index import PantryIndex
+
+
+def build(recipes: int, ingredients: int, seed: int) -> PantryIndex:
+    rng = random.Random(seed)
+    cum_weights = list(itertools.accumulate(1 / rank for rank in range(1, ingredients + 1)))
+    total = cum_weights[-1]
+    index = PantryIndex(refresh_seconds=60, rebuild_seconds=600, staple_fraction=0.05)
+    for recipe_id in range(1, recipes + 1):
+        ids = {bisect.bisect(cum_weights, rng.random() * total) + 1 for _ in range(rng.randint(5, 14))}
+        index._add(recipe_id, list(ids), len(ids))
+    index._built_at = time.monotonic()
+    return index
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--recipes", type=int, default=1_000_000)
+    parser.add_argument("--ingredients", type=int, default=3000)
+    parser.add_argument("--pantry", type=int, default=12)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    index = build(args.recipes, args.ingredients, args.seed)
+    print(f"built index for {args.recipes} recipes in {time.perf_counter() - started:.1f}s")
+
+    rng = random.Random(args.seed + 1)
+    pantries = [
+        # A few staples plus distinctive ingredients, like a real pantry
+        rng.sample(range(1, 6), 3) + rng.sample(range(20, args.ingredients + 1), args.pantry - 3)
+        for _ in range(args.queries)
+    ]
+
+    # Staple hash sets are built on first use; measure steady state
+    for pantry in pantries:
+        index.match(pantry, limit=20)
+
+    timings = []
+    for pantry in pantries:
+        started = time.perf_counter()
+        index.match(pantry, limit=20)
+        timings.append((time.perf_counter() - started) * 1000)
+
+    timings.sort()
+    print(f"match: p50 {statistics.median(timings):.1f} ms, "
+          f"p95 {timings[int(len(timings) * 0.95) - 1]:.1f} ms, max {timings[-1]:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Recall of the MinHash/LSH related-recipes lookup against exact Jaccard.
+
+Usage (from backend/):
+    python -m scripts.bench_related --recipes 20000 --queries 200
+
+Runs in memory on synthetic ingredient sets, with the same signature and
+banding code as services/minhash.py. A share of the recipes are variants of
+a few hundred base recipes (some ingredients swapped), so every query has
+true neighbours at a range of similarities. For each query it reports the
+recall of all neighbours above --threshold and of the exact top 10 (above
+related_min_similarity, as the endpoint filters), plus the
+candidates scored per lookup compared to a full scan.
+"""
+import argparse
+import random
+import time
+from bisect import bisect
+from collections import defaultdict
+from itertools import accumulate
+from app.core.config import settings
+from app.services.minhash import minhash_signature, band_buckets, estimated_jaccard
+
+
+def synthetic_recipes(count: int, vocabulary: int, bases: int, rng: random.Random) -> list[frozenset]:
+    # Zipf-ish popularity: salt and onions everywhere, saffron rarely
+    cum_weights = list(accumulate(1 / (rank + 1) for rank in range(vocabulary)))
+    total = cum_weights[-1]
+
+    def ingredient():
+        return f"i:{bisect(cum_weights, rng.random() * total)}"
+
+    def draw(size):
+        picked = set()
+        while len(picked) < size:
+            picked.add(ingredient())
+        return picked
+
+    base_sets = [draw(rng.randint(6, 14)) for _ in range(bases)]
+    recipes = []
+    for _ in range(count):
+        if rng.random() < 0.5:
+            # Variant of a base recipe with a random share of ingredients swapped out
+            swap = rng.random() * 0.6
+            recipes.append(frozenset(ingredient() if rng.random() < swap else item for item in sorted(rng.choice(base_sets))))
+        else:
+            recipes.append(frozenset(draw(rng.randint(5, 15))))
+    return recipes
+
+
+def jaccard(a: frozenset, b: frozenset) -> float:
+    return len(a & b) / len(a | b)
+
+
+def main(recipes: int, queries: int, threshold: float, vocabulary: int, seed: int):
+    rng = random.Random(seed)
+    sets = synthetic_recipes(recipes, vocabulary, max(10, recipes // 100), rng)
+
+    t0 = time.perf_counter()
+    signatures = [minhash_signature(s) for s in sets]
+    buckets = defaultdict(list)
+    for recipe_id, signature in enumerate(signatures):
+        for band, bucket in enumerate(band_buckets(signature)):
+            buckets[(band, bucket)].append(recipe_id)
+    print(f"Indexed {recipes} recipes ({settings.minhash_num_perm} perms, {settings.minhash_bands} bands) "
+          f"in {time.perf_counter() - t0:.1f}s")
+
+    found_above = true_above = found_top = true_top = 0
+    candidates_scored = 0
+    exact_ms = lsh_ms = 0.0
+    for query in rng.sample(range(recipes), queries):
+        t0 = time.perf_counter()
+        exact = sorted(
+            ((jaccard(sets[query], sets[other]), other) for other in range(recipes) if other != query),
+            reverse=True,
+        )
+        exact_ms += (time.perf_counter() - t0) * 1000
+
+        t0 = time.perf_counter()
+        candidates = {
+            other
+            for band, bucket in enumerate(band_buckets(signatures[query]))
+            for other in buckets[(band, bucket)]
+            if other != query
+        }
+        ranked = sorted(
+            ((estimated_jaccard(signatures[query], signatures[other]), other) for other in candidates),
+            reverse=True,
+        )
+        lsh_ms += (time.perf_counter() - t0) * 1000
+        candidates_scored += len(candidates)
+
+        relevant = {other for score, other in exact if score >= threshold}
+        found_above += len(relevant & candidates)
+        true_above += len(relevant)
+
+        # The endpoint drops anything under related_min_similarity anyway
+        top = {other for score, other in exact[:10] if score >= settings.related_min_similarity}
+        found_top += len(top & {other for _, other in ranked[:10]})
+        true_top += len(top)
+
+    print(f"recall J>={threshold:<4}            {found_above / max(true_above, 1):6.3f}   ({true_above} true pairs)")
+    print(f"recall@10 vs exact top 10   {found_top / max(true_top, 1):6.3f}   (J>={settings.related_min_similarity})")
+    print(f"candidates per lookup       {candidates_scored / queries:8.1f}   (full scan: {recipes - 1})")
+    print(f"exact scan per query        {exact_ms / queries:8.2f} ms")
+    print(f"lsh lookup per query        {lsh_ms / queries:8.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--recipes", type=int, default=20000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--threshold", type=float, default=0.5)
+    parser.add_argument("--vocabulary", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=19)
+    args = parser.parse_args()
+    main(args.recipes, args.queries, args.threshold, args.vocabulary, args.seed)
@@ -0,0 +1,93 @@
+"""
+Serialization cost of one GET /recipes page: Pydantic models built by hand
+and then re-validated and dumped through the response_model (the old path)
+vs plain dicts encoded once with orjson (FastJSONResponse).
+
+Usage (from backend/):
+    python -m scripts.bench_serialization --per-page 100 --ingredients 12 --steps 8 --media 3
+
+Runs on synthetic payloads only; no database needed. Set MEDIA_PUBLIC_BASE_URL,
+otherwise presigning every media URL dominates both paths.
+"""
+import argparse
+import time
+from pydantic import TypeAdapter
+from app.schemas.recipe import PaginatedRecipes, RecipeRead
+from app.services.recipe_json import recipe_json
+from app.utils.fast_json import FastJSONResponse
+
+
+def synthetic_payload(i: int, ingredients: int, steps: int, media: int) -> dict:
+    return {
+        "id": i,
+        "name": f"Bench recipe {i}",
+        "description": "A reasonably long description of the dish. " * 4,
+        "chefs_note": None,
+        "cook_time_minutes": 30,
+        "servings": 4,
+        "is_public": True,
+        "author_name": "Bench Author",
+        "ingredients": [
+            {
+                "id": i * 100 + n, "ingredient_id": n, "name_text": f"ingredient {n}", "quantity": 1.5,
+                "quantity_text": "1 1/2", "unit_id": 1, "unit_name": "cup", "preparation_notes": "chopped",
+                "display_order": n,
+            }
+            for n in range(ingredients)
+        ],
+        "steps": [
+            {"id": i * 100 + n, "step_number": n + 1, "instruction": "Stir gently until combined. " * 3, "estimated_minutes": 5}
+            for n in range(steps)
+        ],
+        "categories": ["Breakfast", "Fruit-Based"],
+        "media": [
+            {
+                "id": i * 10 + n, "type": "image", "is_primary": n == 0, "display_order": n, "processed": True,
+                "key": f"recipes/{i}/{n}.jpg", "thumbnail_small_key": f"recipes/{i}/{n}_s.jpg",
+                "thumbnail_medium_key": f"recipes/{i}/{n}_m.jpg", "thumbnail_large_key": f"recipes/{i}/{n}_l.jpg",
+                "width": 1200, "height": 800, "duration_seconds": None, "processing_error": None,
+            }
+            for n in range(media)
+        ],
+    }
+
+
+INTERACTIONS = {"is_liked": False, "is_saved": True, "likes_count": 12, "views_count": 345}
+
+
+def timed(label: str, fn, repeat: int):
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        body = fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    samples.sort()
+    print(f"{label:<28} median {samples[len(samples) // 2]:8.2f} ms   p95 {samples[int(len(samples) * 0.95) - 1]:8.2f} ms   {len(body) / 1024:7.1f} KiB")
+
+
+def main(per_page: int, ingredients: int, steps: int, media: int, repeat: int):
+    payloads = [synthetic_payload(i, ingredients, steps, media) for i in range(per_page)]
+    page = {"total": 10000, "total_is_exact": True, "page": 1, "per_page": per_page, "next_cursor": None, "facets": None}
+    adapter = TypeAdapter(PaginatedRecipes)
+
+    def models():
+        built = PaginatedRecipes(**page, recipes=[RecipeRead(**p, **INTERACTIONS) for p in payloads])
+        # What FastAPI does with the returned object for response_model
+        return adapter.dump_json(adapter.validate_python(built, from_attributes=True))
+
+    def plain():
+        return FastJSONResponse({**page, "recipes": [recipe_json(p, INTERACTIONS) for p in payloads]}).body
+
+    timed("models + response_model", models, repeat)
+    timed("dicts + orjson", plain, repeat)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--per-page", type=int, default=100)
+    parser.add_argument("--ingredients", type=int, default=12)
+    parser.add_argument("--steps", type=int, default=8)
+    parser.add_argument("--media", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+    main(args.per_page, args.ingredients, args.steps, args.media, args.repeat)
@@ -0,0 +1,64 @@
+"""
+Throughput of recipe view ingestion: one commit per view (the old get_recipe
+behaviour) vs the in-process ViewBuffer flushing in bulk.
+
+Usage (from backend/):
+    python -m scripts.bench_view_ingestion --views 5000
+
+Writes real (anonymous) view events, so point it at a scratch database.
+"""
+import argparse
+import asyncio
+import time
+from sqlalchemy import select
+from app.core.db import async_session, engine
+from app.models.recipe import Recipe
+from app.models.recipe_view import UserRecipeView
+from app.services.recipe_stats import bump_recipe_stats
+from app.services.view_buffer import ViewBuffer
+
+
+async def per_request_commit(recipe_ids: list[int], views: int):
+    for i in range(views):
+        async with async_session() as db:
+            recipe_id = recipe_ids[i % len(recipe_ids)]
+            db.add(UserRecipeView(recipe_id=recipe_id, user_id=None))
+            await bump_recipe_stats(db, recipe_id, views=1)
+            await db.commit()
+
+
+async def buffered(recipe_ids: list[int], views: int, batch: int):
+    buffer = ViewBuffer(max_size=batch, flush_seconds=1.0)
+    buffer.start()
+    for i in range(views):
+        buffer.record(recipe_ids[i % len(recipe_ids)], None)
+        if i % batch == 0:
+            # Yield like a real request loop would so size-triggered flushes run
+            await asyncio.sleep(0)
+    await buffer.stop()
+
+
+async def main(views: int, batch: int):
+    engine.sync_engine.echo = False
+    async with async_session() as db:
+        recipe_ids = list((await db.execute(select(Recipe.id).limit(100))).scalars().all())
+    if not recipe_ids:
+        raise SystemExit("Need at least one recipe to record views against.")
+
+    for label, run in (
+        ("commit per view", lambda: per_request_commit(recipe_ids, views)),
+        (f"buffered (batch={batch})", lambda: buffered(recipe_ids, views, batch)),
+    ):
+        t0 = time.perf_counter()
+        await run()
+        elapsed = time.perf_counter() - t0
+        print(f"{label:<24} {views / elapsed:10.0f} views/s   ({elapsed:.2f} s)")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--views", type=int, default=5000)
+    parser.add_argument("--batch", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(main(args.views, args.batch))
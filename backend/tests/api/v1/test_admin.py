@@ -0,0 +1,69 @@
+import json
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from app.core.config import settings
+from app.models.recipe import Recipe
+from app.models.recipe_stats import RecipeStats
+from app.models.unit import Unit
+
+def jsonl(*rows) -> str:
+    return "\n".join(row if isinstance(row, str) else json.dumps(row) for row in rows) + "\n"
+
+@pytest.mark.asyncio
+async def test_import_recipes_requires_admin(client: AsyncClient, auth_headers: dict, monkeypatch):
+    monkeypatch.setattr(settings, "admin_user_ids", [])
+    response = await client.post("/admin/recipes/import", content=b"", headers=auth_headers)
+    assert response.status_code == 403
+
+@pytest.mark.asyncio
+async def test_import_recipes_jsonl(client: AsyncClient, db, auth_headers: dict, monkeypatch):
+    monkeypatch.setattr(settings, "admin_user_ids", [1])
+    # Small chunks so the bad rows land in different transactions
+    monkeypatch.setattr(settings, "import_chunk_size", 2)
+    gram = Unit(name="gram", symbol="g")
+    db.add(gram)
+    await db.commit()
+
+    body = jsonl(
+        {
+            "name": "Imported Pancakes", "categories": [1, 57], "cook_time_minutes": 20,
+            "ingredients": [
+                {"name_text": "Sugar", "quantity": 50, "unit": "g", "display_order": 0},
+                {"name_text": "Stardust", "quantity_text": "a pinch", "display_order": 1},
+            ],
+            "steps": [{"step_number": 1, "instruction": "Mix"}, {"step_number": 2, "instruction": "Fry"}],
+        },
+        "{not json",
+        {"name": "Imported Bad Category", "categories": [999], "ingredients": [], "steps": []},
+        "",
+        {"name": "Imported Other Owner", "user_id": 2, "ingredients": [{"name_text": "salt"}], "steps": []},
+        # Passes validation, rejected by the unit FK; its chunk falls back to row-by-row
+        {"name": "Imported Bad FK", "ingredients": [{"name_text": "salt", "unit_id": 999999}], "steps": []},
+        {"name": "Imported Toast", "ingredients": [{"name_text": "butter", "unit": "smidgen"}], "steps": []},
+        {"name": "Imported Porridge", "ingredients": [], "steps": [{"step_number": 1, "instruction": "Stir"}]},
+    )
+    response = await client.post("/admin/recipes/import", content=body, headers=auth_headers)
+    assert response.status_code == 200
+    report = response.json()
+    assert report["imported"] == 3
+    assert report["failed"] == 4
+    errors = {e["line"]: e["error"] for e in report["errors"]}
+    assert sorted(errors) == [2, 3, 6, 7]
+    assert "999" in errors[3]
+    assert "smidgen" in errors[7]
+
+    result = await db.execute(select(Recipe).where(Recipe.name.like("Imported %")))
+    recipes = {r.name: r for r in result.scalars().all()}
+    assert set(recipes) == {"Imported Pancakes", "Imported Other Owner", "Imported Porridge"}
+
+    pancakes = recipes["Imported Pancakes"]
+    assert pancakes.user_id == 1
+    assert sorted(c.id for c in pancakes.categories) == [1, 57]
+    assert [s.instruction for s in sorted(pancakes.steps, key=lambda s: s.step_number)] == ["Mix", "Fry"]
+    sugar, stardust = sorted(pancakes.ingredients, key=lambda i: i.display_order)
+    assert sugar.ingredient_id == 2
+    assert sugar.unit_id == gram.id
+    assert stardust.ingredient_id is None
+    assert recipes["Imported Other Owner"].user_id == 2
+    assert await db.get(RecipeStats, pancakes.id) is not None
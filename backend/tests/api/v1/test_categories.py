@@ -0,0 +1,40 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import update
+from app.models.category import Category
+from app.services.category_catalog import category_catalog
+
+@pytest.mark.asyncio
+async def test_list_categories(client: AsyncClient, auth_headers: dict):
+    payload = {"name": "Catalog Smoothie", "categories": [57], "ingredients": [{"name_text": "Salt", "quantity_text": "1"}], "steps": []}
+    await client.post("/recipes", json=payload, headers=auth_headers)
+    await category_catalog.refresh(force=True)
+
+    response = await client.get("/categories")
+    assert response.status_code == 200
+    assert response.headers["cache-control"].startswith("public, max-age=")
+    assert "vary" not in response.headers
+    groups = {g["id"]: g for g in response.json()}
+    assert groups[1]["name"] == "Meal Type"
+    fruit = next(c for c in groups[3]["categories"] if c["id"] == 57)
+    assert fruit["name"] == "Fruit-Based"
+    assert fruit["recipe_count"] >= 1
+
+    etag = response.headers["etag"]
+    response = await client.get("/categories", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+@pytest.mark.asyncio
+async def test_category_catalog_reloads_on_change(db):
+    await category_catalog.refresh(force=True)
+    etag = category_catalog.etag
+    # Nothing changed, counts still fresh
+    assert await category_catalog.refresh() is False
+
+    await db.execute(update(Category).where(Category.id == 1).values(description="First meal of the day"))
+    await db.commit()
+
+    assert await category_catalog.refresh() is True
+    assert category_catalog.etag != etag
+    breakfast = next(c for g in category_catalog.groups for c in g["categories"] if c["id"] == 1)
+    assert breakfast["description"] == "First meal of the day"
@@ -1,5 +1,25 @@
+import json
 import pytest
+from contextlib import contextmanager
+from datetime import datetime
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
 from httpx import AsyncClient
+from app.core.config import settings
+from app.utils.pagination import encode_cursor
+
+@contextmanager
+def count_queries():
+    """Collects every statement sent to the database inside the block."""
+    queries = []
+    def record(conn, cursor, statement, *args):
+        queries.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", record)
+    try:
+        yield queries
+    finally:
+        event.remove(Engine, "before_cursor_execute", record)
 
 @pytest.mark.asyncio
 async def test_list_recipes(client: AsyncClient):
@@ -55,6 +75,75 @@ async def test_update_recipe(client: AsyncClient, auth_headers: dict):
     get_resp = await client.get(f"/recipes/{recipe_id}", headers=auth_headers)
     assert get_resp.json()["name"] == "Updated Name"
 
+async def row_versions(db, table: str, recipe_id: int) -> dict:
+    """id -> xmin; a row's xmin only changes when the row is rewritten."""
+    result = await db.execute(text(f"SELECT id, xmin::text FROM {table} WHERE recipe_id = :id"), {"id": recipe_id})
+    return dict(result.all())
+
+@pytest.mark.asyncio
+async def test_update_recipe_writes_only_changed_rows(client: AsyncClient, db, auth_headers: dict):
+    payload = {
+        "name": "Diff Me",
+        "ingredients": [
+            {"name_text": f"Ingredient {i}", "quantity": 0.1 * (i + 1), "display_order": i}
+            for i in range(6)
+        ],
+        "steps": [{"step_number": i, "instruction": f"Step {i}"} for i in (1, 2, 3)],
+    }
+    recipe = (await client.post("/recipes", json=payload, headers=auth_headers)).json()
+    recipe_id = recipe["id"]
+    ingredients = sorted(recipe["ingredients"], key=lambda i: i["display_order"])
+    steps = sorted(recipe["steps"], key=lambda s: s["step_number"])
+    before = {
+        "recipe_ingredients": await row_versions(db, "recipe_ingredients", recipe_id),
+        "recipe_steps": await row_versions(db, "recipe_steps", recipe_id),
+    }
+
+    # Echo the read payload back: four ingredients untouched, one changed,
+    # one dropped, one added; the first two steps swap places
+    ingredients[4]["quantity"] = 9
+    steps[0]["step_number"], steps[1]["step_number"] = 2, 1
+    update_payload = {
+        "ingredients": ingredients[:5] + [{"name_text": "Salt", "display_order": 6}],
+        "steps": steps,
+    }
+    with count_queries() as queries:
+        response = await client.patch(f"/recipes/{recipe_id}", json=update_payload, headers=auth_headers)
+    assert response.status_code == 200
+
+    # One batched statement per kind of change, none for what stayed the same
+    writes = [
+        " ".join(q.split()[:3]) for q in queries
+        if q.lstrip().startswith(("INSERT", "UPDATE", "DELETE")) and ("recipe_ingredients" in q or "recipe_steps" in q)
+    ]
+    assert sorted(writes) == [
+        "DELETE FROM recipe_ingredients",
+        "INSERT INTO recipe_ingredients",
+        "UPDATE recipe_ingredients SET",
+        "UPDATE recipe_steps SET",
+    ]
+
+    # Write amplification: rows rewritten == rows that actually changed
+    after_ingredients = await row_versions(db, "recipe_ingredients", recipe_id)
+    after_steps = await row_versions(db, "recipe_steps", recipe_id)
+    kept = [i["id"] for i in ingredients[:4]]
+    assert {i: after_ingredients[i] for i in kept} == {i: before["recipe_ingredients"][i] for i in kept}
+    assert after_ingredients[ingredients[4]["id"]] != before["recipe_ingredients"][ingredients[4]["id"]]
+    assert ingredients[5]["id"] not in after_ingredients
+    assert len(after_ingredients) == 6
+    rewritten_steps = {s for s in after_steps if after_steps[s] != before["recipe_steps"][s]}
+    assert rewritten_steps == {steps[0]["id"], steps[1]["id"]}
+
+    data = response.json()
+    assert [s["instruction"] for s in sorted(data["steps"], key=lambda s: s["step_number"])] == ["Step 2", "Step 1", "Step 3"]
+    changed = next(i for i in data["ingredients"] if i["id"] == ingredients[4]["id"])
+    assert changed["quantity"] == 9
+    assert next(i for i in data["ingredients"] if i["name_text"] == "Salt")["ingredient_id"] == 1
+
+    # Ids must belong to this recipe
+    bad = {"steps": [{"id": 10**9, "step_number": 1, "instruction": "Nope"}]}
+    assert (await client.patch(f"/recipes/{recipe_id}", json=bad, headers=auth_headers)).status_code == 400
+
 @pytest.mark.asyncio
 async def test_delete_recipe(client: AsyncClient, auth_headers: dict):
     # 1. Create
@@ -180,3 +269,268 @@ async def test_combined_search_and_filter(client: AsyncClient, auth_headers: dic
     assert response.status_code == 200
     data = response.json()
     assert any("Complex" in r["name"] for r in data["recipes"])
+
+@pytest.mark.asyncio
+async def test_filter_recipes_by_category_mode(client: AsyncClient, auth_headers: dict):
+    base = {"ingredients": [{"name_text": "Salt", "quantity_text": "1"}], "steps": []}
+    await client.post("/recipes", json={**base, "name": "Modal Pancakes", "categories": [1]}, headers=auth_headers)
+    await client.post("/recipes", json={**base, "name": "Modal Fruit Pancakes", "categories": [1, 57]}, headers=auth_headers)
+
+    # any-of: a recipe in both categories comes back once
+    data = (await client.get("/recipes?search=modal&fuzzy=false&category_ids=1&category_ids=57")).json()
+    names = [r["name"] for r in data["recipes"]]
+    assert sorted(names) == ["Modal Fruit Pancakes", "Modal Pancakes"]
+    assert data["total"] == 2
+
+    data = (await client.get("/recipes?search=modal&fuzzy=false&category_ids=1&category_ids=57&category_mode=all")).json()
+    assert [r["name"] for r in data["recipes"]] == ["Modal Fruit Pancakes"]
+    assert data["total"] == 1
+
+@pytest.mark.asyncio
+async def test_get_recipes_batch(client: AsyncClient, auth_headers: dict):
+    base = {"ingredients": [{"name_text": "Salt", "quantity_text": "1"}], "steps": [{"step_number": 1, "instruction": "Mix"}]}
+    ids = [
+        (await client.post("/recipes", json={**base, "name": f"Batch Recipe {i}"}, headers=auth_headers)).json()["id"]
+        for i in range(4)
+    ]
+    private_id = (await client.post("/recipes", json={**base, "name": "Batch Private", "is_public": False}, headers=auth_headers)).json()["id"]
+
+    with count_queries() as few:
+        response = await client.get("/recipes/batch", params={"ids": [ids[2], ids[0], private_id, 999999]})
+    with count_queries() as many:
+        await client.get("/recipes/batch", params={"ids": ids})
+
+    assert response.status_code == 200
+    data = response.json()
+    # Request order, unknown and other users' private ids skipped
+    assert [r["id"] for r in data] == [ids[2], ids[0]]
+    assert data[0]["steps"][0]["instruction"] == "Mix"
+    assert data[0]["ingredients"][0]["name_text"] == "Salt"
+    assert len(few) == len(many)
+    # No views recorded
+    assert data[0]["views_count"] == 0
+
+    owned = (await client.get("/recipes/batch", params={"ids": [private_id]}, headers=auth_headers)).json()
+    assert [r["id"] for r in owned] == [private_id]
+
+    too_many = await client.get("/recipes/batch", params={"ids": list(range(1, 102))})
+    assert too_many.status_code == 422
+
+@pytest.mark.asyncio
+async def test_sparse_fieldsets(client: AsyncClient, auth_headers: dict):
+    payload = {
+        "name": "Sparse Shortbread",
+        "ingredients": [{"name_text": "Butter", "quantity_text": "200 g"}],
+        "steps": [{"step_number": 1, "instruction": "Rub in"}],
+    }
+    recipe_id = (await client.post("/recipes", json=payload, headers=auth_headers)).json()["id"]
+    # Creating does not fill the detail cache, so the relationship loading is exercised
+
+    with count_queries() as sparse:
+        response = await client.get(f"/recipes/{recipe_id}?fields=name,media")
+    assert response.status_code == 200
+    assert response.json() == {"id": recipe_id, "name": "Sparse Shortbread", "media": []}
+    # Neither the ingredient nor the step tables are touched
+    assert not any("recipe_ingredients" in q or "recipe_steps" in q for q in sparse)
+
+    with count_queries() as full:
+        full_body = (await client.get(f"/recipes/{recipe_id}")).json()
+    assert len(sparse) < len(full)
+    assert full_body["steps"][0]["instruction"] == "Rub in"
+
+    data = (await client.get("/recipes?search=shortbread&fuzzy=false&fields=name,steps,likes_count")).json()
+    assert data["recipes"] == [{
+        "id": recipe_id,
+        "name": "Sparse Shortbread",
+        "steps": [{"id": full_body["steps"][0]["id"], "step_number": 1, "instruction": "Rub in", "estimated_minutes": None}],
+        "likes_count": 0,
+    }]
+
+    assert (await client.get(f"/recipes/{recipe_id}?fields=name,secret")).status_code == 400
+
+@pytest.mark.asyncio
+async def test_export_recipes_ndjson(client: AsyncClient, auth_headers: dict, other_auth_headers: dict, monkeypatch):
+    monkeypatch.setattr(settings, "admin_user_ids", [1])
+    assert (await client.get("/recipes/export")).status_code == 401
+    assert (await client.get("/recipes/export", headers=other_auth_headers)).status_code == 403
+
+    base = {"ingredients": [{"name_text": "Salt", "quantity_text": "1"}], "steps": [{"step_number": 1, "instruction": "Season"}]}
+    public_id = (await client.post("/recipes", json={**base, "name": "Export Public", "categories": [1]}, headers=auth_headers)).json()["id"]
+    private_id = (await client.post("/recipes", json={**base, "name": "Export Private", "is_public": False}, headers=auth_headers)).json()["id"]
+
+    response = await client.get("/recipes/export", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    by_id = {r["id"]: r for r in rows}
+    assert private_id not in by_id
+    exported = by_id[public_id]
+    assert exported["ingredients"][0]["name_text"] == "Salt"
+    assert exported["steps"][0]["instruction"] == "Season"
+    assert exported["categories"] == ["Breakfast"]
+    # Oldest change first
+    stamps = [r["updated_at"] for r in rows]
+    assert stamps == sorted(stamps, key=datetime.fromisoformat)
+
+    # Incremental: what changed since the watermark (plus a re-sent overlap),
+    # then tombstones for recipes that left the public set
+    gone_id = (await client.post("/recipes", json={**base, "name": "Export Gone"}, headers=auth_headers)).json()["id"]
+    hidden_id = (await client.post("/recipes", json={**base, "name": "Export Hidden"}, headers=auth_headers)).json()["id"]
+    watermark = max(r["updated_at"] for r in map(json.loads, (await client.get("/recipes/export", headers=auth_headers)).text.splitlines()))
+    await client.patch(f"/recipes/{public_id}", json={"name": "Export Public v2"}, headers=auth_headers)
+    await client.patch(f"/recipes/{hidden_id}", json={"is_public": False}, headers=auth_headers)
+    await client.delete(f"/recipes/{gone_id}", headers=auth_headers)
+
+    delta = [json.loads(line) for line in (await client.get("/recipes/export", params={"updated_since": watermark}, headers=auth_headers)).text.splitlines()]
+    live = {r["id"]: r for r in delta if not r.get("deleted")}
+    assert live[public_id]["name"] == "Export Public v2"
+    assert hidden_id not in live and gone_id not in live
+    tombstones = {r["id"] for r in delta if r.get("deleted")}
+    assert {hidden_id, gone_id} <= tombstones
+    assert public_id not in tombstones
+
+    # Past the tombstone retention deletions may be missing, so refuse
+    stale = await client.get("/recipes/export", params={"updated_since": "2000-01-01T00:00:00+00:00"}, headers=auth_headers)
+    assert stale.status_code == 410
+
+@pytest.mark.asyncio
+async def test_list_recipes_cursor_pagination(client: AsyncClient, auth_headers: dict):
+    for i in range(3):
+        payload = {
+            "name": f"Cursor Recipe {i}",
+            "ingredients": [{"name_text": "Salt", "quantity_text": "1 tsp"}],
+            "steps": [{"step_number": 1, "instruction": "Mix"}],
+        }
+        await client.post("/recipes", json=payload, headers=auth_headers)
+
+    # First page via page/per_page still works and hands back a cursor
+    first = (await client.get("/recipes?per_page=2")).json()
+    assert len(first["recipes"]) == 2
+    assert first["next_cursor"]
+
+    # Following the cursor continues exactly where the first page ended
+    second = (await client.get(f"/recipes?per_page=2&cursor={first['next_cursor']}")).json()
+    offset_second = (await client.get("/recipes?per_page=2&page=2")).json()
+    assert [r["id"] for r in second["recipes"]] == [r["id"] for r in offset_second["recipes"]]
+    assert not {r["id"] for r in first["recipes"]} & {r["id"] for r in second["recipes"]}
+
+@pytest.mark.asyncio
+async def test_list_recipes_invalid_cursor(client: AsyncClient):
+    response = await client.get("/recipes?cursor=not-a-cursor")
+    assert response.status_code == 400
+
+    # Well-formed, but a string where the (created_at, id) key needs a datetime
+    response = await client.get(f"/recipes?cursor={encode_cursor(['yesterday', 1])}")
+    assert response.status_code == 400
+    response = await client.get(f"/recipes?cursor={encode_cursor([{'dt': '2026-01-01T00:00:00+00:00'}, '1'])}")
+    assert response.status_code == 400
+
+@pytest.mark.asyncio
+async def test_list_recipes_card_view(client: AsyncClient, auth_headers: dict):
+    payload = {
+        "name": "Card Recipe",
+        "cook_time_minutes": 15,
+        "ingredients": [{"name_text": "Salt", "quantity_text": "1 tsp"}],
+        "steps": [{"step_number": 1, "instruction": "Mix"}],
+    }
+    await client.post("/recipes", json=payload, headers=auth_headers)
+
+    response = await client.get("/recipes?view=card&per_page=100")
+    assert response.status_code == 200
+    cards = response.json()["recipes"]
+    card = next(r for r in cards if r["name"] == "Card Recipe")
+    assert card["author_name"] == "Test User"
+    assert card["cook_time_minutes"] == 15
+    assert "primary_media" in card
+    # Heavy relations are not part of the card payload
+    assert "ingredients" not in card
+    assert "steps" not in card
+
+@pytest.mark.asyncio
+async def test_list_recipes_count_strategies(client: AsyncClient):
+    exact = (await client.get("/recipes?count=exact")).json()
+    assert exact["total_is_exact"] is True
+    assert exact["total"] >= len(exact["recipes"])
+
+    # Infinite scroll clients can skip the count entirely
+    skipped = (await client.get("/recipes?count=none")).json()
+    assert skipped["total"] is None
+    assert [r["id"] for r in skipped["recipes"]] == [r["id"] for r in exact["recipes"]]
+
+    estimated = (await client.get("/recipes?count=estimated")).json()
+    assert estimated["total"] is not None
+    assert estimated["total_is_exact"] is False
+
+@pytest.mark.asyncio
+async def test_list_recipes_capped_count(client: AsyncClient, monkeypatch):
+    from app.core.config import settings
+    monkeypatch.setattr(settings, "recipe_count_cap", 1)
+
+    exact_total = (await client.get("/recipes")).json()["total"]
+    capped = (await client.get("/recipes?count=capped")).json()
+    assert capped["total"] == min(exact_total, 2)
+    assert capped["total_is_exact"] is (exact_total <= 1)
+
+@pytest.mark.asyncio
+async def test_get_recipe_conditional_request(client: AsyncClient, auth_headers: dict):
+    payload = {
+        "name": "ETag Recipe",
+        "ingredients": [{"name_text": "Salt", "quantity_text": "1 tsp"}],
+        "steps": [{"step_number": 1, "instruction": "Mix"}],
+    }
+    recipe_id = (await client.post("/recipes", json=payload, headers=auth_headers)).json()["id"]
+
+    first = await client.get(f"/recipes/{recipe_id}")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"].startswith("public")
+
+    # A revalidation with the current tag is answered without a body
+    revalidated = await client.get(f"/recipes/{recipe_id}", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == etag
+    assert not revalidated.content
+
+    # Other clients' views do not change the validator
+    await client.get(f"/recipes/{recipe_id}", headers=auth_headers)
+    assert (await client.get(f"/recipes/{recipe_id}", headers={"If-None-Match": etag})).status_code == 304
+
+    # Editing the recipe changes the validator
+    await client.patch(f"/recipes/{recipe_id}", json={"name": "ETag Recipe v2"}, headers=auth_headers)
+    changed = await client.get(f"/recipes/{recipe_id}", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert changed.json()["name"] == "ETag Recipe v2"
+
+    # Personalized responses must not be stored by shared caches
+    personal = await client.get(f"/recipes/{recipe_id}", headers=auth_headers)
+    assert personal.headers["cache-control"].startswith("private")
+
+@pytest.mark.asyncio
+async def test_list_recipes_conditional_request(client: AsyncClient):
+    first = await client.get("/recipes?view=card")
+    etag = first.headers["etag"]
+
+    revalidated = await client.get("/recipes?view=card", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+
+    # Different projections of the same page carry different validators
+    full = await client.get("/recipes", headers={"If-None-Match": etag})
+    assert full.status_code == 200
+    assert full.headers["etag"] != etag
+
+@pytest.mark.asyncio
+async def test_list_recipes_facets(client: AsyncClient, auth_headers: dict):
+    base = {"ingredients": [{"name_text": "Salt", "quantity_text": "1"}], "steps": []}
+    await client.post("/recipes", json={**base, "name": "Facet Porridge", "categories": [1], "cook_time_minutes": 10}, headers=auth_headers)
+    await client.post("/recipes", json={**base, "name": "Facet Fruit Porridge", "categories": [1, 57], "cook_time_minutes": 45}, headers=auth_headers)
+
+    data = (await client.get("/recipes?search=porridge&fuzzy=false&facets=true")).json()
+    categories = {f["id"]: f["count"] for f in data["facets"]["categories"]}
+    assert categories == {1: 2, 57: 1}
+    buckets = {f["bucket"]: f["count"] for f in data["facets"]["cook_time"]}
+    assert buckets["0-15"] == 1
+    assert buckets["31-60"] == 1
+
+    # Facets are opt-in
+    assert (await client.get("/recipes?search=porridge")).json()["facets"] is None
@@ -17,6 +17,29 @@ async def test_like_and_unlike_recipe(client: AsyncClient, auth_headers: dict):
     unlike_resp = await client.delete(f"/recipes/{recipe_id}/like", headers=auth_headers)
     assert unlike_resp.status_code == 204
 
+@pytest.mark.asyncio
+async def test_like_updates_recipe_stats(client: AsyncClient, auth_headers: dict, other_auth_headers: dict):
+    payload = {"name": "Count My Likes", "ingredients": [{"name_text": "Salt", "quantity_text": "1"}], "steps": []}
+    recipe_id = (await client.post("/recipes", json=payload, headers=auth_headers)).json()["id"]
+
+    await client.post(f"/recipes/{recipe_id}/like", headers=auth_headers)
+    await client.post(f"/recipes/{recipe_id}/like", headers=other_auth_headers)
+    # Liking twice must not double count
+    await client.post(f"/recipes/{recipe_id}/like", headers=other_auth_headers)
+
+    data = (await client.get(f"/recipes/{recipe_id}")).json()
+    assert data["likes_count"] == 2
+    assert data["views_count"] >= 1
+
+    await client.delete(f"/recipes/{recipe_id}/like", headers=other_auth_headers)
+    await client.delete(f"/recipes/{recipe_id}/like", headers=other_auth_headers)
+    data = (await client.get(f"/recipes/{recipe_id}")).json()
+    assert data["likes_count"] == 1
+
+    # The most_liked feed reads the same counters
+    feed = (await client.get("/recipes?sort_by=most_liked&per_page=100")).json()
+    assert any(r["id"] == recipe_id and r["likes_count"] == 1 for r in feed["recipes"])
+
 @pytest.mark.asyncio
 async def test_save_and_unsave_recipe(client: AsyncClient, auth_headers: dict):
     # 1. Create recipe
@@ -61,3 +84,62 @@ async def test_share_recipe_og_tags(client: AsyncClient, auth_headers: dict):
     assert '<meta property="og:type" content="article"' in html
     assert "Share Me Recipe" in html
     assert 'content="https://placehold.co/1200x630?text=No+Image"' in html
+
+@pytest.mark.asyncio
+async def test_batch_interactions(client: AsyncClient, auth_headers: dict, other_auth_headers: dict):
+    payload = {"name": "Batch Flags", "ingredients": [{"name_text": "Salt", "quantity_text": "1"}], "steps": []}
+    liked_id = (await client.post("/recipes", json=payload, headers=auth_headers)).json()["id"]
+    saved_id = (await client.post("/recipes", json=payload, headers=auth_headers)).json()["id"]
+
+    await client.post(f"/recipes/{liked_id}/like", headers=auth_headers)
+    await client.post(f"/recipes/{liked_id}/like", headers=other_auth_headers)
+    await client.post(f"/recipes/{saved_id}/save", headers=auth_headers)
+
+    body = {"recipe_ids": [saved_id, liked_id, saved_id]}
+    response = await client.post("/recipes/interactions", json=body, headers=auth_headers)
+    assert response.status_code == 200
+    items = response.json()
+    # Duplicates collapse, request order is kept
+    assert [i["recipe_id"] for i in items] == [saved_id, liked_id]
+    assert items[0]["is_saved"] is True and items[0]["is_liked"] is False
+    assert items[0]["saves_count"] == 1
+    assert items[1]["is_liked"] is True and items[1]["likes_count"] == 2
+
+    # Anonymous viewers still get counters
+    anonymous = (await client.post("/recipes/interactions", json=body)).json()
+    assert not any(i["is_liked"] or i["is_saved"] for i in anonymous)
+    assert anonymous[1]["likes_count"] == 2
+
+    # Views still in the view buffer are counted, as on the detail endpoint
+    detail = (await client.get(f"/recipes/{liked_id}")).json()
+    counts = (await client.post("/recipes/interactions", json={"recipe_ids": [liked_id]})).json()
+    assert counts[0]["views_count"] == detail["views_count"]
+
+    # Private recipes only report counters to their owner
+    private = {**payload, "is_public": False}
+    private_id = (await client.post("/recipes", json=private, headers=auth_headers)).json()["id"]
+    await client.post(f"/recipes/{private_id}/like", headers=auth_headers)
+    body = {"recipe_ids": [private_id]}
+    assert (await client.post("/recipes/interactions", json=body, headers=auth_headers)).json()[0]["likes_count"] == 1
+    for headers in (other_auth_headers, {}):
+        hidden = (await client.post("/recipes/interactions", json=body, headers=headers)).json()
+        assert hidden == [{"recipe_id": private_id, "is_liked": False, "is_saved": False, "likes_count": 0, "views_count": 0, "saves_count": 0}]
+
+    too_many = {"recipe_ids": list(range(1, 302))}
+    assert (await client.post("/recipes/interactions", json=too_many)).status_code == 422
+
+@pytest.mark.asyncio
+async def test_liked_and_saved_lists_report_real_counts(client: AsyncClient, auth_headers: dict, other_auth_headers: dict):
+    payload = {"name": "Liked And Saved", "ingredients": [{"name_text": "Salt", "quantity_text": "1"}], "steps": []}
+    recipe_id = (await client.post("/recipes", json=payload, headers=auth_headers)).json()["id"]
+
+    await client.post(f"/recipes/{recipe_id}/like", headers=auth_headers)
+    await client.post(f"/recipes/{recipe_id}/like", headers=other_auth_headers)
+    await client.post(f"/recipes/{recipe_id}/save", headers=auth_headers)
+
+    for path in ("/recipes/liked", "/recipes/saved"):
+        items = (await client.get(f"{path}?per_page=100", headers=auth_headers)).json()["recipes"]
+        item = next(r for r in items if r["id"] == recipe_id)
+        assert item["is_liked"] is True
+        assert item["is_saved"] is True
+        assert item["likes_count"] == 2
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+from app.models.user import User
+from app.models.recipe_view import UserRecipeView
+from app.services.coview import cooccurrence, top_neighbours, rebuild_recommendations
+
+def test_cosine_neighbours_from_cooccurrence():
+    recipe_ids = np.array([10, 20, 30, 40])
+    users = np.array([1, 1, 2, 2, 2, 3, 3, 4, 4, 4, 4])
+    recipes = np.array([10, 20, 10, 20, 30, 30, 99, 10, 20, 30, 40])
+    weights = np.ones(len(users))
+
+    # 99 is not a known recipe; user 4 is over the per-user cap and ignored
+    gram = cooccurrence(users, recipes, weights, recipe_ids, max_items_per_user=3)
+    assert gram[0, 3] == 0
+    assert cooccurrence(users, recipes, weights, recipe_ids, max_items_per_user=5)[0, 3] > 0
+
+    neighbours = {row: (list(cols), list(np.round(scores, 3))) for row, cols, scores in top_neighbours(gram, k=1, min_score=0.0)}
+    # 10 and 20 always appear together; 30 only shares user 2 with them
+    assert neighbours[0] == ([1], [1.0])
+    assert neighbours[2][1] == [0.5]
+    assert 3 not in neighbours
+
+@pytest.mark.asyncio
+async def test_rebuild_recommendations(client, db, auth_headers):
+    base = {"ingredients": [{"name_text": "Salt", "quantity_text": "1"}], "steps": []}
+    a, b, c = [
+        (await client.post("/recipes", json={**base, "name": f"Coview {name}"}, headers=auth_headers)).json()["id"]
+        for name in "ABC"
+    ]
+    viewers = [User(username=f"coview{i}", display_name=f"Coview {i}") for i in range(3)]
+    db.add_all(viewers)
+    await db.flush()
+    for viewer, recipes in zip(viewers, [(a, b), (a, b), (a, c)]):
+        db.add_all([UserRecipeView(user_id=viewer.id, recipe_id=r) for r in recipes])
+    await db.commit()
+
+    # Tiny chunks so users straddle partitions
+    assert await rebuild_recommendations(db, chunk_rows=2) >= 3
+    await db.commit()
+
+    response = await client.get(f"/recipes/{a}/recommendations")
+    assert response.status_code == 200
+    assert [r["id"] for r in response.json()][:2] == [b, c]
+    assert [r["id"] for r in (await client.get(f"/recipes/{c}/recommendations")).json()] == [a]
@@ -0,0 +1,70 @@
+import pytest
+from datetime import timedelta
+from sqlalchemy import select, update, func
+from app.models.recipe import Recipe
+from app.models.recipe_minhash import RecipeMinhash
+from app.services.minhash import minhash_signature, band_buckets, estimated_jaccard, refresh_minhashes
+
+def test_signature_estimates_jaccard():
+    a = {f"t:{i}" for i in range(20)}
+    b = {f"t:{i}" for i in range(5, 25)}
+    sig_a, sig_b = minhash_signature(a), minhash_signature(b)
+
+    # True Jaccard is 15 / 25
+    assert abs(estimated_jaccard(sig_a, sig_b) - 0.6) < 0.15
+    assert estimated_jaccard(sig_a, minhash_signature(set(a))) == 1.0
+    assert minhash_signature(set()) is None
+    # Identical sets land in every bucket together
+    assert band_buckets(sig_a) == band_buckets(minhash_signature(a))
+
+@pytest.mark.asyncio
+async def test_related_recipes(client, db, auth_headers):
+    def recipe(name, ingredients, is_public=True):
+        return {
+            "name": name,
+            "is_public": is_public,
+            "ingredients": [{"name_text": i, "quantity_text": "1"} for i in ingredients],
+            "steps": [],
+        }
+
+    pantry = ["Salt", "Sugar", "Butter", "Flour", "Eggs", "Milk", "Vanilla"]
+    base_id = (await client.post("/recipes", json=recipe("Related Sponge", pantry), headers=auth_headers)).json()["id"]
+    close_id = (await client.post("/recipes", json=recipe("Related Cupcakes", pantry[:6] + ["Lemon"]), headers=auth_headers)).json()["id"]
+    far_id = (await client.post("/recipes", json=recipe("Related Curry", ["Cumin", "Chickpeas", "Rice"]), headers=auth_headers)).json()["id"]
+    hidden_id = (await client.post("/recipes", json=recipe("Related Secret Sponge", pantry, is_public=False), headers=auth_headers)).json()["id"]
+
+    while await refresh_minhashes(db):
+        await db.commit()
+    await db.commit()
+
+    response = await client.get(f"/recipes/{base_id}/related")
+    assert response.status_code == 200
+    ids = [r["id"] for r in response.json()]
+    assert close_id in ids
+    assert far_id not in ids
+    # Private recipes are never bucketed
+    assert hidden_id not in ids
+
+    # Editing ingredients marks the signature stale
+    await client.patch(f"/recipes/{far_id}", json={"ingredients": recipe("", pantry)["ingredients"]}, headers=auth_headers)
+    assert await refresh_minhashes(db) >= 1
+    await db.commit()
+    ids = [r["id"] for r in (await client.get(f"/recipes/{base_id}/related")).json()]
+    assert far_id in ids
+
+@pytest.mark.asyncio
+async def test_refresh_minhashes_resumes_from_watermark(client, db, auth_headers):
+    payload = {"name": "Watermark Scone", "ingredients": [{"name_text": "Butter", "quantity_text": "1"}], "steps": []}
+    while await refresh_minhashes(db):
+        await db.commit()
+    await db.commit()
+
+    # Stamped just behind the watermark, committed after it: the overlap catches it
+    watermark = (await db.execute(select(func.max(RecipeMinhash.source_updated_at)))).scalar()
+    late_id = (await client.post("/recipes", json=payload, headers=auth_headers)).json()["id"]
+    await db.execute(update(Recipe).where(Recipe.id == late_id).values(updated_at=watermark - timedelta(seconds=1)))
+    await db.commit()
+
+    assert await refresh_minhashes(db) == 1
+    await db.commit()
+    assert await db.get(RecipeMinhash, late_id) is not None
@@ -0,0 +1,103 @@
+import pytest
+from datetime import timedelta
+from sqlalchemy import update
+from app.models.ingredient import Ingredient
+from app.models.recipe import Recipe
+from app.models.recipe_ingredient import RecipeIngredient
+from app.services.pantry_index import PantryIndex, pantry_index, match_recipes_sql
+
+def test_match_ranks_by_coverage():
+    index = PantryIndex(refresh_seconds=60, rebuild_seconds=600, staple_fraction=1.0)
+    index._add(1, [10, 11], 2)
+    index._add(2, [10, 11, 12, 13], 4)
+    index._add(3, [12], 1)
+
+    # Full coverage first, more matched ingredients break the tie
+    assert index.match([10, 11, 12], limit=10) == [(1, 2, 2), (3, 1, 1), (2, 3, 4)]
+    assert index.match([10, 11, 12], limit=10, min_coverage=0.8) == [(1, 2, 2), (3, 1, 1)]
+
+    index.remove(3)
+    assert [m[0] for m in index.match([12], limit=10)] == [2]
+
+def test_staples_confirm_and_only_drive_candidates_that_can_place():
+    index = PantryIndex(refresh_seconds=60, rebuild_seconds=600, staple_fraction=0.5)
+    # 1 (salt) and 2 (oil) are in most recipes, so they are staples
+    index._add(1, [1, 2, 20], 3)
+    index._add(2, [1, 2, 30], 3)
+    index._add(3, [1, 40, 41], 3)
+    index._add(4, [1, 2], 2)
+
+    # Recipes 2-4 are reached through staples alone; the salt-and-oil one is fully covered
+    assert index.match([1, 2, 20], limit=10) == [(1, 3, 3), (4, 2, 2), (2, 2, 3), (3, 1, 3)]
+    # Staple candidates cannot beat a full match with more ingredients, so they are not scanned
+    index._add(5, [1, 2, 20, 21], 4)
+    assert index.match([1, 2, 20, 21], limit=1) == [(5, 4, 4)]
+    # A pantry of only staples still finds recipes
+    assert len(index.match([1], limit=10)) == 5
+
+@pytest.mark.asyncio
+async def test_index_ranking_matches_sql(client, db, auth_headers):
+    truffle = Ingredient(name="Parity Truffle")
+    db.add(truffle)
+    await db.commit()
+
+    base = {"steps": []}
+    salted = (await client.post("/recipes", json={**base, "name": "Just Salt", "ingredients": [
+        {"name_text": "Salt", "quantity_text": "1"},
+    ]}, headers=auth_headers)).json()["id"]
+    await client.post("/recipes", json={**base, "name": "Truffle Salt", "ingredients": [
+        {"name_text": "Salt", "quantity_text": "1"}, {"name_text": "Parity Truffle", "quantity_text": "1"},
+    ]}, headers=auth_headers)
+    # The mock matcher only knows the seeded ingredients
+    await db.execute(
+        update(RecipeIngredient).where(RecipeIngredient.name_text == "Parity Truffle").values(ingredient_id=truffle.id)
+    )
+    await db.commit()
+
+    await pantry_index.refresh(full=True)
+    # Salt is in nearly every test recipe, so it is a staple here
+    assert len(pantry_index._postings[1]) > len(pantry_index._required) * pantry_index.staple_fraction
+
+    ids = {1, truffle.id}
+    via_index = pantry_index.match(ids, limit=1000)
+    assert via_index == await match_recipes_sql(db, ids, limit=1000)
+    assert (salted, 1, 1) in via_index
+
+@pytest.mark.asyncio
+async def test_pantry_search_endpoint(client, auth_headers):
+    base = {"steps": []}
+    both = (await client.post("/recipes", json={**base, "name": "Sweet Butter", "ingredients": [
+        {"name_text": "Sugar", "quantity_text": "1"}, {"name_text": "Butter", "quantity_text": "1"},
+    ]}, headers=auth_headers)).json()["id"]
+    partial = (await client.post("/recipes", json={**base, "name": "Butter Mystery", "ingredients": [
+        {"name_text": "Butter", "quantity_text": "1"}, {"name_text": "Unobtainium", "quantity_text": "1"},
+    ]}, headers=auth_headers)).json()["id"]
+
+    body = {"ingredients": ["sugar", "BUTTER"], "limit": 100}
+    # SQL path (index not built yet) and in-memory path must agree
+    via_sql = (await client.post("/recipes/pantry", json=body)).json()
+    await pantry_index.refresh(full=True)
+    via_index = (await client.post("/recipes/pantry", json=body)).json()
+
+    for data in (via_sql, via_index):
+        assert data["ingredient_ids"] == [2, 3]
+        coverage = {m["recipe"]["id"]: m["coverage"] for m in data["matches"]}
+        assert coverage[both] == 1.0
+        assert coverage[partial] == 0.5
+        ids = [m["recipe"]["id"] for m in data["matches"]]
+        assert ids.index(both) < ids.index(partial)
+
+@pytest.mark.asyncio
+async def test_refresh_picks_up_late_commits(client, db, auth_headers):
+    base = {"steps": [], "ingredients": [{"name_text": "Sugar", "quantity_text": "1"}]}
+    await client.post("/recipes", json={**base, "name": "Early Fudge"}, headers=auth_headers)
+    await pantry_index.refresh(full=True)
+    watermark = pantry_index._watermark
+
+    # Stamped before the watermark but committed after it was taken
+    late_id = (await client.post("/recipes", json={**base, "name": "Late Fudge"}, headers=auth_headers)).json()["id"]
+    await db.execute(update(Recipe).where(Recipe.id == late_id).values(updated_at=watermark - timedelta(seconds=1)))
+    await db.commit()
+    await pantry_index.refresh()
+
+    assert late_id in [rid for rid, _, _ in pantry_index.match([2], limit=1000)]
@@ -0,0 +1,54 @@
+import pytest
+from app.services.recipe_cache import RecipeCache, InMemoryCacheBackend, recipe_cache
+from app.services.recipe_versions import get_recipe_state, content_version
+
+@pytest.mark.asyncio
+async def test_entries_are_keyed_by_content_version():
+    cache = RecipeCache(InMemoryCacheBackend(max_entries=10), ttl_seconds=60)
+    await cache.set(1, "a", {"id": 1, "name": "Old"})
+    assert (await cache.get(1, "a"))["name"] == "Old"
+
+    # A write anywhere moves readers to a new version
+    assert await cache.get(1, "b") is None
+    await cache.set(1, "b", {"id": 1, "name": "New"})
+    assert (await cache.get(1, "b"))["name"] == "New"
+
+@pytest.mark.asyncio
+async def test_in_memory_backend_evicts_least_recently_used():
+    cache = RecipeCache(InMemoryCacheBackend(max_entries=2), ttl_seconds=60)
+    await cache.set(1, "a", {"id": 1})
+    await cache.set(2, "a", {"id": 2})
+    await cache.get(1, "a")
+    await cache.set(3, "a", {"id": 3})
+
+    assert await cache.get(1, "a") is not None
+    assert await cache.get(2, "a") is None
+
+@pytest.mark.asyncio
+async def test_recipe_detail_cache_follows_updates(client, db, auth_headers):
+    payload = {
+        "name": "Cached Recipe",
+        "ingredients": [{"name_text": "Salt", "quantity_text": "1"}],
+        "steps": [{"step_number": 1, "instruction": "Mix"}],
+    }
+    recipe_id = (await client.post("/recipes", json=payload, headers=auth_headers)).json()["id"]
+
+    await client.get(f"/recipes/{recipe_id}")
+    version = content_version(await get_recipe_state(db, recipe_id))
+    assert (await recipe_cache.get(recipe_id, version))["name"] == "Cached Recipe"
+
+    # Viewer flags are not part of the cached payload
+    await client.post(f"/recipes/{recipe_id}/like", headers=auth_headers)
+    data = (await client.get(f"/recipes/{recipe_id}", headers=auth_headers)).json()
+    assert data["is_liked"] is True
+    assert data["likes_count"] == 1
+
+    update = {"steps": [{"step_number": 1, "instruction": "Stir gently"}]}
+    resp = await client.patch(f"/recipes/{recipe_id}", json=update, headers=auth_headers)
+    assert resp.json()["steps"][0]["instruction"] == "Stir gently"
+
+    # Nothing is invalidated; the bumped updated_at is a new version
+    assert content_version(await get_recipe_state(db, recipe_id)) != version
+    data = (await client.get(f"/recipes/{recipe_id}")).json()
+    assert data["steps"][0]["instruction"] == "Stir gently"
+    assert data["is_liked"] is False
@@ -0,0 +1,30 @@
+import json
+from app.schemas.media import RecipeMediaRead
+from app.schemas.recipe import RecipeRead
+from app.services.recipe_json import recipe_json, media_json
+from app.utils.fast_json import FastJSONResponse
+
+PAYLOAD = {
+    "id": 1, "name": "Parity", "description": None, "chefs_note": "Rest it", "cook_time_minutes": 5,
+    "servings": 2, "is_public": True, "author_name": "Test User",
+    "ingredients": [{
+        "id": 3, "ingredient_id": 1, "name_text": "Salt", "quantity": 1.5, "quantity_text": "1 1/2",
+        "unit_id": None, "unit_name": None, "preparation_notes": None, "display_order": 0,
+    }],
+    "steps": [{"id": 4, "step_number": 1, "instruction": "Mix", "estimated_minutes": None}],
+    "categories": ["Breakfast"],
+    "media": [{
+        "id": 9, "type": "image", "is_primary": True, "display_order": 0, "processed": True,
+        "key": "recipes/1/a.jpg", "thumbnail_small_key": "recipes/1/a_s.jpg", "thumbnail_medium_key": None,
+        "thumbnail_large_key": None, "width": 10, "height": 20, "duration_seconds": None, "processing_error": None,
+    }],
+}
+
+def test_fast_json_matches_response_models():
+    interactions = {"is_liked": True, "is_saved": False, "likes_count": 3, "views_count": 7}
+
+    expected = json.loads(RecipeRead(**PAYLOAD, **interactions).model_dump_json())
+    assert json.loads(FastJSONResponse(recipe_json(PAYLOAD, interactions)).body) == expected
+
+    media = PAYLOAD["media"][0]
+    assert media_json(media) == json.loads(RecipeMediaRead(**media).model_dump_json())
@@ -0,0 +1,62 @@
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.dialects import postgresql
+from app.models.recipe import Recipe
+from app.services.recipe_search import apply_text_search, apply_fuzzy_search
+
+@pytest.mark.asyncio
+async def test_search_uses_search_vector_index(db):
+    stmt, _ = apply_text_search(select(Recipe.id), "pasta")
+    sql = stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+
+    # The test tables are tiny, so take sequential scans off the table
+    await db.execute(text("SET LOCAL enable_seqscan = off"))
+    plan = "\n".join((await db.execute(text(f"EXPLAIN {sql}"))).scalars())
+    await db.rollback()
+
+    assert "idx_recipes_search_vector" in plan
+
+@pytest.mark.asyncio
+async def test_search_ranks_name_above_description_and_note(client, auth_headers):
+    base = {"ingredients": [{"name_text": "Salt", "quantity_text": "1"}], "steps": []}
+    note_id = (await client.post("/recipes", json={
+        **base, "name": "Green Tart", "chefs_note": "Swap in zucchini if you like",
+    }, headers=auth_headers)).json()["id"]
+    description_id = (await client.post("/recipes", json={
+        **base, "name": "Summer Bake", "description": "Layers of zucchini and cheese",
+    }, headers=auth_headers)).json()["id"]
+    name_id = (await client.post("/recipes", json={**base, "name": "Zucchini Fritters"}, headers=auth_headers)).json()["id"]
+
+    response = await client.get("/recipes?search=zucchini&per_page=100")
+    assert response.status_code == 200
+    ids = [r["id"] for r in response.json()["recipes"]]
+    assert ids.index(name_id) < ids.index(description_id) < ids.index(note_id)
+
+    # Relevance pages can be walked with the cursor too
+    first = (await client.get("/recipes?search=zucchini&per_page=1")).json()
+    second = (await client.get(f"/recipes?search=zucchini&per_page=1&cursor={first['next_cursor']}")).json()
+    assert second["recipes"][0]["id"] == ids[1]
+
+@pytest.mark.asyncio
+async def test_fuzzy_search_uses_trigram_indexes(db):
+    stmt, _ = await apply_fuzzy_search(db, select(Recipe.id), "lasagana")
+    sql = stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+
+    await db.execute(text("SET LOCAL enable_seqscan = off"))
+    plan = "\n".join((await db.execute(text(f"EXPLAIN {sql}"))).scalars())
+    await db.rollback()
+
+    assert "idx_recipes_search_vector" in plan
+    assert "idx_recipes_name_trgm" in plan
+    assert "idx_recipes_description_trgm" in plan
+
+@pytest.mark.asyncio
+async def test_misspelled_search_falls_back_to_trigrams(client, auth_headers):
+    payload = {"name": "Classic Lasagna", "ingredients": [{"name_text": "Salt", "quantity_text": "1"}], "steps": []}
+    recipe_id = (await client.post("/recipes", json=payload, headers=auth_headers)).json()["id"]
+
+    fuzzy = (await client.get("/recipes?search=lasagana")).json()
+    assert recipe_id in [r["id"] for r in fuzzy["recipes"]]
+
+    strict = (await client.get("/recipes?search=lasagana&fuzzy=false")).json()
+    assert recipe_id not in [r["id"] for r in strict["recipes"]]
@@ -0,0 +1,21 @@
+import pytest
+from sqlalchemy import update
+from app.models.recipe_stats import RecipeStats
+from app.services.recipe_stats import reconcile_recipe_stats, get_stats_map
+
+@pytest.mark.asyncio
+async def test_reconcile_repairs_drifted_counters(client, db, auth_headers):
+    payload = {"name": "Drifted Stats", "ingredients": [{"name_text": "Salt", "quantity_text": "1"}], "steps": []}
+    recipe_id = (await client.post("/recipes", json=payload, headers=auth_headers)).json()["id"]
+    await client.post(f"/recipes/{recipe_id}/like", headers=auth_headers)
+
+    # Simulate drift
+    await db.execute(update(RecipeStats).where(RecipeStats.recipe_id == recipe_id).values(likes_count=42))
+    await db.commit()
+
+    fixed = await reconcile_recipe_stats(db)
+    await db.commit()
+    assert fixed >= 1
+
+    stats = (await get_stats_map(db, [recipe_id]))[recipe_id]
+    assert stats.likes_count == 1
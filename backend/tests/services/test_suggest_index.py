@@ -0,0 +1,67 @@
+import pytest
+from datetime import timedelta
+from sqlalchemy import update
+from app.models.recipe import Recipe
+from app.services.suggest_index import SuggestIndex, suggest_index, build_index
+
+def test_prefix_lookup_matches_word_starts():
+    index = SuggestIndex(refresh_seconds=60, rebuild_seconds=600)
+    index._add("recipe", 1, "Classic Lasagna", weight=5)
+    index._add("recipe", 2, "Lasagna Soup")
+    index._add("alias", 3, "lasagne sheets")
+
+    results = index.suggest("LAS")
+    # Whole-label matches first, the alias surfaces as an ingredient
+    assert [r["text"] for r in results] == ["Lasagna Soup", "lasagne sheets", "Classic Lasagna"]
+    assert results[1]["kind"] == "ingredient"
+
+    index.remove("recipe", 1)
+    assert "Classic Lasagna" not in [r["text"] for r in index.suggest("lasagna")]
+
+def test_full_build_matches_incremental_adds():
+    rows = [
+        ("recipe", 1, "Classic Lasagna", 5, True, None),
+        ("recipe", 2, "Lasagna Soup", 0, True, None),
+        ("recipe", 3, "Hidden Draft", 0, False, None),
+        ("alias", 4, "lasagne sheets", 0, True, None),
+        ("alias", 4, "lasagne sheets", 0, True, None),
+    ]
+    index = SuggestIndex(refresh_seconds=60, rebuild_seconds=600)
+    for source, ref_id, label, weight, visible, _ in rows:
+        if visible:
+            index._add(source, ref_id, label, weight)
+
+    keys, labels, weights, _ = build_index(rows)
+    assert keys == index._keys
+    assert labels == index._labels
+    assert weights == index._weights
+
+@pytest.mark.asyncio
+async def test_suggest_endpoint(client, auth_headers):
+    payload = {"name": "Zesty Lemon Tart", "ingredients": [{"name_text": "Salt", "quantity_text": "1"}], "steps": []}
+    recipe_id = (await client.post("/recipes", json=payload, headers=auth_headers)).json()["id"]
+    await suggest_index.refresh()
+
+    response = await client.get("/recipes/suggest?q=lem")
+    assert response.status_code == 200
+    assert {"text": "Zesty Lemon Tart", "kind": "recipe", "id": recipe_id} in response.json()
+
+    # Seeded ingredients and categories are indexed too
+    kinds = {(s["kind"], s["text"]) for s in (await client.get("/recipes/suggest?q=b&limit=25")).json()}
+    assert ("ingredient", "butter") in kinds
+    assert ("category", "Breakfast") in kinds
+
+@pytest.mark.asyncio
+async def test_refresh_picks_up_late_commits(client, db, auth_headers):
+    base = {"ingredients": [{"name_text": "Salt", "quantity_text": "1"}], "steps": []}
+    await client.post("/recipes", json={**base, "name": "Early Quince Jam"}, headers=auth_headers)
+    await suggest_index.refresh()
+    watermark = suggest_index._watermarks["recipe"]
+
+    # Stamped before the watermark but committed after it was taken
+    late_id = (await client.post("/recipes", json={**base, "name": "Late Quince Paste"}, headers=auth_headers)).json()["id"]
+    await db.execute(update(Recipe).where(Recipe.id == late_id).values(updated_at=watermark - timedelta(seconds=1)))
+    await db.commit()
+    await suggest_index.refresh()
+
+    assert late_id in [s["id"] for s in suggest_index.suggest("late quince")]
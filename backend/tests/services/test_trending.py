@@ -0,0 +1,91 @@
+import pytest
+from sqlalchemy import select, update, func
+from app.models.recipe_like import RecipeLike
+from app.models.recipe_trending import RecipeTrending
+from app.services.trending import refresh_trending_scores
+
+async def _score(db, recipe_id):
+    result = await db.execute(
+        select(RecipeTrending.score)
+        .where(RecipeTrending.recipe_id == recipe_id)
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar()
+
+@pytest.mark.asyncio
+async def test_trending_refresh_scores_and_sorts(client, db, auth_headers, other_auth_headers):
+    payload = {"name": "Trending Recipe", "ingredients": [{"name_text": "Salt", "quantity_text": "1"}], "steps": []}
+    hot_id = (await client.post("/recipes", json=payload, headers=auth_headers)).json()["id"]
+    payload["name"] = "Quiet Recipe"
+    quiet_id = (await client.post("/recipes", json=payload, headers=auth_headers)).json()["id"]
+
+    await client.post(f"/recipes/{hot_id}/like", headers=auth_headers)
+    await client.post(f"/recipes/{hot_id}/like", headers=other_auth_headers)
+    await client.post(f"/recipes/{hot_id}/save", headers=auth_headers)
+
+    await refresh_trending_scores(db, full=True)
+    await db.commit()
+
+    assert await _score(db, hot_id) > 0
+    assert await _score(db, quiet_id) is None
+
+    response = await client.get("/recipes?sort_by=trending&per_page=100")
+    assert response.status_code == 200
+    ids = [r["id"] for r in response.json()["recipes"]]
+    assert hot_id in ids
+    assert quiet_id not in ids
+
+@pytest.mark.asyncio
+async def test_trending_incremental_refresh_decays(client, db, auth_headers):
+    payload = {"name": "Decaying Recipe", "ingredients": [{"name_text": "Salt", "quantity_text": "1"}], "steps": []}
+    recipe_id = (await client.post("/recipes", json=payload, headers=auth_headers)).json()["id"]
+    await client.post(f"/recipes/{recipe_id}/like", headers=auth_headers)
+
+    await refresh_trending_scores(db, full=True)
+    await db.commit()
+    before = await _score(db, recipe_id)
+
+    # Pretend the last refresh happened one half-life ago, well after the like
+    # (so it had already settled)
+    await db.execute(
+        update(RecipeLike).where(RecipeLike.recipe_id == recipe_id)
+        .values(created_at=func.now() - func.make_interval(0, 0, 0, 2))
+    )
+    await db.execute(
+        update(RecipeTrending).values(
+            scored_at=func.now() - func.make_interval(0, 0, 0, 1),
+            settled_score=RecipeTrending.score,
+        )
+    )
+    await db.commit()
+
+    await refresh_trending_scores(db)
+    await db.commit()
+    assert await _score(db, recipe_id) == pytest.approx(before / 2, rel=0.01)
+
+@pytest.mark.asyncio
+async def test_trending_counts_events_committed_behind_the_watermark(client, db, auth_headers):
+    payload = {"name": "Late Like Recipe", "ingredients": [{"name_text": "Salt", "quantity_text": "1"}], "steps": []}
+    recipe_id = (await client.post("/recipes", json=payload, headers=auth_headers)).json()["id"]
+    await refresh_trending_scores(db, full=True)
+    await db.commit()
+    assert await _score(db, recipe_id) is None
+
+    # A like stamped before the last refresh but committed after it
+    await client.post(f"/recipes/{recipe_id}/like", headers=auth_headers)
+    await db.execute(
+        update(RecipeLike).where(RecipeLike.recipe_id == recipe_id)
+        .values(created_at=func.now() - func.make_interval(0, 0, 0, 0, 0, 2))
+    )
+    await db.execute(update(RecipeTrending).values(scored_at=func.now() - func.make_interval(0, 0, 0, 0, 0, 1)))
+    await db.commit()
+
+    await refresh_trending_scores(db)
+    await db.commit()
+    score = await _score(db, recipe_id)
+    assert score > 0
+
+    # Re-scoring the overlap does not count the like twice
+    await refresh_trending_scores(db)
+    await db.commit()
+    assert await _score(db, recipe_id) == pytest.approx(score, rel=0.01)
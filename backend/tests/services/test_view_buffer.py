@@ -0,0 +1,85 @@
+import pytest
+from sqlalchemy import select, func
+from app.models.recipe_view import UserRecipeView
+from app.services.recipe_stats import get_stats_map
+from app.services import view_buffer as view_buffer_module
+from app.services.view_buffer import ViewBuffer, view_buffer
+
+async def _create_recipe(client, auth_headers, name):
+    payload = {"name": name, "ingredients": [{"name_text": "Salt", "quantity_text": "1"}], "steps": []}
+    recipe_id = (await client.post("/recipes", json=payload, headers=auth_headers)).json()["id"]
+    # Creating returns the detail view, which records a view of its own
+    await view_buffer.flush()
+    return recipe_id
+
+@pytest.mark.asyncio
+async def test_recipe_get_defers_view_writes(client, db, auth_headers):
+    recipe_id = await _create_recipe(client, auth_headers, "Buffered Views")
+    count_stmt = select(func.count()).where(UserRecipeView.recipe_id == recipe_id)
+    before = (await db.execute(count_stmt)).scalar()
+
+    for _ in range(3):
+        resp = await client.get(f"/recipes/{recipe_id}")
+    # Pending views are reported even before they hit the database
+    assert resp.json()["views_count"] == before + 3
+    assert (await db.execute(count_stmt)).scalar() == before
+
+    assert await view_buffer.flush() == 3
+    assert (await db.execute(count_stmt)).scalar() == before + 3
+    assert (await get_stats_map(db, [recipe_id]))[recipe_id].views_count == before + 3
+
+@pytest.mark.asyncio
+async def test_view_buffer_flushes_on_size_and_stop(client, db, auth_headers):
+    recipe_id = await _create_recipe(client, auth_headers, "Size Flush")
+    count_stmt = select(func.count()).where(UserRecipeView.recipe_id == recipe_id)
+    before = (await db.execute(count_stmt)).scalar()
+
+    buffer = ViewBuffer(max_size=2, flush_seconds=60)
+    buffer.start()
+    for _ in range(5):
+        buffer.record(recipe_id, None)
+    await buffer.stop()
+
+    assert (await db.execute(count_stmt)).scalar() == before + 5
+    assert buffer.pending_views(recipe_id) == 0
+
+@pytest.mark.asyncio
+async def test_view_buffer_skips_deleted_recipes(client, db, auth_headers):
+    kept_id = await _create_recipe(client, auth_headers, "Survives Flush")
+    deleted_id = await _create_recipe(client, auth_headers, "Deleted Before Flush")
+    count_stmt = select(func.count()).where(UserRecipeView.recipe_id == kept_id)
+    before = (await db.execute(count_stmt)).scalar()
+
+    # Views recorded elsewhere (another worker's buffer) are not purged by the delete
+    buffer = ViewBuffer(max_size=100, flush_seconds=60)
+    buffer.record(kept_id, 1)
+    buffer.record(deleted_id, 1)
+    buffer.record(kept_id, None)
+    assert (await client.delete(f"/recipes/{deleted_id}", headers=auth_headers)).status_code == 204
+
+    assert await buffer.flush() == 2
+    assert buffer.pending_views(kept_id) == 0
+    assert (await db.execute(count_stmt)).scalar() == before + 2
+
+@pytest.mark.asyncio
+async def test_delete_recipe_discards_pending_views(client, auth_headers):
+    recipe_id = await _create_recipe(client, auth_headers, "Viewed Then Deleted")
+    await client.get(f"/recipes/{recipe_id}")
+    assert view_buffer.pending_views(recipe_id) == 1
+
+    await client.delete(f"/recipes/{recipe_id}", headers=auth_headers)
+    assert view_buffer.pending_views(recipe_id) == 0
+    assert all(v["recipe_id"] != recipe_id for v in view_buffer._pending)
+
+@pytest.mark.asyncio
+async def test_view_buffer_requeues_on_connection_errors(monkeypatch):
+    def refuse():
+        raise ConnectionRefusedError("database is down")
+
+    monkeypatch.setattr(view_buffer_module, "async_session", refuse)
+    buffer = ViewBuffer(max_size=100, flush_seconds=60)
+    buffer.record(1, None)
+    buffer.record(1, 1)
+
+    assert await buffer.flush() == 0
+    assert buffer.pending_views(1) == 2